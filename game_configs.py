@@ -3,7 +3,8 @@ Game Memory Configuration for PokeAchieve Tracker
 Centralized memory addresses and derived achievement logic per generation
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -160,6 +161,55 @@ def get_platform(game_name: str) -> str:
     return config.platform if config else "gb"
 
 
+# === POKEDEX BITSET ===
+# Caught flags are kept as one integer (bit N-1 = Pokemon #N) so count, membership
+# and "caught all of these" checks are a popcount or a mask AND instead of list scans.
+
+@lru_cache(maxsize=256)
+def pokedex_mask(pokemon_ids: Tuple[int, ...]) -> int:
+    """Bit mask with one bit set per Pokemon ID (IDs < 1 are ignored)."""
+    mask = 0
+    for pokemon_id in pokemon_ids:
+        if int(pokemon_id) >= 1:
+            mask |= 1 << (int(pokemon_id) - 1)
+    return mask
+
+
+class PokedexBitset:
+    """Immutable caught/seen bitfield with O(1) count, membership and subset queries"""
+
+    __slots__ = ("bits", "max_pokemon")
+
+    def __init__(self, bits: int = 0, max_pokemon: int = 151):
+        self.max_pokemon = int(max_pokemon)
+        self.bits = int(bits) & ((1 << self.max_pokemon) - 1)
+
+    @classmethod
+    def from_bytes(cls, data: Iterable[int], max_pokemon: int) -> "PokedexBitset":
+        """Build from the raw flag bytes (byte 0 bit 0 = Pokemon #1)."""
+        return cls(int.from_bytes(bytes(int(b) & 0xFF for b in data), "little"), max_pokemon)
+
+    def count(self) -> int:
+        return bin(self.bits).count("1")
+
+    def has(self, pokemon_id: int) -> bool:
+        return 1 <= int(pokemon_id) <= self.max_pokemon and bool((self.bits >> (int(pokemon_id) - 1)) & 1)
+
+    def has_all(self, pokemon_ids: Iterable[int]) -> bool:
+        mask = pokedex_mask(tuple(pokemon_ids))
+        return (self.bits & mask) == mask
+
+    def ids(self) -> List[int]:
+        """Caught IDs in ascending order."""
+        caught = []
+        bits = self.bits
+        while bits:
+            low_bit = bits & -bits
+            caught.append(low_bit.bit_length())
+            bits ^= low_bit
+        return caught
+
+
 # === DERIVED ACHIEVEMENT CHECKERS ===
 # These replace the hardcoded methods in tracker_gui.py
 
@@ -172,37 +222,59 @@ class DerivedAchievementChecker:
         self.config = get_game_config(game_name)
         if not self.config:
             raise ValueError(f"No configuration for game: {game_name}")
+        # Between begin_poll() and end_poll() the caught bitfield is read once and shared.
+        self._poll_active = False
+        self._poll_pokedex: Optional[PokedexBitset] = None
 
     def read_memory(self, addr: str) -> Optional[int]:
         """Read a single byte from memory"""
         return self.retroarch.read_memory(addr)
 
-    def read_pokedex_caught(self) -> List[int]:
-        """Read all caught Pokemon IDs from Pokedex"""
-        if not self.config:
-            return []
+    def begin_poll(self):
+        """Share one Pokedex read across every check until end_poll()"""
+        self._poll_active = True
+        self._poll_pokedex = None
 
-        caught = []
-        addr = int(self.config.pokedex_caught_start, 16)
-        num_bytes = (self.config.max_pokemon + 7) // 8
+    def end_poll(self):
+        self._poll_active = False
+        self._poll_pokedex = None
 
+    def _read_pokedex_bytes(self, start: str, num_bytes: int) -> List[int]:
+        """Read the flag region in one request, falling back to single bytes (unreadable bytes count as 0)"""
+        addr = int(start, 16)
+        data = self.retroarch.read_memory(hex(addr), num_bytes)
+        if isinstance(data, (list, tuple, bytes, bytearray)) and len(data) == num_bytes:
+            return [int(b) & 0xFF for b in data]
+
+        values = []
         for byte_idx in range(num_bytes):
             byte_val = self.read_memory(hex(addr + byte_idx))
-            if byte_val is None:
-                continue
+            values.append(int(byte_val) & 0xFF if byte_val is not None else 0)
+        return values
 
-            for bit_idx in range(8):
-                pokemon_id = byte_idx * 8 + bit_idx + 1
-                if pokemon_id > self.config.max_pokemon:
-                    break
-                if (byte_val >> bit_idx) & 1:
-                    caught.append(pokemon_id)
+    def read_pokedex_bitset(self) -> PokedexBitset:
+        """Caught flags as a bitset, read once per poll while a poll is active"""
+        if not self.config:
+            return PokedexBitset(0, 1)
+        if self._poll_active and self._poll_pokedex is not None:
+            return self._poll_pokedex
 
-        return caught
+        max_pokemon = self.config.max_pokemon
+        data = self._read_pokedex_bytes(self.config.pokedex_caught_start, (max_pokemon + 7) // 8)
+        bitset = PokedexBitset.from_bytes(data, max_pokemon)
+        if self._poll_active:
+            self._poll_pokedex = bitset
+        return bitset
+
+    def read_pokedex_caught(self) -> List[int]:
+        """Read all caught Pokemon IDs from Pokedex"""
+        if not self.config:
+            return []
+        return self.read_pokedex_bitset().ids()
 
     def get_caught_count(self) -> int:
         """Get total number of caught Pokemon"""
-        return len(self.read_pokedex_caught())
+        return self.read_pokedex_bitset().count()
 
     def check_all_badges(self) -> bool:
         """Check if all gym badges are obtained"""
@@ -264,8 +336,6 @@ class DerivedAchievementChecker:
 
     def check_legendary_caught(self, legendary_name: str) -> bool:
         """Check if specific legendary is caught via Pokedex"""
-        caught = self.read_pokedex_caught()
-
         # Legendary Pokemon IDs by name
         legendary_ids = {
             "articuno": 144,
@@ -293,20 +363,17 @@ class DerivedAchievementChecker:
 
         pokemon_id = legendary_ids.get(legendary_name.lower())
         if pokemon_id:
-            return pokemon_id in caught
+            return self.read_pokedex_bitset().has(pokemon_id)
 
         return False
 
     def check_all_legendary_birds(self) -> bool:
         """Check if all 3 legendary birds are caught"""
-        caught = self.read_pokedex_caught()
-        birds = [144, 145, 146]  # Articuno, Zapdos, Moltres
-        return all(bird in caught for bird in birds)
+        birds = (144, 145, 146)  # Articuno, Zapdos, Moltres
+        return self.read_pokedex_bitset().has_all(birds)
 
     def check_all_legendaries(self) -> bool:
         """Check if all legendaries for this generation are caught"""
-        caught = self.read_pokedex_caught()
-
         if self.config.generation == 1:
             legendaries = [144, 145, 146, 150]  # Birds + Mewtwo
         elif self.config.generation == 2:
@@ -316,7 +383,7 @@ class DerivedAchievementChecker:
         else:
             return False
 
-        return all(leg in caught for leg in legendaries)
+        return self.read_pokedex_bitset().has_all(tuple(legendaries))
 
     def check_first_steps(self) -> bool:
         """Check if player has started (has a starter Pokemon in party)"""
@@ -0,0 +1,90 @@
+"""Micro-benchmark poll-time memory layout lookups.
+
+Compares the uncached config resolution (regex name cleanup, dict build and
+legacy overlay, then int(addr, 16) per address) against the cached
+`get_game_config` dict and the precompiled `GameMemoryLayout`, using the
+address set one achievement poll touches.
+
+Usage:
+  python scripts/bench_layout_lookup.py
+  python scripts/bench_layout_lookup.py --game "Pokemon Red" --iterations 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import tracker_gui as tracker_mod  # noqa: E402
+
+POLL_ADDRESS_KEYS = ("pokedex_caught", "pokedex_seen", "party_count", "party_start", "badge_address", "saveblock1_ptr", "saveblock2_ptr")
+
+
+def _time_per_call_us(call: Callable[[], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - started) * 1e6 / max(1, iterations)
+
+
+def bench(game: str, iterations: int) -> Dict[str, object]:
+    reader = tracker_mod.PokemonMemoryReader(retroarch=None)
+    if reader.get_game_layout(game) is None:
+        raise SystemExit(f"no memory layout for {game!r}")
+
+    def uncached() -> int:
+        config = reader._resolve_game_config(game)
+        total = int(config.get("max_pokemon") or 0) + int(config.get("party_slot_size") or 0)
+        for key in POLL_ADDRESS_KEYS:
+            if config.get(key):
+                total += int(str(config[key]), 16)
+        return total
+
+    def cached_dict() -> int:
+        config = reader.get_game_config(game)
+        total = int(config.get("max_pokemon") or 0) + int(config.get("party_slot_size") or 0)
+        for key in POLL_ADDRESS_KEYS:
+            if config.get(key):
+                total += int(str(config[key]), 16)
+        return total
+
+    def layout() -> int:
+        compiled = reader.get_game_layout(game)
+        total = compiled.max_pokemon + compiled.party_slot_size
+        for key in POLL_ADDRESS_KEYS:
+            address = getattr(compiled, key)
+            if address is not None:
+                total += address
+        return total
+
+    if not (uncached() == cached_dict() == layout()):
+        raise SystemExit("layout lookups disagree")
+
+    timings = {name: round(_time_per_call_us(call, iterations), 3) for name, call in (("uncached_config", uncached), ("cached_config", cached_dict), ("layout", layout))}
+    return {
+        "game": game,
+        "iterations": iterations,
+        "us_per_lookup": timings,
+        "layout_speedup_vs_uncached": round(timings["uncached_config"] / max(1e-9, timings["layout"]), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-poll game layout lookups.")
+    parser.add_argument("--game", type=str, default="Pokemon Emerald")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    print(json.dumps(bench(args.game, max(1, int(args.iterations))), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
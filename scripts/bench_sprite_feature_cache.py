@@ -0,0 +1,124 @@
+"""Measure sprite reference warm-up with and without the on-disk feature cache.
+
+Writes a seeded synthetic sprite library (one normal + one shiny PNG per species)
+into a temporary directory, then warms a fresh OBSVideoEncounterReader three times:
+with the cache disabled, cold (building the cache file) and from the cache file.
+The warmed signatures, colour profiles and templates must be identical in all
+three runs. Finally one sprite is rewritten to show only that file is re-read.
+
+Usage:
+  python scripts/bench_sprite_feature_cache.py
+  python scripts/bench_sprite_feature_cache.py --species 151
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import tracker_gui as tracker_mod  # noqa: E402
+
+GAME_NAME = "Pokemon Emerald"
+
+
+def _draw_sprite(rng: random.Random, path: Path) -> None:
+    from PIL import ImageDraw  # noqa: WPS433 - PIL is a hard requirement for this benchmark
+
+    sprite = tracker_mod.Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    for _ in range(rng.randint(2, 5)):
+        x1, y1 = rng.randint(4, 36), rng.randint(4, 36)
+        box = (x1, y1, x1 + rng.randint(10, 24), y1 + rng.randint(10, 24))
+        fill = tuple(rng.randint(0, 255) for _ in range(3)) + (255,)
+        if rng.random() < 0.5:
+            draw.ellipse(box, fill=fill, outline=(16, 16, 16, 255))
+        else:
+            draw.rectangle(box, fill=fill, outline=(16, 16, 16, 255))
+    sprite.save(path)
+
+
+def build_library(root: Path, species: int, seed: int = 17) -> Path:
+    rng = random.Random(seed)
+    game_dir = root / "emerald"
+    game_dir.mkdir(parents=True, exist_ok=True)
+    for pid in range(1, int(species) + 1):
+        _draw_sprite(rng, game_dir / f"generation_iii_emerald_{pid}.png")
+        _draw_sprite(rng, game_dir / f"generation_iii_emerald_{pid}_shiny.png")
+    return game_dir
+
+
+def _warm(root: Path, species_ids: List[int], cache_enabled: bool) -> Tuple[float, object, object]:
+    reader = tracker_mod.OBSVideoEncounterReader(config={
+        "video_sprite_library_dir": str(root),
+        "video_sprite_prewarm_limit": 256,
+        "video_sprite_feature_cache_enabled": cache_enabled,
+    })
+    started = time.perf_counter()
+    reader.warm_sprite_reference_cache(GAME_NAME, species_ids)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    features = [
+        (
+            reader._sprite_reference_signatures_for_species(GAME_NAME, pid),
+            reader._sprite_reference_color_profiles_for_species(GAME_NAME, pid),
+            reader._sprite_reference_templates_for_species(GAME_NAME, pid),
+        )
+        for pid in species_ids
+    ]
+    return elapsed_ms, features, reader
+
+
+def bench(species: int) -> Dict[str, object]:
+    if not getattr(tracker_mod, "PIL_AVAILABLE", False):
+        raise SystemExit("Pillow is required for this benchmark")
+    species_ids = list(range(1, int(species) + 1))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        game_dir = build_library(root, species)
+
+        uncached_ms, expected, _ = _warm(root, species_ids, False)
+        cold_ms, cold, _ = _warm(root, species_ids, True)
+        warm_ms, warm, reader = _warm(root, species_ids, True)
+        cache_files = sorted((root / tracker_mod.SPRITE_FEATURE_CACHE_DIRNAME).glob("*.pkfc"))
+
+        changed = game_dir / "generation_iii_emerald_1.png"
+        _draw_sprite(random.Random(99), changed)
+        stat = changed.stat()
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        cache = tracker_mod.SpriteFeatureCache(cache_files[0], tracker_mod.SpriteFeatureCache.config_fingerprint(reader.config))
+        stale = [path.name for path in sorted(game_dir.glob("*.png")) if cache.get(path) is None]
+        cache.close()
+
+        return {
+            "species": len(species_ids),
+            "sprites": 2 * len(species_ids),
+            "identical_features": expected == cold == warm,
+            "cache_bytes": sum(path.stat().st_size for path in cache_files),
+            "warm_ms_uncached": round(uncached_ms, 1),
+            "warm_ms_building_cache": round(cold_ms, 1),
+            "warm_ms_from_cache": round(warm_ms, 1),
+            "speedup": round(uncached_ms / max(1e-9, warm_ms), 1),
+            "stale_after_edit": stale,
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the sprite reference feature cache.")
+    parser.add_argument("--species", type=int, default=96)
+    args = parser.parse_args()
+    print(json.dumps(bench(max(1, int(args.species))), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
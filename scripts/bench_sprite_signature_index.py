@@ -0,0 +1,112 @@
+"""Benchmark the packed sprite signature index against per-species string Hamming.
+
+Seeds the reader's reference signature cache with random 256-bit signatures for a
+full-dex candidate pool (386 species, several scales, normal + shiny sheets), then
+times the old loop (hex -> bit string per comparison) against one indexed query
+and checks both report the same best distance for every species.
+
+Usage:
+  python scripts/bench_sprite_signature_index.py
+  python scripts/bench_sprite_signature_index.py --species 386 --per-species 12 --queries 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import tracker_gui as tracker_mod  # noqa: E402
+
+GAME_NAME = "Pokemon Emerald"
+
+
+def _string_hamming(sig_a: str, sig_b: str) -> int:
+    """The per-comparison bit-string Hamming distance the index replaces."""
+    bits_a = bin(int(sig_a, 16))[2:].zfill(len(sig_a) * 4)
+    bits_b = bin(int(sig_b, 16))[2:].zfill(len(sig_b) * 4)
+    return int(sum(1 for a, b in zip(bits_a, bits_b) if a != b))
+
+
+def _near(rng: random.Random, signature: str, flips: int) -> str:
+    value = int(signature, 16)
+    for bit in rng.sample(range(256), flips):
+        value ^= 1 << bit
+    return format(value, "064x")
+
+
+def seed_reader(species: int, per_species: int, seed: int = 11):
+    rng = random.Random(seed)
+    reader = tracker_mod.OBSVideoEncounterReader(config={})
+    variant_key = reader._sprite_reference_variant_key(GAME_NAME)
+    references: Dict[int, List[str]] = {}
+    for pid in range(1, int(species) + 1):
+        base = format(rng.getrandbits(256), "064x")
+        references[pid] = [_near(rng, base, rng.randint(0, 12)) for _ in range(int(per_species))]
+        reader._sprite_reference_signature_cache[(variant_key, pid)] = list(references[pid])
+    return reader, references
+
+
+def bench(species: int, per_species: int, query_count: int, iterations: int) -> Dict[str, object]:
+    reader, references = seed_reader(species, per_species)
+    rng = random.Random(5)
+    target = rng.randint(1, species)
+    queries = [_near(rng, references[target][0], rng.randint(2, 20)) for _ in range(query_count)]
+    candidate_ids = list(range(1, species + 1))
+
+    def scalar() -> Dict[int, int]:
+        result: Dict[int, int] = {}
+        for pid in candidate_ids:
+            result[pid] = min(_string_hamming(q, r) for q in queries for r in references[pid])
+        return result
+
+    expected = scalar()
+    started = time.perf_counter()
+    indexed, top2 = reader._sprite_reference_hamming_query(GAME_NAME, candidate_ids, queries)
+    build_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    scalar()
+    scalar_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        reader._sprite_reference_hamming_query(GAME_NAME, candidate_ids, queries)
+    indexed_ms = (time.perf_counter() - started) * 1000.0 / max(1, iterations)
+
+    return {
+        "numpy": tracker_mod.np is not None,
+        "species": species,
+        "reference_rows": species * per_species,
+        "queries": query_count,
+        "mismatched_species": sum(1 for pid in candidate_ids if expected[pid] != indexed.get(pid)),
+        "top2": list(top2),
+        "target_species": target,
+        "index_build_ms": round(build_ms, 2),
+        "string_hamming_ms": round(scalar_ms, 2),
+        "indexed_query_ms": round(indexed_ms, 3),
+        "speedup": round(scalar_ms / max(1e-9, indexed_ms), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the packed sprite signature index.")
+    parser.add_argument("--species", type=int, default=386)
+    parser.add_argument("--per-species", type=int, default=12)
+    parser.add_argument("--queries", type=int, default=6)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(bench(max(2, int(args.species)), max(1, int(args.per_species)), max(1, int(args.queries)), max(1, int(args.iterations))), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Compare matrix-form structural template scoring with the per-template loop.
+
+Builds structural templates from seeded synthetic sprites (two per species), seeds
+them into the reader's template cache, then scores query sprites against the full
+candidate pool both with SpriteTemplateIndex and with _sprite_template_similarity
+over every reference template. Scores must match exactly.
+
+Usage:
+  python scripts/bench_structural_templates.py
+  python scripts/bench_structural_templates.py --species 386 --queries 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import tracker_gui as tracker_mod  # noqa: E402
+
+GAME_NAME = "Pokemon Emerald"
+
+
+def synthetic_sprite(rng: random.Random):
+    from PIL import ImageDraw  # noqa: WPS433 - PIL is a hard requirement for this benchmark
+
+    sprite = tracker_mod.Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    for _ in range(rng.randint(2, 5)):
+        x1, y1 = rng.randint(4, 36), rng.randint(4, 36)
+        box = (x1, y1, x1 + rng.randint(10, 24), y1 + rng.randint(10, 24))
+        fill = tuple(rng.randint(0, 255) for _ in range(3)) + (255,)
+        if rng.random() < 0.5:
+            draw.ellipse(box, fill=fill, outline=(16, 16, 16, 255))
+        else:
+            draw.rectangle(box, fill=fill, outline=(16, 16, 16, 255))
+    return sprite
+
+
+def bench(species: int, query_count: int, iterations: int) -> Dict[str, object]:
+    if not getattr(tracker_mod, "PIL_AVAILABLE", False):
+        raise SystemExit("Pillow is required for this benchmark")
+    if tracker_mod.np is None:
+        raise SystemExit("numpy is required for the matrix template scorer")
+
+    rng = random.Random(23)
+    reader = tracker_mod.OBSVideoEncounterReader(config={})
+    variant_key = reader._sprite_reference_variant_key(GAME_NAME)
+    candidate_ids = list(range(1, int(species) + 1))
+    references: Dict[int, List[Dict[str, object]]] = {}
+    for pid in candidate_ids:
+        templates = [reader._sprite_template_from_image(synthetic_sprite(rng)) for _ in range(2)]
+        references[pid] = [tpl for tpl in templates if isinstance(tpl, dict)]
+        reader._sprite_reference_template_cache[(variant_key, pid)] = list(references[pid])
+    queries = [reader._sprite_template_from_image(synthetic_sprite(rng)) for _ in range(int(query_count))]
+    queries = [tpl for tpl in queries if isinstance(tpl, dict)]
+
+    def loop_scores(query_tpl) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        for pid in candidate_ids:
+            if references[pid]:
+                scores[pid] = max(float(reader._sprite_template_similarity(query_tpl, ref)) for ref in references[pid])
+        return scores
+
+    started = time.perf_counter()
+    expected = [loop_scores(query_tpl) for query_tpl in queries]
+    loop_ms = (time.perf_counter() - started) * 1000.0 / max(1, len(queries))
+
+    started = time.perf_counter()
+    actual = [reader._sprite_reference_template_scores(GAME_NAME, candidate_ids, query_tpl) for query_tpl in queries]
+    first_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for query_tpl in queries:
+            reader._sprite_reference_template_scores(GAME_NAME, candidate_ids, query_tpl)
+    matrix_ms = (time.perf_counter() - started) * 1000.0 / max(1, iterations * len(queries))
+
+    return {
+        "species": len(candidate_ids),
+        "reference_templates": sum(len(refs) for refs in references.values()),
+        "queries": len(queries),
+        "identical_scores": expected == actual,
+        "index_build_ms": round(first_ms, 1),
+        "loop_ms_per_query": round(loop_ms, 1),
+        "matrix_ms_per_query": round(matrix_ms, 2),
+        "speedup": round(loop_ms / max(1e-9, matrix_ms), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark structural template scoring.")
+    parser.add_argument("--species", type=int, default=151)
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    print(json.dumps(bench(max(2, int(args.species)), max(1, int(args.queries)), max(1, int(args.iterations))), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+"""Compare the NumPy and pure-Python pixel engines of OBSVideoEncounterReader.
+
+Renders seeded synthetic battle frames (noisy background, blob "sprite",
+textbox stripe, sparkles), runs the per-frame pixel stages with
+video_numpy_pixel_engine on and off, asserts identical results and reports the
+per-frame time of each stage.
+
+Usage:
+  python scripts/bench_video_pixel_engine.py
+  python scripts/bench_video_pixel_engine.py --frames 40 --width 480 --height 320
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import tracker_gui as tracker_mod  # noqa: E402
+
+
+def synthetic_frames(count: int, width: int, height: int, seed: int = 7) -> List[object]:
+    Image = tracker_mod.Image
+    from PIL import ImageDraw  # noqa: WPS433 - PIL is a hard requirement for this benchmark
+
+    rng = random.Random(seed)
+    frames = []
+    for _ in range(int(count)):
+        base = tuple(rng.randint(60, 200) for _ in range(3))
+        frame = Image.new("RGB", (width, height), base)
+        draw = ImageDraw.Draw(frame)
+        for _ in range(width * height // 40):
+            x, y = rng.randrange(width), rng.randrange(height)
+            draw.point((x, y), fill=tuple(max(0, min(255, c + rng.randint(-25, 25))) for c in base))
+        cx, cy = int(width * rng.uniform(0.62, 0.82)), int(height * rng.uniform(0.25, 0.45))
+        radius = int(min(width, height) * rng.uniform(0.06, 0.16))
+        draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=tuple(rng.randint(0, 255) for _ in range(3)))
+        draw.rectangle((int(width * 0.05), int(height * 0.72), int(width * 0.95), int(height * 0.95)), fill=(248, 248, 248), outline=(40, 40, 40), width=3)
+        for _ in range(rng.randint(0, 12)):
+            x, y = int(width * rng.uniform(0.6, 0.9)), int(height * rng.uniform(0.18, 0.5))
+            draw.point((x, y), fill=(255, 255, 230))
+        frames.append(frame)
+    return frames
+
+
+def _run_stages(reader, frame) -> Dict[str, object]:
+    sprite, area, coverage = reader._extract_sprite_foreground_rgba(frame)
+    return {
+        "sprite_metrics": reader._sprite_metrics(frame)[:4],
+        "foreground": (sprite.tobytes() if sprite is not None else None, area, coverage),
+        "roi_presence": reader._roi_presence_metrics(frame, "", "0.05,0.70,0.95,0.96"),
+        "frame_bounds": reader._auto_detect_game_frame_bounds(frame),
+        "shiny_score": reader._shiny_score_for_frame(frame),
+    }
+
+
+def bench(frame_count: int, width: int, height: int) -> Dict[str, object]:
+    if not getattr(tracker_mod, "PIL_AVAILABLE", False):
+        raise SystemExit("Pillow is required for this benchmark")
+    if tracker_mod.np is None:
+        raise SystemExit("numpy is required to compare pixel engines")
+
+    frames = synthetic_frames(frame_count, width, height)
+    engines = {
+        "numpy": tracker_mod.OBSVideoEncounterReader(config={"video_numpy_pixel_engine": True}),
+        "python": tracker_mod.OBSVideoEncounterReader(config={"video_numpy_pixel_engine": False}),
+    }
+    stages = {
+        "extract_sprite_foreground": lambda reader, frame: reader._extract_sprite_foreground_rgba(frame),
+        "sprite_metrics": lambda reader, frame: reader._sprite_metrics(frame),
+        "roi_presence_metrics": lambda reader, frame: reader._roi_presence_metrics(frame, "", "0.05,0.70,0.95,0.96"),
+        "auto_detect_frame_bounds": lambda reader, frame: reader._auto_detect_game_frame_bounds(frame),
+        "shiny_score": lambda reader, frame: reader._shiny_score_for_frame(frame),
+    }
+
+    mismatches = sum(1 for frame in frames if _run_stages(engines["numpy"], frame) != _run_stages(engines["python"], frame))
+    timings: Dict[str, Dict[str, float]] = {}
+    for stage, call in stages.items():
+        timings[stage] = {}
+        for name, reader in engines.items():
+            started = time.perf_counter()
+            for frame in frames:
+                call(reader, frame)
+            timings[stage][name] = round((time.perf_counter() - started) * 1000.0 / max(1, len(frames)), 3)
+    totals = {name: round(sum(stage[name] for stage in timings.values()), 3) for name in engines}
+    return {
+        "frames": len(frames),
+        "size": [width, height],
+        "mismatched_frames": mismatches,
+        "ms_per_frame": timings,
+        "total_ms_per_frame": totals,
+        "speedup": round(totals["python"] / max(1e-9, totals["numpy"]), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the OBS video reader pixel engines.")
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=480)
+    parser.add_argument("--height", type=int, default=320)
+    args = parser.parse_args()
+    print(json.dumps(bench(max(1, int(args.frames)), max(64, int(args.width)), max(64, int(args.height))), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Compare UI-tick cost of synchronous video reads with the background video worker.
+
+Simulates the hunt poll loop: every tick "captures" a numbered frame and either
+analyses it inline (the old Tk-thread path) or hands it to VideoEncounterWorker and
+picks up at most one finished read. The simulated analysis burns CPU for
+--frame-ms. Reports how long each tick blocks the UI, how many frames were analysed
+or dropped as stale, and how old a frame is when its result reaches the UI.
+
+Usage:
+  python scripts/bench_video_worker.py
+  python scripts/bench_video_worker.py --frame-ms 60 --tick-ms 20 --seconds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import tracker_gui as tracker_mod  # noqa: E402
+
+
+def _analyse(request: Dict[str, object], frame_ms: float) -> Dict[str, object]:
+    deadline = time.perf_counter() + float(frame_ms) / 1000.0
+    while time.perf_counter() < deadline:
+        sum(range(256))
+    return {"encounter": {"frame": request["frame"]}}
+
+
+def _summary(tick_ms: List[float], staleness_ms: List[float]) -> Dict[str, float]:
+    tick_ms = sorted(tick_ms)
+    return {
+        "ticks": len(tick_ms),
+        "tick_ms_p50": round(tick_ms[len(tick_ms) // 2], 2) if tick_ms else 0.0,
+        "tick_ms_max": round(tick_ms[-1], 2) if tick_ms else 0.0,
+        "frames_analysed": len(staleness_ms),
+        "result_age_ms_max": round(max(staleness_ms), 1) if staleness_ms else 0.0,
+    }
+
+
+def run_sync(frame_ms: float, tick_ms: float, seconds: float) -> Dict[str, float]:
+    ticks: List[float] = []
+    ages: List[float] = []
+    end = time.perf_counter() + seconds
+    frame = 0
+    while time.perf_counter() < end:
+        frame += 1
+        captured_at = time.perf_counter()
+        _analyse({"frame": frame}, frame_ms)
+        finished = time.perf_counter()
+        ticks.append((finished - captured_at) * 1000.0)
+        ages.append((finished - captured_at) * 1000.0)
+        time.sleep(max(0.0, tick_ms / 1000.0 - (finished - captured_at)))
+    return _summary(ticks, ages)
+
+
+def run_worker(frame_ms: float, tick_ms: float, seconds: float) -> Dict[str, float]:
+    worker = tracker_mod.VideoEncounterWorker(lambda request: _analyse(request, frame_ms))
+    worker.start()
+    ticks: List[float] = []
+    ages: List[float] = []
+    captured: Dict[int, float] = {}
+    end = time.perf_counter() + seconds
+    frame = 0
+    try:
+        while time.perf_counter() < end:
+            frame += 1
+            started = time.perf_counter()
+            captured[frame] = started
+            worker.submit({"frame": frame})
+            result = worker.get_result()
+            finished = time.perf_counter()
+            ticks.append((finished - started) * 1000.0)
+            if result is not None:
+                ages.append((finished - captured[int(result["frame"])]) * 1000.0)
+            time.sleep(max(0.0, tick_ms / 1000.0 - (finished - started)))
+    finally:
+        worker.stop()
+    summary = _summary(ticks, ages)
+    summary["frames_dropped_stale"] = int(worker.get_stats()["dropped"])
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the background video encounter worker.")
+    parser.add_argument("--frame-ms", type=float, default=45.0)
+    parser.add_argument("--tick-ms", type=float, default=20.0)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    frame_ms = max(1.0, float(args.frame_ms))
+    tick_ms = max(1.0, float(args.tick_ms))
+    seconds = max(0.2, float(args.seconds))
+    print(json.dumps({
+        "frame_ms": frame_ms,
+        "tick_ms": tick_ms,
+        "sync": run_sync(frame_ms, tick_ms, seconds),
+        "worker": run_worker(frame_ms, tick_ms, seconds),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+"""Rebuild reference_data.bundle from the reference JSON files.
+
+The JSON files (gen3_*.json, legacy_item_mappings.json, hunt_encounter_catalog.json)
+remain the source of truth. Rerun this after editing any of them; until then the
+tracker sees the changed source hash and parses that JSON file directly.
+
+Usage:
+  python scripts/build_reference_bundle.py
+  python scripts/build_reference_bundle.py --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import tracker_gui as tracker_mod  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compile reference JSON files into the binary bundle.")
+    parser.add_argument("--source-dir", type=Path, default=REPO_ROOT)
+    parser.add_argument("--out", type=Path, default=REPO_ROOT / tracker_mod.REFERENCE_BUNDLE_FILENAME)
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the existing bundle is out of date.")
+    args = parser.parse_args()
+
+    if args.check:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fresh = Path(tmp_dir) / "fresh.bundle"
+            tracker_mod.build_reference_bundle(args.source_dir, fresh)
+            current = args.out.read_bytes() if args.out.exists() else b""
+            up_to_date = fresh.read_bytes() == current
+        print(json.dumps({"bundle": str(args.out), "up_to_date": up_to_date}))
+        return 0 if up_to_date else 1
+
+    started = time.perf_counter()
+    sizes = tracker_mod.build_reference_bundle(args.source_dir, args.out)
+    print(json.dumps({
+        "bundle": str(args.out),
+        "sections": len(sizes),
+        "bytes": args.out.stat().st_size,
+        "build_ms": round((time.perf_counter() - started) * 1000.0, 1),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
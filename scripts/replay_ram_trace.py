@@ -0,0 +1,97 @@
+"""Replay a recorded RetroArch RAM trace through the tracker's readers at full speed.
+
+Record a trace by setting "retroarch_trace_path" in the tracker config (or calling
+`RetroArchClient.start_recording(path)`), then step through it here. The replay
+clock advances by --step-s per cycle, so hours of polling replay in seconds and
+the per-reader timings double as decode-speed benchmarks.
+
+Usage:
+  python scripts/replay_ram_trace.py session.trace --game "Pokemon Emerald"
+  python scripts/replay_ram_trace.py session.trace --game "Pokemon Red" --step-s 0.25 --max-cycles 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import tracker_gui as tracker_mod  # noqa: E402
+from retroarch_standin import _percentiles  # noqa: E402
+
+
+def replay(trace_path: Path, game: str, step_s: float, max_cycles: int) -> Dict[str, object]:
+    client = tracker_mod.RetroArchReplayClient.from_file(str(trace_path))
+    client.connect()
+    tracker = tracker_mod.AchievementTracker(client, api=None)
+    achievements_file = REPO_ROOT / "achievements" / "games" / (game.lower().replace(" ", "_") + ".json")
+    if achievements_file.exists():
+        tracker.load_game(game, achievements_file)
+    else:
+        tracker.game_name = game
+    reader = tracker.pokemon_reader
+
+    timings: Dict[str, List[float]] = {name: [] for name in ("check_achievements", "read_party", "read_pokedex", "read_current_location")}
+    cycles = 0
+    started_wall = time.perf_counter()
+    while cycles < int(max_cycles):
+        tracker._cached_pokedex_for_poll = None
+        tracker._begin_poll_snapshot()
+        try:
+            started = time.perf_counter()
+            tracker.check_achievements()
+            timings["check_achievements"].append((time.perf_counter() - started) * 1000.0)
+        finally:
+            tracker._end_poll_snapshot()
+        for name, call in (
+            ("read_party", lambda: reader.read_party(game)),
+            ("read_pokedex", lambda: reader.read_pokedex(game)),
+            ("read_current_location", lambda: reader.read_current_location(game)),
+        ):
+            started = time.perf_counter()
+            call()
+            timings[name].append((time.perf_counter() - started) * 1000.0)
+        cycles += 1
+        if client.finished():
+            break
+        client.advance(step_s)
+
+    wall_s = max(1e-6, time.perf_counter() - started_wall)
+    return {
+        "trace": str(trace_path),
+        "game": game,
+        "cycles": cycles,
+        "trace_seconds": round(float(client.trace.duration_s), 3),
+        "replayed_seconds": round(float(client.virtual_time_s), 3),
+        "wall_seconds": round(wall_s, 3),
+        "speedup": round(float(client.virtual_time_s) / wall_s, 1),
+        "replayed_reads": int(client.replayed_reads),
+        "missing_reads": int(client.missing_reads),
+        "unlocked": sorted(str(ach.id) for ach in tracker.achievements if getattr(ach, "unlocked", False)),
+        "latency_ms": {name: _percentiles(samples) for name, samples in timings.items()},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a RetroArch RAM trace through the tracker readers.")
+    parser.add_argument("trace", type=Path)
+    parser.add_argument("--game", type=str, default="Pokemon Emerald")
+    parser.add_argument("--step-s", type=float, default=0.5, help="Replay clock advance per poll cycle.")
+    parser.add_argument("--max-cycles", type=int, default=100000)
+    args = parser.parse_args()
+    print(json.dumps(replay(args.trace, args.game, max(0.001, float(args.step_s)), int(args.max_cycles)), indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
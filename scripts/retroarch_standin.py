@@ -0,0 +1,345 @@
+"""Local UDP stand-in for RetroArch's network command interface.
+
+Speaks the subset of the protocol `RetroArchClient` uses (GET_STATUS, VERSION,
+READ_CORE_MEMORY) from a RAM image or a timeline of RAM images, with optional
+latency, jitter, packet loss and reordering. Useful for load-testing the poll
+loop, party and wild-encounter reads without a live emulator.
+
+Usage:
+  python scripts/retroarch_standin.py --image ram.bin@0x02000000 --latency-ms 2 --loss 0.01
+  python scripts/retroarch_standin.py --timeline session.json --bench-seconds 20 --game "Pokemon Emerald"
+
+Timeline JSON:
+  {"loop": true, "frames": [{"at_s": 0.0, "regions": [{"address": "0x02024284", "hex": "0a0b..."}]}, ...]}
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import random
+import select
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+DEFAULT_STATUS = "GET_STATUS PLAYING game_boy_advance,Pokemon Emerald,crc32=1f1c08fb"
+
+
+class MemoryImage:
+    """Sparse emulator address space built from (base address, bytes) segments."""
+
+    def __init__(self):
+        self._segments: List[Tuple[int, bytearray]] = []
+
+    def write(self, address: int, data: bytes) -> None:
+        address = int(address)
+        for base, segment in self._segments:
+            if base <= address and address + len(data) <= base + len(segment):
+                segment[address - base:address - base + len(data)] = data
+                return
+        self._segments.append((address, bytearray(data)))
+        self._segments.sort(key=lambda item: item[0])
+
+    def read(self, address: int, length: int) -> Optional[bytes]:
+        address = int(address)
+        for base, segment in self._segments:
+            if base <= address and address + int(length) <= base + len(segment):
+                return bytes(segment[address - base:address - base + int(length)])
+        return None
+
+    @classmethod
+    def from_regions(cls, regions: List[Dict[str, str]], base: Optional["MemoryImage"] = None) -> "MemoryImage":
+        image = cls()
+        if base is not None:
+            image._segments = [(addr, bytearray(segment)) for addr, segment in base._segments]
+        for region in regions or []:
+            image.write(int(str(region["address"]), 16), bytes.fromhex(str(region.get("hex", ""))))
+        return image
+
+
+def zero_image(platform: str = "gba") -> MemoryImage:
+    """Zero-filled WRAM for a platform, mirroring the regions the tracker reads."""
+    image = MemoryImage()
+    if platform == "gba":
+        image.write(0x02000000, bytes(0x40000))  # EWRAM
+        image.write(0x03000000, bytes(0x8000))  # IWRAM
+    else:
+        image.write(0xC000, bytes(0x2000))  # WRAM
+    return image
+
+
+def load_timeline(path: Path) -> Tuple[List[Tuple[float, MemoryImage]], bool]:
+    """Load a timeline JSON; each frame is applied on top of the previous one."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    frames: List[Tuple[float, MemoryImage]] = []
+    previous: Optional[MemoryImage] = None
+    for frame in payload.get("frames", []):
+        image = MemoryImage.from_regions(frame.get("regions", []), base=previous)
+        frames.append((float(frame.get("at_s", 0.0)), image))
+        previous = image
+    return frames, bool(payload.get("loop", False))
+
+
+class RetroArchStandIn:
+    """UDP server answering RetroArch network commands from RAM images."""
+
+    def __init__(
+        self,
+        frames: List[Tuple[float, MemoryImage]],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        status: str = DEFAULT_STATUS,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        loss: float = 0.0,
+        reorder: float = 0.0,
+        loop: bool = False,
+        seed: Optional[int] = None,
+    ):
+        if not frames:
+            raise ValueError("at least one RAM image is required")
+        self.frames = sorted(frames, key=lambda item: item[0])
+        self.status = status
+        self.latency_ms = max(0.0, float(latency_ms))
+        self.jitter_ms = max(0.0, float(jitter_ms))
+        self.loss = min(1.0, max(0.0, float(loss)))
+        self.reorder = min(1.0, max(0.0, float(reorder)))
+        self.loop = bool(loop)
+        self._random = random.Random(seed)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((host, int(port)))
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started_at = 0.0
+        self.stats: Dict[str, int] = {"received": 0, "replied": 0, "dropped": 0, "reordered": 0, "unmapped": 0}
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._socket.getsockname()
+
+    def start(self) -> "RetroArchStandIn":
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._serve, name="retroarch-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        self._socket.close()
+
+    def __enter__(self) -> "RetroArchStandIn":
+        return self.start()
+
+    def __exit__(self, *_exc) -> None:
+        self.stop()
+
+    def current_image(self) -> MemoryImage:
+        elapsed = time.monotonic() - self._started_at
+        if self.loop and len(self.frames) > 1:
+            span = max(self.frames[-1][0], 1e-6)
+            elapsed = elapsed % span
+        image = self.frames[0][1]
+        for at_s, frame_image in self.frames:
+            if at_s > elapsed:
+                break
+            image = frame_image
+        return image
+
+    def handle(self, command: str) -> Optional[str]:
+        parts = command.strip().split()
+        if not parts:
+            return None
+        if parts[0] == "GET_STATUS":
+            return self.status
+        if parts[0] == "VERSION":
+            return "1.19.1"
+        if parts[0] == "READ_CORE_MEMORY" and len(parts) >= 3:
+            try:
+                address = int(parts[1], 16)
+                length = int(parts[2], 0)
+            except ValueError:
+                return None
+            data = self.current_image().read(address, length)
+            if data is None:
+                self.stats["unmapped"] += 1
+                return f"READ_CORE_MEMORY {address:x} -1 no memory map defined"
+            return f"READ_CORE_MEMORY {address:x} " + data.hex(" ")
+        return None
+
+    def _serve(self) -> None:
+        outbox: List[Tuple[float, int, bytes, Tuple[str, int]]] = []
+        seq = 0
+        while not self._stop.is_set():
+            now = time.monotonic()
+            while outbox and outbox[0][0] <= now:
+                _due, _seq, payload, peer = heapq.heappop(outbox)
+                try:
+                    self._socket.sendto(payload, peer)
+                    self.stats["replied"] += 1
+                except OSError:
+                    pass
+            wait_s = 0.05 if not outbox else max(0.0, min(0.05, outbox[0][0] - now))
+            try:
+                readable, _w, _x = select.select([self._socket], [], [], wait_s)
+            except (OSError, ValueError):
+                break
+            if not readable:
+                continue
+            try:
+                data, peer = self._socket.recvfrom(65536)
+            except OSError:
+                continue
+            self.stats["received"] += 1
+            reply = self.handle(data.decode(errors="replace"))
+            if reply is None:
+                continue
+            if self.loss > 0 and self._random.random() < self.loss:
+                self.stats["dropped"] += 1
+                continue
+            delay_ms = self.latency_ms + (self._random.uniform(0.0, self.jitter_ms) if self.jitter_ms > 0 else 0.0)
+            if self.reorder > 0 and self._random.random() < self.reorder:
+                # Hold this reply long enough for later replies to overtake it.
+                delay_ms += max(1.0, self.latency_ms + self.jitter_ms) * 2.0
+                self.stats["reordered"] += 1
+            seq += 1
+            heapq.heappush(outbox, (time.monotonic() + delay_ms / 1000.0, seq, (reply + "\n").encode(), peer))
+
+
+def _percentiles(samples_ms: List[float]) -> Dict[str, Optional[float]]:
+    if not samples_ms:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(samples_ms)
+
+    def pick(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 2)
+
+    return {"count": len(ordered), "p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": round(ordered[-1], 2)}
+
+
+def run_bench(server: RetroArchStandIn, game: str, seconds: float) -> Dict[str, object]:
+    """Drive one tracker poll cycle plus party/wild reads in a loop and report latency percentiles."""
+    import tracker_gui as tracker_mod
+
+    host, port = server.address
+    client = tracker_mod.RetroArchClient(host=host, port=port)
+    client.connect()
+    tracker = tracker_mod.AchievementTracker(client, api=None)
+    achievements_file = REPO_ROOT / "achievements" / "games" / (game.lower().replace(" ", "_") + ".json")
+    if achievements_file.exists():
+        tracker.load_game(game, achievements_file)
+    else:
+        tracker.game_name = game
+
+    timings: Dict[str, List[float]] = {"poll_cycle": [], "read_party": [], "read_wild_encounter": []}
+    deadline = time.monotonic() + max(0.1, float(seconds))
+    try:
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            # Mirrors the per-cycle work of AchievementTracker._poll_loop.
+            tracker._cached_pokedex_for_poll = None
+            tracker._begin_poll_snapshot()
+            try:
+                with client.io_priority(client.IO_PRIORITY_ACHIEVEMENTS):
+                    tracker.check_achievements()
+                with client.io_priority(client.IO_PRIORITY_COLLECTION):
+                    tracker.check_collection()
+            finally:
+                tracker._end_poll_snapshot()
+            timings["poll_cycle"].append((time.perf_counter() - started) * 1000.0)
+
+            started = time.perf_counter()
+            tracker.pokemon_reader.read_party(game)
+            timings["read_party"].append((time.perf_counter() - started) * 1000.0)
+
+            started = time.perf_counter()
+            tracker.pokemon_reader.read_wild_encounter(game)
+            timings["read_wild_encounter"].append((time.perf_counter() - started) * 1000.0)
+    finally:
+        client.disconnect()
+
+    elapsed = max(1e-6, float(seconds))
+    return {
+        "game": game,
+        "seconds": float(seconds),
+        "poll_cycles_per_s": round(len(timings["poll_cycle"]) / elapsed, 2),
+        "latency_ms": {name: _percentiles(samples) for name, samples in timings.items()},
+        "server": dict(server.stats),
+        "client_io": client.get_io_stats(),
+        "client_pipeline": client.get_pipeline_stats(),
+    }
+
+
+def _parse_image_arg(raw: str) -> Tuple[Path, int]:
+    path_text, _sep, base_text = str(raw).partition("@")
+    return Path(path_text), int(base_text or "0x02000000", 16)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local UDP RetroArch stand-in serving RAM images.")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=55355)
+    parser.add_argument("--image", action="append", default=[], help="Raw RAM dump as PATH@BASE_HEX (can repeat).")
+    parser.add_argument("--timeline", type=Path, default=None, help="Timeline JSON of RAM images over time.")
+    parser.add_argument("--platform", type=str, choices=["gba", "gb"], default="gba", help="Zero-filled image when no RAM is given.")
+    parser.add_argument("--status", type=str, default=DEFAULT_STATUS, help="Reply sent for GET_STATUS.")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0, help="Reply drop probability (0-1).")
+    parser.add_argument("--reorder", type=float, default=0.0, help="Probability a reply is delayed past later ones (0-1).")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--bench-seconds", type=float, default=0.0, help="Run a tracker load test for N seconds, then exit.")
+    parser.add_argument("--game", type=str, default="Pokemon Emerald", help="Game used by --bench-seconds.")
+    args = parser.parse_args()
+
+    loop = False
+    if args.timeline is not None:
+        frames, loop = load_timeline(args.timeline)
+    elif args.image:
+        image = MemoryImage()
+        for raw in args.image:
+            path, base = _parse_image_arg(raw)
+            image.write(base, path.read_bytes())
+        frames = [(0.0, image)]
+    else:
+        frames = [(0.0, zero_image(args.platform))]
+
+    port = 0 if float(args.bench_seconds) > 0 else int(args.port)
+    server = RetroArchStandIn(
+        frames,
+        host=args.host,
+        port=port,
+        status=args.status,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        loss=args.loss,
+        reorder=args.reorder,
+        loop=loop,
+        seed=args.seed,
+    )
+    with server:
+        if float(args.bench_seconds) > 0:
+            print(json.dumps(run_bench(server, args.game, float(args.bench_seconds)), indent=2, default=str))
+            return 0
+        print(f"RetroArch stand-in listening on {server.address[0]}:{server.address[1]} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,7 +8,12 @@ This is intentionally self-contained and does not require a running RetroArch in
 
 from __future__ import annotations
 
+import os
+import socket
+import struct
 import sys
+import tempfile
+import threading
 import time
 from pathlib import Path
 import unittest
@@ -17,7 +22,22 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from tracker_gui import Achievement, AchievementTracker, PokeAchieveAPI, _resolve_canonical_held_item
+import tracker_gui as tracker_mod
+from tracker_gui import (
+    Achievement,
+    AchievementTracker,
+    OBSVideoEncounterReader,
+    PokeAchieveAPI,
+    RetroArchClient,
+    ReferenceDataBundle,
+    RetroArchReplayClient,
+    _resolve_canonical_held_item,
+    build_reference_bundle,
+    compile_memory_condition,
+    diff_flag_ids,
+)
+from game_configs import DerivedAchievementChecker, PokedexBitset
+from retroarch_standin import MemoryImage, RetroArchStandIn
 
 
 class FakeRetroArch:
@@ -171,23 +191,14 @@ class ReportingValidationTests(unittest.TestCase):
 
     def test_gen1_party_internal_species_ids_map_to_national_dex(self):
         class PartyRetroGen1:
+            # Party species list entry #1 and slot 1 species are Squirtle in Gen1 internal ordering.
+            MEMORY = {0xD163: 1, 0xD164: 177, 0xD16B: 177, 0xD16B + 3: 5}
+
             def read_memory(self, addr: str, num_bytes: int = 1):
                 address = int(addr, 16)
                 if num_bytes == 1:
-                    if address == 0xD163:
-                        return 1
-                    # Party species list entry #1 is Squirtle in Gen1 internal ordering.
-                    if address == 0xD164:
-                        return 177
-                    if address == 0xD16B:
-                        return 177
-                    return 0
-                if num_bytes == 44:
-                    slot = [0] * 44
-                    slot[0] = 177
-                    slot[3] = 5
-                    return slot
-                return [0] * int(num_bytes)
+                    return self.MEMORY.get(address, 0)
+                return [self.MEMORY.get(address + i, 0) for i in range(int(num_bytes))]
 
         reader = self.tracker.pokemon_reader
         original_retro = reader.retroarch
@@ -283,19 +294,13 @@ class ReportingValidationTests(unittest.TestCase):
 
     def test_gen3_party_normalizes_internal_species_output(self):
         class PartyRetroSingle:
+            MEMORY = {0x3000: 1, 0x3004 + 84: 22}
+
             def read_memory(self, addr: str, num_bytes: int = 1):
                 address = int(addr, 16)
                 if num_bytes == 1:
-                    if address == 0x3000:
-                        return 1
-                    return 0
-                if num_bytes == 100:
-                    slot = [0] * 100
-                    slot[84] = 22
-                    return slot
-                if num_bytes > 1:
-                    return [0] * int(num_bytes)
-                return 0
+                    return self.MEMORY.get(address, 0)
+                return [self.MEMORY.get(address + i, 0) for i in range(int(num_bytes))]
 
         reader = self.tracker.pokemon_reader
         original_retro = reader.retroarch
@@ -333,6 +338,352 @@ class ReportingValidationTests(unittest.TestCase):
             reader.get_game_config = original_config_getter
             reader._decode_gen3_party_species = original_decode
 
+    def test_party_read_fetches_count_and_slots_in_one_bulk_read(self):
+        class CountingPartyRetro:
+            MEMORY = {0x3000: 2, 0x3004 + 84: 22, 0x3004 + 100 + 84: 31}
+
+            def __init__(self):
+                self.calls = []
+
+            def read_memory(self, addr: str, num_bytes: int = 1):
+                address = int(addr, 16)
+                self.calls.append((address, int(num_bytes)))
+                if num_bytes == 1:
+                    return self.MEMORY.get(address, 0)
+                return [self.MEMORY.get(address + i, 0) for i in range(int(num_bytes))]
+
+        reader = self.tracker.pokemon_reader
+        original_retro = reader.retroarch
+        original_config_getter = reader.get_game_config
+        original_decode = reader._decode_gen3_party_species
+        fake = CountingPartyRetro()
+        reader.retroarch = fake
+        reader.get_game_config = lambda game_name: {
+            "gen": 3,
+            "layout_id": "gen3_emerald",
+            "party_count": "0x3000",
+            "party_start": "0x3004",
+            "party_slot_size": 100,
+            "party_use_pointer_layout": 0,
+            "party_max_pairs": 1,
+            "party_enable_offset_scan": 0,
+            "party_allow_double_stride": 0,
+            "party_try_double_bulk": 0,
+        }
+        reader._decode_gen3_party_species = lambda slot_data, max_species_id, allow_checksum_mismatch=False: 358
+        try:
+            party = reader.read_party("Pokemon Emerald")
+            self.assertEqual([member["level"] for member in party], [22, 31])
+            self.assertEqual(fake.calls, [(0x3000, 604)])
+            self.assertEqual(reader.get_last_party_read_meta()["read_calls"], 1)
+            self.assertEqual(reader.get_party_read_stats()["over_budget"], 0)
+
+            # A read_party on another thread (Tk hunt checks) must not clobber this call's block.
+            main_ident = threading.get_ident()
+            nested = []
+
+            def decode_with_concurrent_party(slot_data, max_species_id, allow_checksum_mismatch=False):
+                if threading.get_ident() == main_ident and not nested:
+                    worker = threading.Thread(target=lambda: nested.append(reader.read_party("Pokemon Emerald")))
+                    worker.start()
+                    worker.join(timeout=2.0)
+                return 358
+
+            fake.calls = []
+            reader._party_decode_memo.clear()
+            reader._decode_gen3_party_species = decode_with_concurrent_party
+            party = reader.read_party("Pokemon Emerald")
+            self.assertEqual([member["level"] for member in party], [22, 31])
+            self.assertEqual([[member["level"] for member in members] for members in nested], [[22, 31]])
+            self.assertEqual(fake.calls, [(0x3000, 604), (0x3000, 604)])
+            self.assertEqual(reader.get_last_party_read_meta()["read_calls"], 1)
+        finally:
+            reader.retroarch = original_retro
+            reader.get_game_config = original_config_getter
+            reader._decode_gen3_party_species = original_decode
+
+    def test_gen3_slot_decode_covers_all_orders_and_block_decode(self):
+        reader = self.tracker.pokemon_reader
+
+        def encrypt_slot(personality: int, ot_id: int, species: int, moves, level: int) -> bytes:
+            order = reader.GEN3_PARTY_SUBSTRUCT_ORDERS[personality % 24]
+            parts = {
+                0: struct.pack("<HHIBBH", species, 13, 5000, 0, 70, 0),
+                1: struct.pack("<4H4B", *moves, 35, 25, 0, 0),
+                2: bytes(12),
+                3: struct.pack("<III", 0, 1 << 31, 0),
+            }
+            plain = b"".join(parts[part] for part in order)
+            key = personality ^ ot_id
+            secure = struct.pack("<12I", *[word ^ key for word in struct.unpack("<12I", plain)])
+            checksum = sum(struct.unpack("<24H", plain)) & 0xFFFF
+            header = struct.pack("<II", personality, ot_id) + b"\xff" * 10 + bytes([2, 0]) + b"\xff" * 7 + b"\x00"
+            return header + struct.pack("<HH", checksum, 0) + secure + struct.pack("<IBB7H", 0, level, 0, 40, 50, 30, 30, 30, 30, 30)
+
+        slots = [encrypt_slot(0x1234_5600 + order_idx, 0xBEEF_0042, 277 + order_idx, (33, 45, 0, 0), 5 + order_idx) for order_idx in range(24)]
+        for order_idx, slot in enumerate(slots):
+            details = reader._decode_gen3_party_slot_details_uncached(slot, 411)
+            self.assertIsNotNone(details, order_idx)
+            self.assertEqual(details["species"], 277 + order_idx)
+            self.assertEqual(details["level"], 5 + order_idx)
+            self.assertEqual(details["held_item_id"], 13)
+            self.assertEqual(len(details["moves"]), 2)
+
+        swapped = bytearray(100)
+        swapped[0::2] = slots[3][1::2]
+        swapped[1::2] = slots[3][0::2]
+        self.assertEqual(reader._decode_gen3_party_slot_details_uncached(list(swapped), 411)["species"], 280)
+
+        block = b"".join(slots[:5]) + bytes(100)
+        decoded = reader._decode_gen3_party_slots(block, 100, 6, 411)
+        self.assertEqual([item["species"] if item else None for item in decoded], [277, 278, 279, 280, 281, None])
+
+    def test_gen3_text_translation_table_and_nickname_memo(self):
+        reader = self.tracker.pokemon_reader
+        raw = [0xCA, 0xDD, 0xDF, 0xD5, 0xB0, 0xFE, 0x300 | 0xBB, 0xFF, 0xBC, 0xBD]
+        self.assertEqual(reader._decode_gen3_text(raw), "Pika... A")
+        self.assertEqual(reader._decode_gen3_text(bytes([0x00, 0xBB, 0x01, 0xFF])), "A?")
+
+        reader._nickname_memo.clear()
+        pikachu = bytes([0xCA, 0xDD, 0xDF, 0xD5, 0xD7, 0xDC, 0xE9, 0xFF, 0x00, 0x00])
+        sparky = bytes([0xCD, 0xE4, 0xD5, 0xE6, 0xDF, 0xED, 0xFF, 0x00, 0x00, 0x00])
+        self.assertIsNone(reader._resolve_gen3_nickname(pikachu, "Pikachu"))
+        self.assertEqual(reader._resolve_gen3_nickname(list(sparky), "Pikachu"), "Sparky")
+        self.assertEqual(reader._nickname_memo[(sparky, "Pikachu")], "Sparky")
+        self.assertEqual(len(reader._nickname_memo), 2)
+
+    def test_reference_bundle_matches_json_and_detects_stale_sources(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir)
+            for name in (
+                "gen3_gender_map.json", "gen3_species_abilities.json", "gen3_ability_names.json", "gen3_move_names.json",
+                "gen3_internal_to_national.json", "legacy_item_mappings.json", "hunt_encounter_catalog.json",
+            ):
+                (source_dir / name).write_bytes((ROOT_DIR / name).read_bytes())
+            bundle_path = source_dir / "reference_data.bundle"
+            build_reference_bundle(source_dir, bundle_path)
+
+            bundle = ReferenceDataBundle.open(bundle_path)
+            self.assertIn("hunt/Pokemon Emerald", bundle.section_names())
+            reader = self.tracker.pokemon_reader
+            self.assertEqual(dict(bundle.section("gen3/move_names")), reader._gen3_move_names)
+            self.assertEqual({key: value for key, value in bundle.section("gen3/internal_to_national")}, reader._gen3_internal_to_national)
+            emerald_items = {row[0]: row[1] for row in bundle.section("legacy_items/emerald")}
+            self.assertEqual(emerald_items[13], _resolve_canonical_held_item("Pokemon Emerald", 13)["canonical_item_id"])
+            bundle.close()
+
+            # A CRLF checkout of an unchanged source is still current.
+            crlf_source = source_dir / "gen3_ability_names.json"
+            crlf_source.write_bytes(crlf_source.read_bytes().replace(b"\r\n", b"\n").replace(b"\n", b"\r\n"))
+            (source_dir / "gen3_move_names.json").write_text('{"1": "pound"}', encoding="utf-8")
+            stale = ReferenceDataBundle.open(bundle_path)
+            self.assertIsNone(stale.section("gen3/move_names"))
+            self.assertIsNotNone(stale.section("gen3/gender_map"))
+            self.assertIsNotNone(stale.section("gen3/ability_names"))
+            stale.close()
+
+        # Concurrent first access from the poll and Tk threads loads the Gen 3 tables once.
+        fresh = tracker_mod.PokemonMemoryReader(RetroArchClient())
+        loads = []
+        real_load = fresh._load_gen3_reference_data
+
+        def slow_load():
+            loads.append(threading.get_ident())
+            time.sleep(0.05)
+            real_load()
+
+        fresh._load_gen3_reference_data = slow_load
+        threads = [threading.Thread(target=lambda: fresh._gen3_move_names) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=2.0)
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(fresh._gen3_move_names, reader._gen3_move_names)
+
+    @unittest.skipUnless(tracker_mod.PIL_AVAILABLE and tracker_mod.np is not None, "needs Pillow and numpy")
+    def test_numpy_pixel_engine_matches_python_fallback(self):
+        from PIL import ImageDraw
+
+        frame = tracker_mod.Image.new("RGB", (240, 160), (120, 150, 90))
+        draw = ImageDraw.Draw(frame)
+        for idx in range(0, 240, 7):
+            draw.point((idx, (idx * 13) % 160), fill=(140, 170, 100))
+        draw.ellipse((150, 30, 200, 80), fill=(200, 60, 40))
+        draw.rectangle((12, 115, 228, 152), fill=(248, 248, 248), outline=(40, 40, 40), width=2)
+        draw.point((170, 40), fill=(255, 255, 230))
+
+        results = []
+        for enabled in (True, False):
+            reader = OBSVideoEncounterReader(config={"video_numpy_pixel_engine": enabled})
+            sprite, area_ratio, coverage_ratio = reader._extract_sprite_foreground_rgba(frame)
+            results.append((
+                reader._sprite_metrics(frame),
+                sprite.tobytes() if sprite is not None else None,
+                area_ratio,
+                coverage_ratio,
+                reader._roi_presence_metrics(frame, "", "0.05,0.70,0.95,0.96"),
+                reader._auto_detect_game_frame_bounds(frame),
+                reader._shiny_score_for_frame(frame),
+            ))
+        self.assertIsNotNone(results[0][1])
+        self.assertEqual(results[0], results[1])
+
+    def test_sprite_signature_index_matches_scalar_hamming(self):
+        reader = OBSVideoEncounterReader(config={})
+        variant_key = reader._sprite_reference_variant_key("Pokemon Emerald")
+        references = {
+            1: ["0" * 64, "f" * 64],
+            2: ["0f" * 32],
+            4: [("a5" * 32)[:-1] + "4"],
+        }
+        for pid, signatures in references.items():
+            reader._sprite_reference_signature_cache[(variant_key, pid)] = list(signatures)
+        reader._sprite_reference_missing.add((variant_key, 3))
+        queries = ["00" * 31 + "ff", "a5" * 32]
+
+        distances, top2 = reader._sprite_reference_hamming_query("Pokemon Emerald", [1, 2, 3, 4, 2], queries)
+
+        expected = {
+            pid: min(reader._sprite_hamming_distance(q, r) for q in queries for r in signatures)
+            for pid, signatures in references.items()
+        }
+        self.assertEqual(distances, expected)
+        self.assertEqual(top2, (4, 1, 8))
+        index = reader._sprite_reference_index[variant_key]
+        self.assertEqual(index._query_python([index.pack(q) for q in queries], [1, 2, 3, 4, 2]), (distances, top2))
+        self.assertEqual(reader._sprite_hamming_distance("0" * 64, "f" * 63), 256)
+
+    @unittest.skipUnless(tracker_mod.np is not None, "numpy is required for the template matrix scorer")
+    def test_template_index_scores_match_per_template_similarity(self):
+        reader = OBSVideoEncounterReader(config={})
+        variant_key = reader._sprite_reference_variant_key("Pokemon Emerald")
+
+        def template(mask, edge, gray):
+            return {"size": 4, "mask": list(mask), "edge": list(edge), "gray": list(gray), "fg_count": sum(mask), "edge_count": sum(edge)}
+
+        query = template([1, 1, 0, 0] * 4, [1, 0, 0, 0] * 4, range(0, 160, 10))
+        references = {
+            1: [template([1, 1, 1, 0] * 4, [0, 1, 0, 0] * 4, [40] * 16), template([1, 1, 0, 0] * 4, [1, 0, 0, 0] * 4, range(5, 165, 10))],
+            2: [template([0, 0, 1, 1] * 4, [0, 0, 0, 1] * 4, [200] * 16)],
+            3: [{"size": 3, "mask": [1] * 9, "edge": [1] * 9, "gray": [0] * 9, "fg_count": 9, "edge_count": 9}],
+        }
+        for pid, templates in references.items():
+            reader._sprite_reference_template_cache[(variant_key, pid)] = list(templates)
+        reader._sprite_reference_template_missing.add((variant_key, 4))
+
+        scores = reader._sprite_reference_template_scores("Pokemon Emerald", [1, 2, 3, 4, 1], query)
+
+        expected = {
+            pid: max(reader._sprite_template_similarity(query, ref) for ref in templates)
+            for pid, templates in references.items()
+        }
+        self.assertEqual(scores, expected)
+        self.assertEqual(scores[2], 0.0)
+        self.assertEqual(scores[3], 0.0)
+        self.assertGreater(scores[1], 0.9)
+
+    @unittest.skipUnless(tracker_mod.PIL_AVAILABLE, "Pillow is required for sprite references")
+    def test_sprite_feature_cache_persists_and_detects_changed_sprites(self):
+        from PIL import ImageDraw
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            game_dir = root / "emerald"
+            game_dir.mkdir()
+            for pid, fill in ((1, (200, 60, 40, 255)), (2, (40, 90, 210, 255))):
+                sprite = tracker_mod.Image.new("RGBA", (48, 48), (0, 0, 0, 0))
+                ImageDraw.Draw(sprite).ellipse((6, 8 + pid * 4, 40, 42), fill=fill, outline=(10, 10, 10, 255))
+                sprite.save(game_dir / f"generation_iii_emerald_{pid}.png")
+
+            def warmed(enabled: bool):
+                reader = OBSVideoEncounterReader(config={"video_sprite_library_dir": str(root), "video_sprite_feature_cache_enabled": enabled})
+                reader.warm_sprite_reference_cache("Pokemon Emerald", [1, 2])
+                return reader, [
+                    (
+                        reader._sprite_reference_signatures_for_species("Pokemon Emerald", pid),
+                        reader._sprite_reference_color_profiles_for_species("Pokemon Emerald", pid),
+                        reader._sprite_reference_templates_for_species("Pokemon Emerald", pid),
+                    )
+                    for pid in (1, 2)
+                ]
+
+            _, expected = warmed(False)
+            self.assertFalse((root / tracker_mod.SPRITE_FEATURE_CACHE_DIRNAME).exists())
+            self.assertTrue(all(signatures and colors and templates for signatures, colors, templates in expected))
+            reader, built = warmed(True)
+            self.assertEqual(built, expected)
+            cache_path = next((root / tracker_mod.SPRITE_FEATURE_CACHE_DIRNAME).glob("*.pkfc"))
+
+            cache = tracker_mod.SpriteFeatureCache(cache_path, tracker_mod.SpriteFeatureCache.config_fingerprint(reader.config))
+            self.assertEqual(len(cache), 2)
+            sprite_path = game_dir / "generation_iii_emerald_1.png"
+            self.assertEqual(cache.get(sprite_path)["template"], expected[0][2][0])
+            stat = sprite_path.stat()
+            os.utime(sprite_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertIsNone(cache.get(sprite_path))
+            cache.close()
+
+            other = tracker_mod.SpriteFeatureCache(cache_path, tracker_mod.SpriteFeatureCache.config_fingerprint({"video_reference_canvas_size": 128}))
+            self.assertEqual(len(other), 0)
+            other.close()
+
+            reader, reloaded = warmed(True)
+            self.assertEqual(reloaded, expected)
+
+            # Changing extraction settings mid-session writes a cache under the new fingerprint only.
+            reader.update_config(dict(reader.config, video_reference_canvas_size=128))
+            self.assertIsNotNone(reader._sprite_reference_features("Pokemon Emerald", sprite_path))
+            reader._flush_sprite_feature_caches()
+            resized = tracker_mod.SpriteFeatureCache(cache_path, tracker_mod.SpriteFeatureCache.config_fingerprint(reader.config))
+            self.assertEqual(len(resized), 1)
+            resized.close()
+            for open_cache in reader._sprite_feature_caches.values():
+                open_cache.close()
+
+    def test_video_worker_keeps_latest_frame_and_delivers_results_in_order(self):
+        started = threading.Event()
+        gate = threading.Event()
+        processed = []
+
+        def run(request):
+            if request["frame"] == 1:
+                started.set()
+                gate.wait(timeout=2.0)
+            processed.append(request["frame"])
+            return {"encounter": {"frame": request["frame"]}}
+
+        worker = tracker_mod.VideoEncounterWorker(run)
+        worker.start()
+        try:
+            self.assertIsNone(worker.get_result())
+            self.assertFalse(worker.submit({"frame": 1}))
+            self.assertTrue(started.wait(timeout=2.0))
+            self.assertFalse(worker.submit({"frame": 2}))
+            self.assertTrue(worker.submit({"frame": 3}))
+            self.assertTrue(worker.is_busy())
+            gate.set()
+
+            results = []
+            deadline = time.monotonic() + 2.0
+            while len(results) < 2 and time.monotonic() < deadline:
+                result = worker.get_result()
+                if result is None:
+                    time.sleep(0.005)
+                    continue
+                results.append(result)
+            self.assertEqual([result["encounter"]["frame"] for result in results], [1, 3])
+            self.assertEqual([result["seq"] for result in results], [1, 3])
+            self.assertEqual(processed, [1, 3])
+            self.assertIsNone(worker.get_result())
+
+            stats = worker.get_stats()
+            self.assertEqual((stats["submitted"], stats["dropped"], stats["completed"]), (3, 1, 2))
+            self.assertGreater(stats["run_ms_max"], 0.0)
+        finally:
+            worker.stop()
+        self.assertFalse(worker.is_running())
+
     def test_gen3_party_recovers_sixth_slot_when_count_underreads_five(self):
         class PartyRetroUnderread:
             def read_memory(self, addr: str, num_bytes: int = 1):
@@ -388,6 +739,69 @@ class ReportingValidationTests(unittest.TestCase):
             reader.retroarch = original_retro
             reader.get_game_config = original_config_getter
             reader._decode_gen3_party_species = original_decode
+
+    def test_gen3_party_skips_decode_when_party_bytes_are_unchanged(self):
+        class PartyRetroBytes:
+            def __init__(self):
+                self.ram = bytearray(0x400)
+                self.ram[0] = 2
+                for idx in range(2):
+                    self.ram[4 + idx * 100] = 7 + idx
+                    self.ram[4 + idx * 100 + 84] = 30 + idx
+
+            def read_memory(self, addr: str, num_bytes: int = 1):
+                offset = int(addr, 16) - 0x3000
+                if num_bytes == 1:
+                    return self.ram[offset]
+                return list(self.ram[offset:offset + int(num_bytes)])
+
+        reader = self.tracker.pokemon_reader
+        original_retro = reader.retroarch
+        original_config_getter = reader.get_game_config
+        original_decode = reader._decode_gen3_party_species
+        retro = PartyRetroBytes()
+        reader.retroarch = retro
+        reader.get_game_config = lambda game_name: {
+            "gen": 3,
+            "layout_id": "gen3_emerald",
+            "party_count": "0x3000",
+            "party_start": "0x3004",
+            "party_slot_size": 100,
+            "party_use_pointer_layout": 0,
+            "party_max_pairs": 1,
+            "party_enable_offset_scan": 0,
+            "party_allow_double_stride": 0,
+            "party_try_double_bulk": 0,
+        }
+        decode_calls = []
+
+        def fake_decode(slot_data, max_species_id, allow_checksum_mismatch=False):
+            decode_calls.append(int(slot_data[0]))
+            return int(slot_data[0]) or None
+
+        reader._decode_gen3_party_species = fake_decode
+        try:
+            first = reader.read_party("Pokemon Emerald")
+            self.assertEqual([member["id"] for member in first], [7, 8])
+            calls_after_first = len(decode_calls)
+
+            second = reader.read_party("Pokemon Emerald")
+            self.assertEqual(second, first)
+            self.assertEqual(len(decode_calls), calls_after_first)
+            self.assertEqual(reader.get_decode_memo_stats()["party_hits"], 1)
+            # Callers get their own copy of the memoized party.
+            second[0]["level"] = 99
+            self.assertEqual(reader.read_party("Pokemon Emerald")[0]["level"], 30)
+
+            retro.ram[4 + 84] = 31
+            third = reader.read_party("Pokemon Emerald")
+            self.assertGreater(len(decode_calls), calls_after_first)
+            self.assertEqual(third[0]["level"], 31)
+        finally:
+            reader.retroarch = original_retro
+            reader.get_game_config = original_config_getter
+            reader._decode_gen3_party_species = original_decode
+
     def test_gen3_party_prefers_contiguous_slots_when_scores_tie(self):
         class PartyRetro:
             def read_memory(self, addr: str, num_bytes: int = 1):
@@ -1377,6 +1791,594 @@ class ReportingValidationTests(unittest.TestCase):
         self.assertEqual(len(update["catches"]), 151)
         self.assertEqual(len(self.tracker._last_pokedex), 151)
 
+    def test_read_many_merges_adjacent_ranges_into_single_reads(self):
+        client = RetroArchClient()
+        issued = []
+
+        def fake_read_bytes(addr: str, num_bytes: int = 1):
+            base = int(addr, 16)
+            issued.append((base, int(num_bytes)))
+            return bytes((base + i) & 0xFF for i in range(int(num_bytes)))
+
+        client.read_bytes = fake_read_bytes
+        results = client.read_many([("0xD356", 1), ("0xD357", 1), (0xD358, 2), ("0xD300", 4), ("0xF000", 1)])
+        self.assertEqual(issued, [(0xD300, 4), (0xD356, 4), (0xF000, 1)])
+        self.assertEqual(results[0xD357], b"\x57")
+        self.assertEqual(results[0xD358], b"\x58\x59")
+        self.assertEqual(results[0xD300], b"\x00\x01\x02\x03")
+        self.assertEqual(client.get_read_many_stats()["spans"], 3)
+
+    def test_read_bytes_decodes_hex_payload_into_buffer(self):
+        client = RetroArchClient()
+        client.connected = True
+        client.adaptive_chunking_enabled = False
+        commands = []
+
+        def fake_send(command: str):
+            commands.append(command)
+            _, addr, length = command.split()
+            base = int(addr, 16)
+            payload = " ".join(f"{(base + i) & 0xFF:02x}" for i in range(int(length)))
+            return f"READ_CORE_MEMORY {addr} {payload}"
+
+        client.send_command = fake_send
+        self.assertEqual(client.read_bytes("0x2024", 3), b"\x24\x25\x26")
+        self.assertEqual(client.read_memory("0x2024", 2), [0x24, 0x25])
+        self.assertEqual(client.read_memory("0x2024"), 0x24)
+
+        big = client.read_bytes("0x02000000", 1500)
+        self.assertEqual(len(big), 1500)
+        self.assertEqual(big[1200], (0x02000000 + 1200) & 0xFF)
+        self.assertEqual(commands[-2:], ["READ_CORE_MEMORY 0x2000000 1200", "READ_CORE_MEMORY 0x20004b0 300"])
+
+        self.assertIsNone(RetroArchClient._parse_read_response("READ_CORE_MEMORY 0x2024 -1 no memory map defined"))
+
+    def test_adaptive_read_chunks_probe_host_limit_and_fall_back(self):
+        client = RetroArchClient(host="chunk-probe.invalid", port=1)
+        client.connected = True
+        limit = {"bytes": 4096}
+        commands = []
+
+        def fake_send(command: str):
+            commands.append(command)
+            _, addr, length = command.split()
+            if int(length) > limit["bytes"]:
+                return None
+            return f"READ_CORE_MEMORY {addr} " + " ".join("ab" for _ in range(int(length)))
+
+        client.send_command = fake_send
+        self.assertEqual(client.read_bytes("0x02000000", 6000), b"\xab" * 6000)
+        # 6000 fails, 4096 works, and the rest of the read uses the learned size.
+        self.assertEqual(
+            commands,
+            [
+                "READ_CORE_MEMORY 0x2000000 6000",
+                "READ_CORE_MEMORY 0x2000000 4096",
+                "READ_CORE_MEMORY 0x2000000 4096",
+                "READ_CORE_MEMORY 0x2001000 1904",
+            ],
+        )
+        self.assertEqual(client.read_chunk_limit(), 4096)
+        # The probed size is shared with other clients on the same host.
+        self.assertEqual(RetroArchClient(host="chunk-probe.invalid", port=1).read_chunk_limit(), 4096)
+
+        commands.clear()
+        limit["bytes"] = 1200
+        self.assertEqual(client.read_bytes("0x02000000", 2400), b"\xab" * 2400)
+        self.assertEqual(client.read_chunk_limit(), client.MAX_READ_CHUNK_BYTES)
+        self.assertEqual(commands[-2:], ["READ_CORE_MEMORY 0x2000000 1200", "READ_CORE_MEMORY 0x20004b0 1200"])
+        stats = client.get_chunk_stats()
+        self.assertEqual(stats["fallbacks"], 1)
+        self.assertEqual(stats["chunks_avoided"], 5 - 2)
+
+    def test_io_worker_runs_hunt_requests_before_achievement_sweeps(self):
+        client = RetroArchClient()
+        executed = []
+        gate = threading.Event()
+
+        def fake_send_now(command: str):
+            if command == "BLOCK":
+                gate.wait(timeout=2.0)
+            executed.append(command)
+            return command
+
+        client._send_command_now = fake_send_now
+        client.start_io_worker()
+        try:
+            blocker = client.submit_command("BLOCK", priority=RetroArchClient.IO_PRIORITY_ACHIEVEMENTS)
+            time.sleep(0.05)
+            sweep = client.submit_command("SWEEP", priority=RetroArchClient.IO_PRIORITY_ACHIEVEMENTS)
+            with client.io_priority(RetroArchClient.IO_PRIORITY_HUNT):
+                hunt = client.submit_command("HUNT")
+            gate.set()
+            self.assertEqual(hunt.result(timeout=2.0), "HUNT")
+            self.assertEqual(sweep.result(timeout=2.0), "SWEEP")
+            self.assertEqual(blocker.result(timeout=2.0), "BLOCK")
+            self.assertEqual(executed, ["BLOCK", "HUNT", "SWEEP"])
+            self.assertEqual(client.send_command("DIRECT"), "DIRECT")
+
+            stats = client.get_io_stats()
+            self.assertEqual(stats[RetroArchClient.IO_PRIORITY_HUNT]["requests"], 1)
+            self.assertGreater(stats[RetroArchClient.IO_PRIORITY_HUNT]["queue_wait_ms_max"], 0.0)
+
+            # Requests submitted while the worker is stopping run inline instead of queueing behind the sentinel.
+            gate.clear()
+            blocker = client.submit_command("BLOCK")
+            time.sleep(0.05)
+            stopper = threading.Thread(target=client.stop_io_worker)
+            stopper.start()
+            deadline = time.monotonic() + 2.0
+            while client._io_accepting and time.monotonic() < deadline:
+                time.sleep(0.005)
+            self.assertEqual(client.submit_command("LATE").result(timeout=0.5), "LATE")
+            gate.set()
+            stopper.join(timeout=2.0)
+            self.assertEqual(blocker.result(timeout=2.0), "BLOCK")
+
+            # Inline work that raises resolves the future with the exception.
+            def failing_work():
+                raise OSError("socket closed")
+
+            failed = client._submit_io(failing_work)
+            self.assertIsInstance(failed.exception(timeout=0.5), OSError)
+
+            # A restart that lands between the join and the reset keeps its new thread.
+            client.start_io_worker()
+            old_thread = client._io_thread
+            old_join = old_thread.join
+
+            def join_then_restart(timeout=None):
+                old_join(timeout)
+                client.start_io_worker()
+
+            old_thread.join = join_then_restart
+            client.stop_io_worker()
+            self.assertIsNot(client._io_thread, old_thread)
+            self.assertTrue(client.is_io_worker_running())
+            self.assertEqual(client.submit_command("AFTER").result(timeout=2.0), "AFTER")
+        finally:
+            gate.set()
+            client.stop_io_worker()
+        self.assertFalse(client.is_io_worker_running())
+
+    def test_pipelined_reads_match_out_of_order_replies_and_resend_drops(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(0.2)
+        stop = threading.Event()
+        received = []
+
+        def serve():
+            held = []
+            dropped = set()
+            while not stop.is_set():
+                try:
+                    data, peer = server.recvfrom(4096)
+                except socket.timeout:
+                    continue
+                _, addr, length = data.decode().split()
+                received.append(addr)
+                if addr == "0x3000" and addr not in dropped:
+                    dropped.add(addr)
+                    continue
+                base = int(addr, 16)
+                payload = " ".join(f"{(base + i) & 0xFF:02x}" for i in range(int(length)))
+                held.append((f"READ_CORE_MEMORY {addr} {payload}".encode(), peer))
+                if len(held) >= 2 or addr == "0x3000":
+                    # Reply newest-first so responses arrive out of order.
+                    for reply, reply_peer in reversed(held):
+                        server.sendto(reply, reply_peer)
+                    held = []
+            server.close()
+
+        worker = threading.Thread(target=serve, daemon=True)
+        worker.start()
+        client = RetroArchClient(port=server.getsockname()[1])
+        client.io_worker_enabled = False
+        client.command_timeout_seconds = 0.2
+        try:
+            self.assertTrue(client.connect())
+            results = client.read_pipelined([(0x1000, 4), (0x2000, 2), (0x3000, 3)])
+            self.assertEqual(results[(0x1000, 4)], b"\x00\x01\x02\x03")
+            self.assertEqual(results[(0x2000, 2)], b"\x00\x01")
+            self.assertEqual(results[(0x3000, 3)], b"\x00\x01\x02")
+            self.assertEqual(received.count("0x3000"), 2)
+            self.assertEqual(received.count("0x1000"), 1)
+            self.assertEqual(client.get_pipeline_stats()["resends"], 1)
+        finally:
+            stop.set()
+            client.disconnect()
+            worker.join(timeout=1.0)
+
+    def test_standin_server_serves_ram_image_through_client(self):
+        image = MemoryImage()
+        image.write(0x02024284, bytes([3, 0x19, 0x01, 0xFF]))
+        later = MemoryImage.from_regions([{"address": "0x02024284", "hex": "04"}], base=image)
+        with RetroArchStandIn([(0.0, image), (0.3, later)], latency_ms=1.0, seed=7) as server:
+            client = RetroArchClient(host=server.address[0], port=server.address[1])
+            client.command_timeout_seconds = 0.5
+            try:
+                self.assertTrue(client.connect())
+                self.assertEqual(client.get_current_game(), "Pokemon Emerald")
+                self.assertEqual(client.read_bytes("0x02024284", 4), bytes([3, 0x19, 0x01, 0xFF]))
+                self.assertIsNone(client.read_memory("0x08000000", 2))
+                time.sleep(0.35)
+                self.assertEqual(client.read_memory("0x02024284"), 4)
+            finally:
+                client.disconnect()
+            self.assertEqual(server.stats["unmapped"], 2)
+
+    def test_recorded_trace_replays_reads_by_virtual_time(self):
+        image = MemoryImage()
+        image.write(0x02024284, bytes([3, 0x19, 0x01, 0xFF]))
+        later = MemoryImage.from_regions([{"address": "0x02024284", "hex": "04"}], base=image)
+        with tempfile.TemporaryDirectory() as tmp:
+            trace_path = str(Path(tmp) / "session.trace")
+            with RetroArchStandIn([(0.0, image), (0.2, later)], seed=3) as server:
+                client = RetroArchClient(host=server.address[0], port=server.address[1])
+                client.command_timeout_seconds = 0.3
+                try:
+                    client.connect()
+                    client.start_recording(trace_path)
+                    self.assertEqual(client.get_current_game(), "Pokemon Emerald")
+                    self.assertEqual(client.read_bytes("0x02024284", 4), bytes([3, 0x19, 0x01, 0xFF]))
+                    self.assertIsNone(client.read_memory("0x08000000", 2))
+                    time.sleep(0.25)
+                    self.assertEqual(client.read_memory("0x02024284"), 4)
+                    # Stop-tracking flushes a live trace without ending it.
+                    client.flush_recording()
+                    self.assertEqual(os.path.getsize(trace_path), client._trace_writer.bytes_written)
+                    stats = client.stop_recording()
+                finally:
+                    client.disconnect()
+            self.assertEqual(stats["records"], 5)
+
+            replay = RetroArchReplayClient.from_file(trace_path)
+            self.assertTrue(replay.connect())
+            # Nothing recorded before the first exchange is served, and RAM is not read ahead of when it was seen.
+            self.assertIsNone(replay.trace.status_at(replay.trace.started_s - 0.001))
+            self.assertIsNone(replay.trace.lookup(0x02024284, 4, replay.trace.started_s - 0.001))
+            self.assertEqual(replay.get_current_game(), "Pokemon Emerald")
+            self.assertIsNone(replay.read_bytes("0x02024284", 4))
+            replay.advance_to(0.1)
+            self.assertEqual(replay.read_bytes("0x02024284", 4), bytes([3, 0x19, 0x01, 0xFF]))
+            # Sub-ranges of a recorded read are served from the covering record.
+            self.assertEqual(replay.read_memory("0x02024285", 2), [0x19, 0x01])
+            self.assertIsNone(replay.read_memory("0x08000000", 2))
+            replay.advance_to(replay.trace.duration_s)
+            self.assertTrue(replay.finished())
+            self.assertEqual(replay.read_memory("0x02024284"), 4)
+            # Only the 1-byte read saw the change; wider reads fall back to the newest covering record.
+            self.assertEqual(replay.read_bytes("0x02024284", 4), bytes([3, 0x19, 0x01, 0xFF]))
+
+    def test_region_subscriptions_refresh_by_period_and_priority(self):
+        client = RetroArchClient()
+        client.connected = True
+        client.SUBSCRIPTION_TICK_BYTE_BUDGET = 20
+        fetched = []
+
+        def _fake_read_many(ranges):
+            fetched.append(sorted(addr for addr, _length in ranges))
+            return {addr: bytes([addr & 0xFF]) * length for addr, length in ranges}
+
+        client.read_many = _fake_read_many
+        client.send_command = lambda command: None
+        client.subscribe_regions("party", [("0xD163", 1)], period_s=0.0, priority=client.IO_PRIORITY_COLLECTION)
+        client.subscribe_regions("dex", [("0xD30A", 19)], period_s=0.0, priority=client.IO_PRIORITY_HUNT)
+        client.subscribe_regions("badges", [("0xD356", 1)], period_s=60.0, priority=client.IO_PRIORITY_ACHIEVEMENTS)
+
+        # Tick 1: the budget only fits the two higher-priority regions.
+        client.begin_scheduled_snapshot()
+        self.assertEqual(fetched[-1], [0xD163, 0xD30A])
+        self.assertIsNone(client.read_memory("0xD356"))
+        client.end_snapshot()
+
+        # Tick 2: the deferred badge byte goes first instead of starving; party waits a tick.
+        client.begin_scheduled_snapshot()
+        self.assertEqual(fetched[-1], [0xD30A, 0xD356])
+        self.assertEqual(client.read_memory("0xD356"), 0x56)
+        client.end_snapshot()
+
+        # Tick 3: badges are still fresh, and other threads reuse them without a wire read.
+        client.begin_scheduled_snapshot()
+        self.assertEqual(fetched[-1], [0xD163, 0xD30A])
+        client.end_snapshot()
+        seen_from_other_thread = []
+        worker = threading.Thread(target=lambda: seen_from_other_thread.append(client.read_memory("0xD356")))
+        worker.start()
+        worker.join()
+        self.assertEqual(seen_from_other_thread, [0x56])
+
+        # A game change drops cached bytes instead of serving the old game's RAM until the period expires.
+        status = {"text": "GET_STATUS PLAYING game_boy,Pokemon Red,crc32=1"}
+        client.send_command = lambda command: status["text"] if command == "GET_STATUS" else None
+        self.assertEqual(client.get_current_game(), "Pokemon Red")
+        self.assertEqual(client.read_memory("0xD356"), 0x56)
+        status["text"] = "GET_STATUS PLAYING game_boy,Pokemon Blue,crc32=2"
+        self.assertEqual(client.get_current_game(), "Pokemon Blue")
+        self.assertIsNone(client.read_memory("0xD356"))
+        client.send_command = lambda command: None
+
+        client.unsubscribe_regions("badges")
+        self.assertIsNone(client.read_memory("0xD356"))
+        self.assertEqual(client.get_subscription_stats()["deferred"], 2)
+
+    def test_poll_snapshot_serves_covered_reads_and_counts_misses(self):
+        client = RetroArchClient()
+        client.read_many = lambda ranges: {
+            int(addr, 16): [(int(addr, 16) + i) & 0xFF for i in range(length)] for addr, length in ranges
+        }
+        # Anything that reaches the wire reads as a timeout.
+        client.send_command = lambda command: None
+
+        client.begin_snapshot([("0xD30A", 19), ("0xD356", 1)])
+        self.assertEqual(client.read_memory("0xD356"), 0x56)
+        self.assertEqual(client.read_memory("0xD30B", 2), [0x0B, 0x0C])
+        self.assertIsNone(client.read_memory("0xF000"))
+
+        seen_from_other_thread = []
+        worker = threading.Thread(target=lambda: seen_from_other_thread.append(client.read_memory("0xD356")))
+        worker.start()
+        worker.join()
+        self.assertEqual(seen_from_other_thread, [None])
+
+        stats = client.end_snapshot()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(client.get_snapshot_stats()["snapshots"], 1)
+        self.assertIsNone(client.read_memory("0xD356"))
+
+    def test_check_achievements_prefetches_direct_reads_in_one_batch(self):
+        class BatchRetro(FakeRetroArch):
+            def __init__(self):
+                super().__init__()
+                self.single_reads = 0
+                self.batches = []
+
+            def read_memory(self, addr: str, num_bytes: int = 1):
+                self.single_reads += 1
+                return super().read_memory(addr, num_bytes)
+
+            def read_many(self, ranges):
+                self.batches.append(list(ranges))
+                return {int(addr): [0x01] for addr, _length in ranges}
+
+        retro = BatchRetro()
+        tracker = AchievementTracker(retroarch=retro, api=None)
+        tracker.game_name = "Pokemon Red"
+        tracker._derived_checker = FakeDerivedChecker()
+        tracker.validation_profiles = {"per_game": {"pokemon_red": {"unlock_warmup_polls": 0}}}
+        tracker.achievements = [
+            Achievement(id=f"red_story_{idx}", name=f"Story {idx}", description="", category="story", rarity="common",
+                        points=10, memory_address=hex(0xD5A0 + idx), memory_condition="& 0x01")
+            for idx in range(5)
+        ]
+        tracker.check_achievements()
+        self.assertEqual(len(retro.batches), 1)
+        self.assertEqual(len(retro.batches[0]), 5)
+        self.assertEqual(retro.single_reads, 0)
+
+    def test_compiled_conditions_match_condition_strings(self):
+        cases = [
+            (">= 3", 3, True), (">= 3", 2, False), ("<= 3", 4, False), ("> 0", 1, True), ("< 1", 0, True),
+            ("== 8", 8, True), ("!= 8", 8, False), ("& 0x80", 0x81, True), ("& 0x80", 0x7F, False),
+            ("& 3", 3, True), ("& 3", 2, False), (" >=10 ", 10, True), (">= abc", 99, False), ("", 1, False),
+        ]
+        for condition, value, expected in cases:
+            self.assertEqual(compile_memory_condition(condition)(value), expected, condition)
+            self.assertEqual(self.tracker.evaluate_condition(value, condition), expected, condition)
+
+    def test_evaluation_plan_shares_derived_inputs_across_achievements(self):
+        class CountingDerivedChecker(FakeDerivedChecker):
+            def __init__(self):
+                self.badge_checks = 0
+
+            def check_all_badges(self) -> bool:
+                self.badge_checks += 1
+                return False
+
+        tracker = AchievementTracker(retroarch=FakeRetroArch(), api=None)
+        tracker.game_name = "Pokemon Red"
+        checker = CountingDerivedChecker()
+        tracker._derived_checker = checker
+        tracker.validation_profiles = {"per_game": {"pokemon_red": {"unlock_warmup_polls": 0}}}
+        tracker.achievements = [
+            Achievement(id="red_gym_all", name="All Badges", description="", category="gym", rarity="rare",
+                        points=50, memory_address="0xD356", memory_condition="== 255"),
+            Achievement(id="red_pokemon_master", name="Master", description="", category="misc", rarity="legendary",
+                        points=100, memory_address="", memory_condition=""),
+            Achievement(id="red_story_flag", name="Flag", description="", category="story", rarity="common",
+                        points=10, memory_address="0xD5A0", memory_condition="& 0x01"),
+        ]
+        tracker.check_achievements()
+        self.assertEqual(checker.badge_checks, 1)
+        plan = tracker._evaluation_plan
+        self.assertEqual([check.kind for check in plan.checks], ["derived", "derived", "direct"])
+        self.assertEqual(plan.read_addresses(), [0xD5A0])
+
+        # Replacing the achievement list recompiles the plan on the next poll.
+        tracker.achievements = tracker.achievements[2:]
+        tracker.check_achievements()
+        self.assertEqual([check.achievement.id for check in tracker._evaluation_plan.checks], ["red_story_flag"])
+
+    def test_locked_achievements_skip_evaluation_until_inputs_change(self):
+        fake = FakeRetroArch()
+        tracker = AchievementTracker(retroarch=fake, api=None)
+        tracker.game_name = "Pokemon Red"
+        tracker._derived_checker = FakeDerivedChecker()
+        tracker.validation_profiles = {"per_game": {"pokemon_red": {"unlock_warmup_polls": 0}}}
+        caught = [1, 4, 7]
+        tracker._read_current_pokedex_caught = lambda: list(caught)
+        tracker.achievements = [
+            Achievement(id="red_story_flag", name="Flag", description="", category="story", rarity="common",
+                        points=10, memory_address="0xD5A0", memory_condition="& 0x01"),
+            Achievement(id="red_pokedex_10", name="Dex 10", description="", category="pokedex", rarity="common",
+                        points=10, memory_address="", memory_condition="", target_value=10),
+        ]
+        tracker.check_achievements()
+        self.assertEqual(tracker.get_incremental_eval_stats(), {"evaluated": 2, "skipped": 0})
+        tracker.check_achievements()
+        self.assertEqual(tracker.get_incremental_eval_stats(), {"evaluated": 2, "skipped": 2})
+
+        # A flipped flag re-evaluates only its own achievement, and keeps doing so while the streak runs.
+        fake.memory["0xd5a0"] = 0x01
+        unlocked = []
+        for _ in range(5):
+            unlocked.extend(tracker.check_achievements())
+            if unlocked:
+                break
+        self.assertEqual([ach.id for ach in unlocked], ["red_story_flag"])
+        stats = tracker.get_incremental_eval_stats()
+        self.assertEqual(stats["evaluated"] - 2, stats["skipped"] - 2)
+
+        caught.extend(range(10, 17))
+        self.assertEqual([ach.id for ach in tracker.check_achievements()], ["red_pokedex_10"])
+
+    def test_derived_checker_reads_pokedex_bitfield_once_per_poll(self):
+        class CountingRetroArch(FakeRetroArch):
+            def __init__(self):
+                super().__init__()
+                self.reads = 0
+
+            def read_memory(self, addr: str, num_bytes: int = 1):
+                self.reads += 1
+                return super().read_memory(addr, num_bytes)
+
+        fake = CountingRetroArch()
+        base = 0xD30A
+        for pokemon_id in (1, 144, 145, 146, 150):
+            addr = hex(base + (pokemon_id - 1) // 8)
+            fake.memory[addr] = fake.memory.get(addr, 0) | (1 << ((pokemon_id - 1) % 8))
+        checker = DerivedAchievementChecker(fake, "Pokemon Red")
+
+        checker.begin_poll()
+        self.assertEqual(checker.read_pokedex_caught(), [1, 144, 145, 146, 150])
+        self.assertEqual(checker.get_caught_count(), 5)
+        self.assertTrue(checker.check_legendary_caught("mewtwo"))
+        self.assertFalse(checker.check_legendary_caught("mew"))
+        self.assertTrue(checker.check_all_legendary_birds())
+        self.assertTrue(checker.check_all_legendaries())
+        checker.end_poll()
+        self.assertEqual(fake.reads, 1)
+
+        # Outside a poll every call reads fresh memory.
+        fake.memory[hex(base + 18)] = 0x40  # Mew (#151)
+        self.assertTrue(checker.check_legendary_caught("mew"))
+        self.assertEqual(fake.reads, 2)
+
+        bitset = PokedexBitset.from_bytes([0xFF, 0x01, 0xFF], max_pokemon=9)
+        self.assertEqual(bitset.count(), 9)
+        self.assertTrue(bitset.has_all((1, 9)))
+        self.assertFalse(bitset.has(10))
+
+        # A check that raises mid-poll must not leave the per-poll bitfield behind.
+        tracker = AchievementTracker(retroarch=fake, api=None)
+        tracker.game_name = "Pokemon Red"
+        tracker._derived_checker = checker
+        tracker.validation_profiles = {"per_game": {"pokemon_red": {"unlock_warmup_polls": 0}}}
+        tracker.achievements = [
+            Achievement(id="red_pokedex_10", name="Dex 10", description="", category="pokedex", rarity="common",
+                        points=10, memory_address="", memory_condition="", target_value=10),
+        ]
+
+        def failing_check(achievement):
+            raise RuntimeError("decode failed")
+
+        tracker._check_derived_achievement = failing_check
+        with self.assertRaises(RuntimeError):
+            tracker.check_achievements()
+        self.assertFalse(checker._poll_active)
+        self.assertIsNone(tracker._derived_poll_memo)
+        self.assertEqual(tracker._achievement_read_cache, {})
+
+    def test_gen3_event_flags_batch_from_one_region_read(self):
+        class CountingRetroArch(FakeRetroArch):
+            def __init__(self):
+                super().__init__()
+                self.reads = 0
+
+            def read_memory(self, addr: str, num_bytes: int = 1):
+                self.reads += 1
+                return super().read_memory(addr, num_bytes)
+
+        fake = CountingRetroArch()
+        tracker = AchievementTracker(retroarch=fake, api=None)
+        tracker.game_name = "Pokemon Emerald"
+        reader = tracker.pokemon_reader
+        saveblock1 = 0x02025A00
+        reader._resolve_gen3_saveblock1_base = lambda config, game_name=None: saveblock1
+        flags_base = saveblock1 + 0x1270
+        # Gym flags 0xA5..0xA7 set; 0xA8 clear.
+        fake.memory[hex(flags_base + 0xA5 // 8)] = 0xE0
+        gym_flags = [0xA5, 0xA6, 0xA7, 0xA8, 0xA9, 0xAA, 0xAB, 0xAC]
+
+        states = reader.read_gen3_event_flags("Pokemon Emerald", gym_flags)
+        self.assertEqual(fake.reads, 1)
+        self.assertEqual([states[flag] for flag in gym_flags], [True, True, True] + [False] * 5)
+        self.assertIs(reader.read_gen3_event_flag("Pokemon Emerald", 0xA6), True)
+        self.assertEqual(tracker._read_gen3_gym_progress_count(), 3)
+
+        gained, lost = diff_flag_ids([1, 4, 7, 25], [1, 4, 150, 25, 151])
+        self.assertEqual(gained, [150, 151])
+        self.assertEqual(lost, [7])
+        self.assertEqual(diff_flag_ids([3, 1], [1, 3]), ([], []))
+
+    def test_game_layout_is_precompiled_once_per_config(self):
+        tracker = AchievementTracker(retroarch=FakeRetroArch(), api=None)
+        reader = tracker.pokemon_reader
+        config = reader.get_game_config("Pokemon Emerald")
+        self.assertIs(reader.get_game_config("Pokemon Emerald"), config)
+
+        layout = reader.get_game_layout("Pokemon Emerald")
+        self.assertIs(reader.get_game_layout("Pokemon Emerald"), layout)
+        self.assertEqual(layout.gen, 3)
+        self.assertEqual(layout.party_count, int(config["party_count"], 16))
+        self.assertEqual(layout.saveblock1_flags_offset, 0x1270)
+        self.assertEqual(layout.pokedex_bytes, 49)
+        with self.assertRaises(Exception):
+            layout.gen = 2
+
+        # A different config dict (e.g. a patched getter) yields a fresh layout.
+        reader.get_game_config = lambda game_name: {"gen": 1, "party_count": "0xD163", "party_slot_size": 44}
+        patched = reader.get_game_layout("Pokemon Emerald")
+        self.assertIsNot(patched, layout)
+        self.assertEqual((patched.gen, patched.party_count, patched.max_pokemon), (1, 0xD163, 151))
+
+    def test_saveblock_pointer_resolved_once_per_poll_and_relocation_counted(self):
+        fake = FakeRetroArch()
+        tracker = AchievementTracker(retroarch=fake, api=None)
+        tracker.game_name = "Pokemon Emerald"
+        reader = tracker.pokemon_reader
+        pointer = reader.get_game_config("Pokemon Emerald")["saveblock1_ptr"]
+
+        def place_saveblock(base: int):
+            for index, value in enumerate(base.to_bytes(4, "little")):
+                fake.memory[hex(int(pointer, 16) + index)] = value
+
+        place_saveblock(0x02025A00)
+        tracker._begin_poll_snapshot()
+        try:
+            for _ in range(3):
+                self.assertEqual(reader._resolve_gen3_saveblock_ptr(pointer, game_name="Pokemon Emerald"), 0x02025A00)
+        finally:
+            tracker._end_poll_snapshot()
+        self.assertEqual(reader.get_saveblock_pointer_stats(), {"reads": 1, "shared": 2, "relocations": 0})
+
+        place_saveblock(0x02025B40)
+        tracker._begin_poll_snapshot()
+        try:
+            self.assertEqual(reader._resolve_gen3_saveblock_ptr(pointer, game_name="Pokemon Emerald"), 0x02025B40)
+            # Another thread (Tk hunt/location reads) during the poll re-reads instead of sharing the poll's value.
+            place_saveblock(0x02025C80)
+            seen = []
+            worker = threading.Thread(target=lambda: seen.append(reader._resolve_gen3_saveblock_ptr(pointer, game_name="Pokemon Emerald")))
+            worker.start()
+            worker.join(timeout=2.0)
+            self.assertEqual(seen, [0x02025C80])
+        finally:
+            tracker._end_poll_snapshot()
+        self.assertEqual(reader.get_saveblock_pointer_stats(), {"reads": 3, "shared": 2, "relocations": 2})
+
     def test_unlock_reporting_retries_with_numeric_id(self):
         api = StubAPI()
         ok, data = api.post_unlock(3, "emerald_pokedex_complete", "Hoenn Completionist")
@@ -17,16 +17,24 @@ import shutil
 import base64
 import io
 import math
+import mmap
 import colorsys
 import difflib
+import functools
+import itertools
+import struct
+import bisect
+import copy
 from collections import Counter, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager, nullcontext
 import urllib.request
 import urllib.error
 from urllib.parse import urlparse, urlunparse
 import logging
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, Tuple, Set
+from typing import Any, Dict, Iterable, List, Optional, Callable, Tuple, Set
 from datetime import datetime
 from hashlib import sha256
 from dataclasses import dataclass, asdict
@@ -255,7 +263,8 @@ def log_event(log_level: int, event: str, **fields):
 
 
 _LEGACY_ITEM_MAPPINGS_CACHE: Optional[Dict[str, Dict[int, Dict[str, object]]]] = None
-_LEGACY_ITEM_MAPPINGS_LOCK = threading.Lock()
+_LEGACY_ITEM_MAPPINGS_LOCK = threading.RLock()
+_LEGACY_ITEM_VARIANT_CACHE: Dict[str, Dict[int, Dict[str, object]]] = {}
 _GEN2_LEGACY_ITEM_NAME_OVERRIDES: Dict[int, str] = {
     # GSC uses a legacy "BERRY" item; avoid cross-generation fallback to modern berry IDs.
     173: "Berry",
@@ -376,6 +385,308 @@ _GEN2_GSC_LOCATION_BY_GROUP_MAPNUM: Dict[Tuple[int, int], str] = {
     (25, 1): "Route 5", (25, 2): "Saffron City",
     (26, 1): "Route 30", (26, 2): "Route 31", (26, 3): "Cherrygrove City",
 }
+REFERENCE_BUNDLE_FILENAME = "reference_data.bundle"
+REFERENCE_BUNDLE_MAGIC = b"PKRB"
+REFERENCE_BUNDLE_VERSION = 1
+REFERENCE_KIND_INT_TABLE = 1
+REFERENCE_KIND_STR_TABLE = 2
+REFERENCE_KIND_JSON = 3
+_REFERENCE_BUNDLE_HEADER = struct.Struct("<4sHH")
+# kind, name length, source length, payload offset, payload length, source sha256
+_REFERENCE_BUNDLE_ENTRY = struct.Struct("<BHHII32s")
+_REFERENCE_TABLE_HEADER = struct.Struct("<HI")
+_REFERENCE_STR_ROW = struct.Struct("<iII")
+_REFERENCE_BUNDLE: Optional["ReferenceDataBundle"] = None
+_REFERENCE_BUNDLE_LOADED = False
+_REFERENCE_BUNDLE_LOCK = threading.Lock()
+
+
+def _reference_source_digest(raw: bytes) -> bytes:
+    """sha256 of a JSON source with CRLF folded to LF, so a Windows checkout still matches the bundle."""
+    return sha256(bytes(raw).replace(b"\r\n", b"\n")).digest()
+
+
+class ReferenceDataBundle:
+    """Memory-mapped view of the compiled reference bundle (see scripts/build_reference_bundle.py).
+
+    The JSON files stay the source of truth: each section records the sha256 of the
+    file it was compiled from, and a section whose source has since changed is
+    reported stale so callers fall back to parsing the JSON. Sections decode on
+    first access, so a Gen 1 session never touches Gen 3 or hunt catalog data.
+    """
+
+    def __init__(self, path: Path, source_dir: Path, payload: object):
+        self.path = Path(path)
+        self.source_dir = Path(source_dir)
+        self._payload = payload
+        self._sections: Dict[str, Tuple[int, str, int, int, bytes]] = {}
+        self._source_current: Dict[str, bool] = {}
+        self._decoded: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+        magic, version, count = _REFERENCE_BUNDLE_HEADER.unpack_from(payload, 0)
+        if magic != REFERENCE_BUNDLE_MAGIC or version != REFERENCE_BUNDLE_VERSION:
+            raise ValueError(f"unsupported reference bundle {magic!r} v{version}")
+        cursor = _REFERENCE_BUNDLE_HEADER.size
+        for _ in range(count):
+            kind, name_len, source_len, offset, length, digest = _REFERENCE_BUNDLE_ENTRY.unpack_from(payload, cursor)
+            cursor += _REFERENCE_BUNDLE_ENTRY.size
+            name = bytes(payload[cursor:cursor + name_len]).decode("utf-8")
+            cursor += name_len
+            source = bytes(payload[cursor:cursor + source_len]).decode("utf-8")
+            cursor += source_len
+            self._sections[name] = (int(kind), source, int(offset), int(length), bytes(digest))
+
+    @classmethod
+    def open(cls, path: Path, source_dir: Optional[Path] = None) -> Optional["ReferenceDataBundle"]:
+        """Map a bundle file; None when it is missing, empty or an unsupported version."""
+        path = Path(path)
+        if not path.is_file():
+            return None
+        try:
+            with open(path, "rb") as handle:
+                payload: object = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            try:
+                payload = path.read_bytes()
+            except OSError:
+                return None
+        try:
+            return cls(path, Path(source_dir) if source_dir is not None else path.parent, payload)
+        except (ValueError, UnicodeDecodeError, struct.error) as exc:
+            log_event(logging.WARNING, "reference_bundle_unusable", path=str(path), error=str(exc))
+            return None
+
+    def close(self) -> None:
+        """Release the mapping; sections already decoded stay available."""
+        with self._lock:
+            if isinstance(self._payload, mmap.mmap):
+                self._payload.close()
+            self._payload = None
+
+    def section_names(self) -> List[str]:
+        return sorted(self._sections)
+
+    def has_section(self, name: str) -> bool:
+        return name in self._sections
+
+    def _source_matches(self, source: str, digest: bytes) -> bool:
+        if source not in self._source_current:
+            source_path = self.source_dir / source
+            try:
+                current = _reference_source_digest(source_path.read_bytes()) == digest
+            except OSError:
+                # Bundle shipped without its JSON sources; it is all there is to read.
+                current = True
+            if not current:
+                log_event(logging.INFO, "reference_bundle_stale", source=source, bundle=str(self.path))
+            self._source_current[source] = current
+        return self._source_current[source]
+
+    def section(self, name: str, cache: bool = True) -> Optional[object]:
+        """Decode one section: int tables -> row tuples, string tables -> {id: str}, json -> object.
+
+        cache=False returns a fresh object each call, for callers that mutate what they get.
+        """
+        entry = self._sections.get(name)
+        if entry is None:
+            return None
+        with self._lock:
+            if name in self._decoded:
+                return self._decoded[name]
+            if self._payload is None:
+                return None
+            kind, source, offset, length, digest = entry
+            if source and not self._source_matches(source, digest):
+                return None
+            view = memoryview(self._payload)[offset:offset + length]
+            try:
+                if kind == REFERENCE_KIND_INT_TABLE:
+                    columns, rows = _REFERENCE_TABLE_HEADER.unpack_from(view, 0)
+                    row_format = struct.Struct("<" + "i" * int(columns))
+                    body = view[_REFERENCE_TABLE_HEADER.size:_REFERENCE_TABLE_HEADER.size + row_format.size * int(rows)]
+                    decoded: object = list(row_format.iter_unpack(body))
+                elif kind == REFERENCE_KIND_STR_TABLE:
+                    _, rows = _REFERENCE_TABLE_HEADER.unpack_from(view, 0)
+                    blob_start = _REFERENCE_TABLE_HEADER.size + _REFERENCE_STR_ROW.size * int(rows)
+                    blob = bytes(view[blob_start:])
+                    decoded = {
+                        int(key): blob[start:start + size].decode("utf-8")
+                        for key, start, size in _REFERENCE_STR_ROW.iter_unpack(view[_REFERENCE_TABLE_HEADER.size:blob_start])
+                    }
+                elif kind == REFERENCE_KIND_JSON:
+                    decoded = json.loads(bytes(view).decode("utf-8"))
+                else:
+                    return None
+            except (ValueError, UnicodeDecodeError, struct.error) as exc:
+                log_event(logging.WARNING, "reference_bundle_section_unreadable", section=name, error=str(exc))
+                return None
+            finally:
+                view.release()
+            if cache:
+                self._decoded[name] = decoded
+            return decoded
+
+
+def build_reference_bundle(source_dir: Path, out_path: Path) -> Dict[str, int]:
+    """Compile the reference JSON files in source_dir into one bundle; returns payload bytes per section."""
+    source_dir = Path(source_dir)
+    sections: List[Tuple[str, int, str, bytes, bytes]] = []
+
+    def _source(name: str) -> Tuple[object, bytes]:
+        raw = (source_dir / name).read_bytes()
+        return json.loads(raw.decode("utf-8")), _reference_source_digest(raw)
+
+    def _int_table(rows: List[Tuple[int, ...]], columns: int) -> bytes:
+        row_format = struct.Struct("<" + "i" * columns)
+        return _REFERENCE_TABLE_HEADER.pack(columns, len(rows)) + b"".join(row_format.pack(*row) for row in sorted(rows))
+
+    def _str_table(mapping: Dict[int, str]) -> bytes:
+        rows = bytearray()
+        blob = bytearray()
+        for key in sorted(mapping):
+            encoded = mapping[key].encode("utf-8")
+            rows += _REFERENCE_STR_ROW.pack(key, len(blob), len(encoded))
+            blob += encoded
+        return _REFERENCE_TABLE_HEADER.pack(1, len(mapping)) + bytes(rows) + bytes(blob)
+
+    def _json(value: object) -> bytes:
+        return json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+    # Gen 3 tables are stored already normalized the way PokemonMemoryReader._load_gen3_reference_data_from_json
+    # normalizes them, so loading is a straight unpack.
+    def _int_pairs(payload: object, positive_only: bool = False) -> List[Tuple[int, int]]:
+        rows = []
+        for key, value in (payload.items() if isinstance(payload, dict) else ()):
+            try:
+                row = (int(key), int(value))
+            except (TypeError, ValueError):
+                continue
+            if positive_only and (row[0] <= 0 or row[1] <= 0):
+                continue
+            rows.append(row)
+        return rows
+
+    payload, digest = _source("gen3_gender_map.json")
+    sections.append(("gen3/gender_map", REFERENCE_KIND_INT_TABLE, "gen3_gender_map.json", digest, _int_table(_int_pairs(payload), 2)))
+    payload, digest = _source("gen3_internal_to_national.json")
+    sections.append(("gen3/internal_to_national", REFERENCE_KIND_INT_TABLE, "gen3_internal_to_national.json", digest, _int_table(_int_pairs(payload, positive_only=True), 2)))
+
+    payload, digest = _source("gen3_species_abilities.json")
+    ability_rows: List[Tuple[int, int, int]] = []
+    for key, value in (payload.items() if isinstance(payload, dict) else ()):
+        try:
+            species_id = int(key)
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(value, list):
+            continue
+        pair = [0, 0]
+        for index, raw_ability in enumerate(value[:2]):
+            try:
+                pair[index] = int(raw_ability)
+            except (TypeError, ValueError):
+                pair[index] = 0
+        ability_rows.append((species_id, pair[0], pair[1]))
+    sections.append(("gen3/species_abilities", REFERENCE_KIND_INT_TABLE, "gen3_species_abilities.json", digest, _int_table(ability_rows, 3)))
+
+    for stem in ("ability_names", "move_names"):
+        name = f"gen3_{stem}.json"
+        payload, digest = _source(name)
+        names: Dict[int, str] = {}
+        for key, value in (payload.items() if isinstance(payload, dict) else ()):
+            try:
+                name_id = int(key)
+            except (TypeError, ValueError):
+                continue
+            rendered = PokemonMemoryReader._humanize_identifier(str(value))
+            if rendered:
+                names[name_id] = rendered
+        sections.append((f"gen3/{stem}", REFERENCE_KIND_STR_TABLE, name, digest, _str_table(names)))
+
+    payload, digest = _source("legacy_item_mappings.json")
+    raw_maps = payload.get("maps") if isinstance(payload, dict) and isinstance(payload.get("maps"), dict) else {}
+    variants: List[str] = []
+    for raw_variant, raw_variant_map in raw_maps.items():
+        variant = str(raw_variant).strip().lower()
+        if not variant or not isinstance(raw_variant_map, dict):
+            continue
+        rows = [
+            [item_game_id, entry["item_id"], entry["name"], entry["identifier"]]
+            for item_game_id, entry in sorted(_normalize_legacy_item_variant(raw_variant_map).items())
+        ]
+        variants.append(variant)
+        sections.append((f"legacy_items/{variant}", REFERENCE_KIND_JSON, "legacy_item_mappings.json", digest, _json(rows)))
+    sections.append(("legacy_items", REFERENCE_KIND_JSON, "legacy_item_mappings.json", digest, _json(sorted(variants))))
+
+    payload, digest = _source("hunt_encounter_catalog.json")
+    games = [game for game, block in (payload.items() if isinstance(payload, dict) else ()) if isinstance(block, dict)]
+    for game in games:
+        sections.append((f"hunt/{game}", REFERENCE_KIND_JSON, "hunt_encounter_catalog.json", digest, _json(payload[game])))
+    sections.append(("hunt", REFERENCE_KIND_JSON, "hunt_encounter_catalog.json", digest, _json(sorted(games))))
+
+    toc_size = _REFERENCE_BUNDLE_HEADER.size + sum(
+        _REFERENCE_BUNDLE_ENTRY.size + len(name.encode("utf-8")) + len(source.encode("utf-8"))
+        for name, _, source, _, _ in sections
+    )
+    toc = bytearray(_REFERENCE_BUNDLE_HEADER.pack(REFERENCE_BUNDLE_MAGIC, REFERENCE_BUNDLE_VERSION, len(sections)))
+    body = bytearray()
+    sizes: Dict[str, int] = {}
+    for name, kind, source, digest, section_payload in sections:
+        name_bytes = name.encode("utf-8")
+        source_bytes = source.encode("utf-8")
+        toc += _REFERENCE_BUNDLE_ENTRY.pack(kind, len(name_bytes), len(source_bytes), toc_size + len(body), len(section_payload), digest)
+        toc += name_bytes + source_bytes
+        body += section_payload
+        sizes[name] = len(section_payload)
+
+    out_path = Path(out_path)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    tmp_path.write_bytes(bytes(toc) + bytes(body))
+    os.replace(tmp_path, out_path)
+    return sizes
+
+
+def _get_reference_bundle() -> Optional[ReferenceDataBundle]:
+    """Open the bundle next to tracker_gui.py once per process (None when absent)."""
+    global _REFERENCE_BUNDLE, _REFERENCE_BUNDLE_LOADED
+    if _REFERENCE_BUNDLE_LOADED:
+        return _REFERENCE_BUNDLE
+    with _REFERENCE_BUNDLE_LOCK:
+        if not _REFERENCE_BUNDLE_LOADED:
+            _REFERENCE_BUNDLE = ReferenceDataBundle.open(Path(__file__).resolve().parent / REFERENCE_BUNDLE_FILENAME)
+            _REFERENCE_BUNDLE_LOADED = True
+    return _REFERENCE_BUNDLE
+
+
+def _normalize_legacy_item_variant(raw_variant_map: Dict) -> Dict[int, Dict[str, object]]:
+    normalized_variant: Dict[int, Dict[str, object]] = {}
+    for raw_id, raw_entry in raw_variant_map.items():
+        try:
+            item_game_id = int(raw_id)
+        except (TypeError, ValueError):
+            continue
+        if item_game_id <= 0 or not isinstance(raw_entry, dict):
+            continue
+        try:
+            canonical_item_id = int(raw_entry.get("item_id", 0) or 0)
+        except (TypeError, ValueError):
+            canonical_item_id = 0
+        if canonical_item_id <= 0:
+            continue
+
+        entry_name = raw_entry.get("name")
+        item_name = str(entry_name).strip() if isinstance(entry_name, str) and str(entry_name).strip() else f"Item #{canonical_item_id}"
+        entry_identifier = raw_entry.get("identifier")
+        item_identifier = str(entry_identifier).strip().lower() if isinstance(entry_identifier, str) and str(entry_identifier).strip() else ""
+        normalized_variant[item_game_id] = {
+            "item_id": canonical_item_id,
+            "name": item_name,
+            "identifier": item_identifier,
+        }
+    return normalized_variant
+
+
 def _load_legacy_item_mappings() -> Dict[str, Dict[int, Dict[str, object]]]:
     global _LEGACY_ITEM_MAPPINGS_CACHE
     if _LEGACY_ITEM_MAPPINGS_CACHE is not None:
@@ -402,36 +713,40 @@ def _load_legacy_item_mappings() -> Dict[str, Dict[int, Dict[str, object]]]:
                 variant = str(raw_variant).strip().lower()
                 if not variant:
                     continue
-                normalized_variant: Dict[int, Dict[str, object]] = {}
-                for raw_id, raw_entry in raw_variant_map.items():
-                    try:
-                        item_game_id = int(raw_id)
-                    except (TypeError, ValueError):
-                        continue
-                    if item_game_id <= 0 or not isinstance(raw_entry, dict):
-                        continue
-                    try:
-                        canonical_item_id = int(raw_entry.get("item_id", 0) or 0)
-                    except (TypeError, ValueError):
-                        canonical_item_id = 0
-                    if canonical_item_id <= 0:
-                        continue
-
-                    entry_name = raw_entry.get("name")
-                    item_name = str(entry_name).strip() if isinstance(entry_name, str) and str(entry_name).strip() else f"Item #{canonical_item_id}"
-                    entry_identifier = raw_entry.get("identifier")
-                    item_identifier = str(entry_identifier).strip().lower() if isinstance(entry_identifier, str) and str(entry_identifier).strip() else ""
-                    normalized_variant[item_game_id] = {
-                        "item_id": canonical_item_id,
-                        "name": item_name,
-                        "identifier": item_identifier,
-                    }
-                normalized[variant] = normalized_variant
+                normalized[variant] = _normalize_legacy_item_variant(raw_variant_map)
 
         _LEGACY_ITEM_MAPPINGS_CACHE = normalized
         return normalized
 
 
+def _load_legacy_item_variant(variant: str) -> Dict[int, Dict[str, object]]:
+    """Item mapping for one game variant, from its bundle section when current, else the full JSON."""
+    cached = _LEGACY_ITEM_VARIANT_CACHE.get(variant)
+    if cached is not None:
+        return cached
+
+    with _LEGACY_ITEM_MAPPINGS_LOCK:
+        cached = _LEGACY_ITEM_VARIANT_CACHE.get(variant)
+        if cached is not None:
+            return cached
+        if _LEGACY_ITEM_MAPPINGS_CACHE is None:
+            bundle = _get_reference_bundle()
+            variants = bundle.section("legacy_items") if bundle is not None else None
+            if isinstance(variants, list):
+                rows = bundle.section(f"legacy_items/{variant}") if variant in variants else []
+                if isinstance(rows, list):
+                    mapping = {
+                        int(row[0]): {"item_id": int(row[1]), "name": str(row[2]), "identifier": str(row[3])}
+                        for row in rows
+                    }
+                    _LEGACY_ITEM_VARIANT_CACHE[variant] = mapping
+                    return mapping
+        # Re-entrant lock: the whole-file loader takes it again.
+        mapping = _load_legacy_item_mappings().get(variant, {})
+        _LEGACY_ITEM_VARIANT_CACHE[variant] = mapping
+        return mapping
+
+
 def _resolve_canonical_held_item(
     game_name: str,
     raw_item_id: int,
@@ -472,8 +787,7 @@ def _resolve_canonical_held_item(
         }
 
     variant = _party_game_variant_from_name(game_name)
-    mappings = _load_legacy_item_mappings()
-    variant_map = mappings.get(variant, {})
+    variant_map = _load_legacy_item_variant(variant)
     entry = variant_map.get(raw_id) if isinstance(variant_map, dict) else None
 
     if family == "gen2" and raw_id in _GEN2_LEGACY_ITEM_NAME_OVERRIDES:
@@ -640,6 +954,102 @@ class Achievement:
     unlocked_at: Optional[str] = None
 
 
+_CONDITION_OPERATORS: Tuple[Tuple[str, Callable[[int, int], bool]], ...] = (
+    (">=", lambda value, target: value >= target),
+    ("<=", lambda value, target: value <= target),
+    (">", lambda value, target: value > target),
+    ("<", lambda value, target: value < target),
+    ("==", lambda value, target: value == target),
+    ("!=", lambda value, target: value != target),
+)
+
+
+def _never_true(_value: int) -> bool:
+    return False
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_memory_condition(condition: str) -> Callable[[int], bool]:
+    """Parse an achievement ``memory_condition`` (">= 3", "& 0x80", ...) once into a predicate."""
+    condition = str(condition or "").strip()
+    for prefix, compare in _CONDITION_OPERATORS:
+        if condition.startswith(prefix):
+            try:
+                target = int(condition[len(prefix):].strip())
+            except ValueError:
+                return _never_true
+            return lambda value, _target=target, _compare=compare: _compare(value, _target)
+    if condition.startswith("&"):
+        try:
+            mask = int(condition[1:].strip(), 16) if "x" in condition else int(condition[1:].strip())
+        except ValueError:
+            return _never_true
+        return lambda value, _mask=mask: (value & _mask) == _mask
+    return _never_true
+
+
+@dataclass
+class CompiledAchievementCheck:
+    """One achievement's pre-resolved evaluation step (see AchievementTracker._compile_evaluation_plan)."""
+    achievement: Achievement
+    kind: str  # "derived", "gen3_story" or "direct"
+    address: Optional[int] = None
+    predicate: Optional[Callable[[int], bool]] = None
+    # Memory inputs the result depends on: ("byte", address) or ("dex", 0); None means always re-evaluate.
+    inputs: Optional[Tuple[Tuple[str, int], ...]] = None
+
+
+@dataclass
+class AchievementEvaluationPlan:
+    signature: Tuple[object, ...]
+    checks: List[CompiledAchievementCheck]
+    # Extra bytes every poll needs besides direct achievement addresses (Gen 3 badge byte).
+    shared_addresses: Tuple[int, ...] = ()
+
+    def read_addresses(self) -> List[int]:
+        """Addresses for this poll's batched read: locked direct/story checks plus shared inputs."""
+        addresses = {
+            check.address
+            for check in self.checks
+            if check.kind in {"direct", "gen3_story"} and check.address is not None and not check.achievement.unlocked
+        }
+        addresses.update(self.shared_addresses)
+        return sorted(addresses)
+
+
+def flag_bits_from_ids(ids: Iterable[int]) -> int:
+    """Pack 1-based flag ids (e.g. National Dex numbers) into one integer bitset."""
+    bits = 0
+    for flag_id in ids:
+        if isinstance(flag_id, int) and flag_id >= 1:
+            bits |= 1 << (flag_id - 1)
+    return bits
+
+
+def flag_ids_from_bits(bits: int) -> List[int]:
+    """Ascending 1-based ids of the set bits in an integer bitset."""
+    found: List[int] = []
+    while bits:
+        low = bits & -bits
+        found.append(low.bit_length())
+        bits ^= low
+    return found
+
+
+def diff_flag_ids(previous: List[int], current: List[int]) -> Tuple[List[int], List[int]]:
+    """(gained, lost) ids between two flag snapshots from one XOR; each keeps its source order."""
+    previous_bits = flag_bits_from_ids(previous)
+    current_bits = flag_bits_from_ids(current)
+    changed = previous_bits ^ current_bits
+    if not changed:
+        return [], []
+    gained_bits = changed & current_bits
+    lost_bits = changed & previous_bits
+    gained = [p for p in current if isinstance(p, int) and p >= 1 and (gained_bits >> (p - 1)) & 1]
+    lost = [p for p in previous if isinstance(p, int) and p >= 1 and (lost_bits >> (p - 1)) & 1]
+    return gained, lost
+
+
 @dataclass
 class Pokemon:
     id: int
@@ -1092,6 +1502,334 @@ class PokeAchieveAPI:
         return success, data
 
 
+class RetroArchMemorySnapshot:
+    """Point-in-time copy of hot RAM regions served to reads for one poll cycle."""
+
+    def __init__(self, regions: Dict[int, object]):
+        self._regions: List[Tuple[int, int, bytes]] = []
+        for start, values in sorted((regions or {}).items()):
+            try:
+                data = bytes(values) if isinstance(values, (bytes, bytearray, memoryview)) else bytes(int(v) & 0xFF for v in values)
+            except (TypeError, ValueError):
+                continue
+            if data:
+                self._regions.append((int(start), int(start) + len(data), data))
+        self.created_at = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def region_count(self) -> int:
+        return len(self._regions)
+
+    @property
+    def byte_count(self) -> int:
+        return sum(len(data) for _start, _end, data in self._regions)
+
+    def lookup(self, address: int, num_bytes: int) -> Optional[bytes]:
+        """Return snapshot bytes when the whole range is covered, counting a hit or miss."""
+        end = int(address) + int(num_bytes)
+        for start, region_end, data in self._regions:
+            if start <= int(address) and end <= region_end:
+                self.hits += 1
+                return data[int(address) - start:end - start]
+        self.misses += 1
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": int(self.hits),
+            "misses": int(self.misses),
+            "regions": int(self.region_count),
+            "bytes": int(self.byte_count),
+        }
+
+
+class RetroArchRegionScheduler:
+    """RAM regions subscribed by readers, each with its own refresh period and fetch priority.
+
+    ``due`` picks what to fetch on a poll tick (lowest priority value first, within a byte budget);
+    ``lookup`` serves any thread from bytes still younger than the region's period.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # owner -> {address: (length, period_s, priority)}
+        self._owners: Dict[str, Dict[int, Tuple[int, float, int]]] = {}
+        # address -> merged subscription state
+        self._regions: Dict[int, Dict[str, object]] = {}
+        self.stats: Dict[str, int] = {"ticks": 0, "fetched": 0, "reused": 0, "deferred": 0, "failed": 0, "bytes_fetched": 0, "bytes_reused": 0, "lookup_hits": 0}
+
+    def subscribe(self, owner: str, regions: List[Tuple[object, int]], period_s: float = 0.0, priority: int = 10):
+        """Replace ``owner``'s regions; cached bytes survive when a region keeps its address and length."""
+        declared: Dict[int, Tuple[int, float, int]] = {}
+        for raw_addr, raw_len in regions or []:
+            try:
+                address = int(raw_addr) if isinstance(raw_addr, int) else int(str(raw_addr), 16)
+                length = int(raw_len)
+            except (TypeError, ValueError):
+                continue
+            if address < 0 or length <= 0:
+                continue
+            previous = declared.get(address)
+            declared[address] = (max(length, previous[0] if previous else 0), max(0.0, float(period_s)), int(priority))
+        with self._lock:
+            if declared:
+                self._owners[str(owner)] = declared
+            else:
+                self._owners.pop(str(owner), None)
+            self._rebuild_locked()
+
+    def unsubscribe(self, owner: Optional[str] = None):
+        with self._lock:
+            if owner is None:
+                self._owners.clear()
+            else:
+                self._owners.pop(str(owner), None)
+            self._rebuild_locked()
+
+    def _rebuild_locked(self):
+        merged: Dict[int, Dict[str, object]] = {}
+        for declared in self._owners.values():
+            for address, (length, period_s, priority) in declared.items():
+                entry = merged.get(address)
+                if entry is None:
+                    merged[address] = {"length": length, "period_s": period_s, "priority": priority}
+                    continue
+                entry["length"] = max(int(entry["length"]), length)
+                entry["period_s"] = min(float(entry["period_s"]), period_s)
+                entry["priority"] = min(int(entry["priority"]), priority)
+        for address, entry in merged.items():
+            old = self._regions.get(address)
+            if old is not None and int(old["length"]) == int(entry["length"]):
+                entry["data"] = old.get("data")
+                entry["fetched_at"] = old.get("fetched_at", 0.0)
+            else:
+                entry["data"] = None
+                entry["fetched_at"] = 0.0
+        self._regions = merged
+
+    def has_subscriptions(self) -> bool:
+        return bool(self._regions)
+
+    def due(self, now: float, byte_budget: int = 0) -> List[Tuple[int, int]]:
+        """Regions to fetch this tick: stale or never read, by priority then age, within ``byte_budget``.
+
+        A region deferred by the budget jumps the queue on the next tick, so low-priority regions are
+        late by at most one tick instead of starving; ``byte_budget`` of 0 means unlimited.
+        """
+        with self._lock:
+            stale = [
+                (0 if entry.get("deferred") else 1, int(entry["priority"]), float(entry["fetched_at"]), address, int(entry["length"]))
+                for address, entry in self._regions.items()
+                if entry.get("data") is None or (float(now) - float(entry["fetched_at"])) >= float(entry["period_s"])
+            ]
+            stale.sort()
+            selected: List[Tuple[int, int]] = []
+            budget_used = 0
+            for deferred_rank, _priority, _fetched_at, address, length in stale:
+                over_budget = int(byte_budget) > 0 and budget_used + length > int(byte_budget)
+                # Rank 0 means the region already waited a tick; fetch it regardless of budget.
+                if selected and over_budget and deferred_rank:
+                    self._regions[address]["deferred"] = True
+                    self.stats["deferred"] += 1
+                    continue
+                self._regions[address]["deferred"] = False
+                selected.append((address, length))
+                budget_used += length
+            self.stats["ticks"] += 1
+            self.stats["reused"] += len(self._regions) - len(stale)
+            self.stats["bytes_reused"] += sum(int(entry["length"]) for entry in self._regions.values()) - sum(item[4] for item in stale)
+        return selected
+
+    def store(self, requested: List[Tuple[int, int]], results: Dict[int, bytes], now: float):
+        with self._lock:
+            for address, length in requested:
+                entry = self._regions.get(address)
+                if entry is None:
+                    continue
+                data = results.get(address)
+                if data is None or len(data) < length:
+                    # Drop stale bytes so readers go to the wire instead of trusting them.
+                    entry["data"] = None
+                    self.stats["failed"] += 1
+                    continue
+                entry["data"] = bytes(data[:length])
+                entry["fetched_at"] = float(now)
+                self.stats["fetched"] += 1
+                self.stats["bytes_fetched"] += length
+
+    def cached_regions(self) -> Dict[int, bytes]:
+        with self._lock:
+            return {address: entry["data"] for address, entry in self._regions.items() if entry.get("data") is not None}
+
+    def invalidate(self):
+        """Drop cached bytes (subscriptions stay) so the next tick refetches every region."""
+        with self._lock:
+            for entry in self._regions.values():
+                entry["data"] = None
+                entry["fetched_at"] = 0.0
+                entry["deferred"] = False
+
+    def lookup(self, address: int, num_bytes: int, now: float) -> Optional[bytes]:
+        """Return cached bytes for the range if a covering region is younger than its period."""
+        end = int(address) + int(num_bytes)
+        with self._lock:
+            for start, entry in self._regions.items():
+                data = entry.get("data")
+                if data is None or start > int(address) or end > start + len(data):
+                    continue
+                if (float(now) - float(entry["fetched_at"])) >= float(entry["period_s"]):
+                    continue
+                self.stats["lookup_hits"] += 1
+                return data[int(address) - start:end - start]
+        return None
+
+
+class RetroArchTraceWriter:
+    """Append-only binary log of READ_CORE_MEMORY replies (and GET_STATUS text) for offline replay.
+
+    Layout: ``RAM_TRACE_MAGIC`` then records of ``<dBII`` (seconds since start, kind, address, length)
+    followed by ``length`` payload bytes (none for failed reads).
+    """
+
+    MAGIC = b"PATRACE1"
+    RECORD = struct.Struct("<dBII")
+    KIND_READ_FAILED = 0
+    KIND_READ = 1
+    KIND_STATUS = 2
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self._handle = open(self.path, "wb")
+        self._handle.write(self.MAGIC)
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self.records = 0
+        self.bytes_written = len(self.MAGIC)
+
+    def _write(self, kind: int, address: int, payload: bytes, length: Optional[int] = None):
+        header = self.RECORD.pack(time.monotonic() - self._started_at, int(kind), int(address) & 0xFFFFFFFF, int(len(payload) if length is None else length))
+        with self._lock:
+            if self._handle is None:
+                return
+            self._handle.write(header)
+            if payload:
+                self._handle.write(payload)
+            self.records += 1
+            self.bytes_written += len(header) + len(payload)
+            # Periodic flush so a killed session still leaves a usable trace; stop/exit flush the rest.
+            if self.records % 256 == 0:
+                self._handle.flush()
+
+    def record_read(self, address: int, num_bytes: int, payload: Optional[bytes]):
+        if payload is None:
+            self._write(self.KIND_READ_FAILED, address, b"", length=num_bytes)
+        else:
+            self._write(self.KIND_READ, address, bytes(payload))
+
+    def record_status(self, text: str):
+        self._write(self.KIND_STATUS, 0, str(text).encode("utf-8", errors="replace"))
+
+    def flush(self):
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+
+    def close(self):
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+class RetroArchTrace:
+    """A loaded RetroArchTraceWriter file, indexed for "latest value at time t" lookups."""
+
+    def __init__(self):
+        # start address -> ([timestamps], [(length, payload or None)])
+        self._reads: Dict[int, Tuple[List[float], List[Tuple[int, Optional[bytes]]]]] = {}
+        self._starts: List[int] = []
+        self._status_times: List[float] = []
+        self._status_texts: List[str] = []
+        self.started_s: Optional[float] = None
+        self.duration_s = 0.0
+        self.read_records = 0
+
+    @classmethod
+    def load(cls, path: str) -> "RetroArchTrace":
+        trace = cls()
+        record = RetroArchTraceWriter.RECORD
+        with open(path, "rb") as handle:
+            data = handle.read()
+        if not data.startswith(RetroArchTraceWriter.MAGIC):
+            raise ValueError(f"not a RetroArch RAM trace: {path}")
+        offset = len(RetroArchTraceWriter.MAGIC)
+        while offset + record.size <= len(data):
+            ts, kind, address, length = record.unpack_from(data, offset)
+            offset += record.size
+            payload: Optional[bytes] = None
+            if kind != RetroArchTraceWriter.KIND_READ_FAILED:
+                payload = data[offset:offset + length]
+                offset += length
+                if len(payload) < length:
+                    break
+            if trace.started_s is None:
+                trace.started_s = float(ts)
+            trace.duration_s = max(trace.duration_s, float(ts))
+            if kind == RetroArchTraceWriter.KIND_STATUS:
+                trace._status_times.append(float(ts))
+                trace._status_texts.append((payload or b"").decode("utf-8", errors="replace"))
+                continue
+            times, values = trace._reads.setdefault(int(address), ([], []))
+            times.append(float(ts))
+            values.append((int(length), payload))
+            trace.read_records += 1
+        trace._starts = sorted(trace._reads)
+        return trace
+
+    @staticmethod
+    def _latest_index(times: List[float], at_s: float) -> int:
+        # -1 when ``at_s`` predates every record; replay must not serve values observed later.
+        return bisect.bisect_right(times, float(at_s)) - 1
+
+    def lookup(self, address: int, num_bytes: int, at_s: float) -> Optional[bytes]:
+        """Return the newest recorded bytes covering ``[address, address+num_bytes)`` at ``at_s``."""
+        address = int(address)
+        end = address + int(num_bytes)
+        best: Optional[Tuple[float, Optional[bytes]]] = None
+        index = bisect.bisect_right(self._starts, address)
+        # Chunked reads never exceed the largest probe size, so only nearby starts can cover the range.
+        while index > 0:
+            index -= 1
+            start = self._starts[index]
+            if address - start > max(RetroArchClient.READ_CHUNK_PROBE_SIZES):
+                break
+            times, values = self._reads[start]
+            pos = self._latest_index(times, at_s)
+            # Walk back to the newest record at this start that is long enough.
+            while pos >= 0 and start + values[pos][0] < end:
+                pos -= 1
+            if pos < 0:
+                continue
+            length, payload = values[pos]
+            if start + length < end:
+                continue
+            if best is None or times[pos] > best[0]:
+                best = (times[pos], None if payload is None else payload[address - start:end - start])
+        return None if best is None else best[1]
+
+    def status_at(self, at_s: float) -> Optional[str]:
+        pos = self._latest_index(self._status_times, at_s)
+        return self._status_texts[pos] if pos >= 0 else None
+
+
+def _retroarch_io_priority(client: object, priority: int):
+    """Priority context for transport requests; no-op for clients without a request queue."""
+    io_priority = getattr(client, "io_priority", None)
+    return io_priority(priority) if callable(io_priority) else nullcontext()
+
+
 class RetroArchClient:
     """Client for connecting to RetroArch network command interface"""
     
@@ -1110,6 +1848,29 @@ class RetroArchClient:
         "pokemon leafgreen": "Pokemon LeafGreen",
         "pokemon leaf green": "Pokemon LeafGreen",
     }
+    # Avoid oversized UDP payloads/responses on Windows (WinError 10040); this is the safe
+    # floor, and larger chunks are used once a probe shows the host answers them.
+    MAX_READ_CHUNK_BYTES = 1200
+    # Candidate chunk sizes probed against the host (a reply is ~3 bytes of hex per RAM byte).
+    READ_CHUNK_PROBE_SIZES = (16384, 8192, 4096, 2048)
+    # Seconds before a host that failed at a probed size is allowed to probe again.
+    READ_CHUNK_REPROBE_COOLDOWN_S = 300.0
+    UDP_RECV_BUFFER_BYTES = 65536
+    # Probed chunk limits shared by every client talking to the same host:port.
+    _chunk_limits_by_host: Dict[Tuple[str, int], Dict[str, float]] = {}
+    _chunk_limits_lock = threading.Lock()
+    # Gap (in bytes) still bridged when merging ranges for read_many.
+    READ_MANY_MAX_GAP_BYTES = 32
+    # Transport queue priorities (lower runs first).
+    IO_PRIORITY_HUNT = 0
+    IO_PRIORITY_COLLECTION = 10
+    IO_PRIORITY_DEFAULT = 10
+    IO_PRIORITY_ACHIEVEMENTS = 20
+    # READ_CORE_MEMORY requests kept in flight at once by read_pipelined.
+    PIPELINE_WINDOW = 8
+    # Bytes of subscribed regions fetched per poll tick before lower-priority regions wait a tick.
+    SUBSCRIPTION_TICK_BYTE_BUDGET = 2048
+
     def __init__(self, host: str = "127.0.0.1", port: int = 55355):
         self.host = host
         self.port = port
@@ -1129,12 +1890,40 @@ class RetroArchClient:
         self._mismatch_burst_sample_command: Dict[str, str] = {}
         self._mismatch_burst_sample_addr: Dict[str, Optional[str]] = {}
         self._mismatch_burst_min_warn = 3
+        self._read_many_stats: Dict[str, int] = {"calls": 0, "ranges": 0, "spans": 0, "failed_spans": 0}
+        self._snapshot: Optional[RetroArchMemorySnapshot] = None
+        self._snapshot_thread_id: Optional[int] = None
+        self._snapshot_totals: Dict[str, int] = {"snapshots": 0, "hits": 0, "misses": 0}
+        self.io_worker_enabled = True
+        self._io_queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._io_seq = itertools.count()
+        self._io_thread: Optional[threading.Thread] = None
+        self._io_thread_ident: Optional[int] = None
+        # Guards start/stop against _submit_io: once stopping, new requests run inline instead of queueing.
+        self._io_lifecycle_lock = threading.Lock()
+        self._io_accepting = False
+        self._io_priority_local = threading.local()
+        self._io_stats_lock = threading.Lock()
+        self._io_stats: Dict[int, Dict[str, float]] = {}
+        self.pipeline_window = int(self.PIPELINE_WINDOW)
+        self._pipeline_stats: Dict[str, int] = {"batches": 0, "requests": 0, "resends": 0, "failed": 0, "stray_packets": 0}
+        self._trace_writer: Optional[RetroArchTraceWriter] = None
+        self.region_scheduler = RetroArchRegionScheduler()
+        # Last game reported by GET_STATUS; a change invalidates the scheduled region bytes.
+        self._region_game_name: Optional[str] = None
+        self.adaptive_chunking_enabled = True
+        self._chunk_stats: Dict[str, int] = {"probes": 0, "probe_failures": 0, "fallbacks": 0, "chunks_avoided": 0}
     
     def connect(self) -> bool:
         """Connect to RetroArch"""
         try:
             with self.lock:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                try:
+                    # Room for a pipelined window of large-chunk replies.
+                    self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                except OSError:
+                    pass
                 # Keep a short timeout so transient packet loss does not stall polling for seconds.
                 self.socket.settimeout(self.command_timeout_seconds)
                 # UDP does not need connect.
@@ -1143,6 +1932,9 @@ class RetroArchClient:
                 self._socket_reset_counts = {}
                 self._io_error_streak = 0
                 self._last_io_error_ts = 0.0
+            self.region_scheduler.invalidate()
+            if self.io_worker_enabled:
+                self.start_io_worker()
             return True
         except Exception:
             self.connected = False
@@ -1150,6 +1942,8 @@ class RetroArchClient:
     
     def disconnect(self):
         """Disconnect from RetroArch"""
+        self.stop_io_worker()
+        self.region_scheduler.invalidate()
         with self.lock:
             self.connected = False
             self._waiting_for_launch = False
@@ -1171,6 +1965,7 @@ class RetroArchClient:
             return
         self._waiting_for_launch = True
         self._waiting_since_ts = time.time()
+        self.region_scheduler.invalidate()
         log_event(
             logging.INFO,
             "retroarch_closed_waiting",
@@ -1186,6 +1981,7 @@ class RetroArchClient:
             downtime_ms = int(max(0.0, time.time() - self._waiting_since_ts) * 1000)
         self._waiting_for_launch = False
         self._waiting_since_ts = 0.0
+        self.region_scheduler.invalidate()
         self._reconnect_grace_until_ts = max(float(self._reconnect_grace_until_ts), time.time() + 1.5)
         log_event(
             logging.INFO,
@@ -1206,7 +2002,7 @@ class RetroArchClient:
             self.socket.settimeout(0.0)
             while drained < int(max_packets):
                 try:
-                    self.socket.recvfrom(4096)
+                    self.socket.recvfrom(self.UDP_RECV_BUFFER_BYTES)
                     drained += 1
                 except (BlockingIOError, socket.timeout):
                     break
@@ -1219,8 +2015,333 @@ class RetroArchClient:
                 pass
         return drained
 
+    def start_io_worker(self) -> None:
+        """Start the single I/O thread that owns the UDP socket and drains the request queue."""
+        with self._io_lifecycle_lock:
+            if self._io_thread is not None and self._io_thread.is_alive():
+                return
+            self._io_queue = queue.PriorityQueue()
+            self._io_thread = threading.Thread(target=self._io_worker_loop, args=(self._io_queue,), name="retroarch-io", daemon=True)
+            self._io_thread.start()
+            self._io_accepting = True
+
+    def stop_io_worker(self, timeout: float = 2.0) -> None:
+        """Stop the I/O thread; requests still queued resolve to None, later ones run inline."""
+        with self._io_lifecycle_lock:
+            thread = self._io_thread
+            if thread is None:
+                return
+            self._io_accepting = False
+            self._io_queue.put((-1, next(self._io_seq), None, None, 0.0))
+        if thread is not threading.current_thread():
+            thread.join(timeout=max(0.0, float(timeout)))
+        with self._io_lifecycle_lock:
+            # A start_io_worker() that raced the join owns the fields now.
+            if self._io_thread is thread:
+                self._io_thread = None
+                self._io_thread_ident = None
+
+    def is_io_worker_running(self) -> bool:
+        thread = self._io_thread
+        return thread is not None and thread.is_alive()
+
+    @contextmanager
+    def io_priority(self, priority: int):
+        """Tag transport requests issued by this thread inside the block with ``priority``."""
+        previous = getattr(self._io_priority_local, "priority", None)
+        self._io_priority_local.priority = int(priority)
+        try:
+            yield
+        finally:
+            self._io_priority_local.priority = previous
+
+    def _current_io_priority(self) -> int:
+        priority = getattr(self._io_priority_local, "priority", None)
+        return int(self.IO_PRIORITY_DEFAULT if priority is None else priority)
+
+    def _io_worker_loop(self, io_queue: queue.PriorityQueue) -> None:
+        self._io_thread_ident = threading.get_ident()
+        while True:
+            priority, _seq, command, future, enqueued_at = io_queue.get()
+            if command is None:
+                break
+            if not future.set_running_or_notify_cancel():
+                self._record_io_stats(priority, cancelled=True)
+                continue
+            started = time.perf_counter()
+            try:
+                result = command() if callable(command) else self._send_command_now(command)
+            except Exception as exc:
+                future.set_exception(exc)
+                continue
+            finished = time.perf_counter()
+            self._record_io_stats(
+                priority,
+                wait_ms=(started - float(enqueued_at)) * 1000.0,
+                rtt_ms=(finished - started) * 1000.0,
+            )
+            future.set_result(result)
+
+        # Release anything that was queued behind the stop sentinel.
+        while True:
+            try:
+                _priority, _seq, command, future, _enqueued_at = io_queue.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None and future.set_running_or_notify_cancel():
+                future.set_result(None)
+
+    def _record_io_stats(self, priority: int, wait_ms: float = 0.0, rtt_ms: float = 0.0, cancelled: bool = False) -> None:
+        with self._io_stats_lock:
+            entry = self._io_stats.setdefault(int(priority), {
+                "requests": 0,
+                "cancelled": 0,
+                "queue_wait_ms_total": 0.0,
+                "queue_wait_ms_max": 0.0,
+                "rtt_ms_total": 0.0,
+                "rtt_ms_max": 0.0,
+            })
+            if cancelled:
+                entry["cancelled"] += 1
+                return
+            entry["requests"] += 1
+            entry["queue_wait_ms_total"] += float(wait_ms)
+            entry["queue_wait_ms_max"] = max(float(entry["queue_wait_ms_max"]), float(wait_ms))
+            entry["rtt_ms_total"] += float(rtt_ms)
+            entry["rtt_ms_max"] = max(float(entry["rtt_ms_max"]), float(rtt_ms))
+
+    def get_io_stats(self) -> Dict[int, Dict[str, float]]:
+        """Per-priority transport stats with queue wait measured separately from RTT."""
+        with self._io_stats_lock:
+            stats: Dict[int, Dict[str, float]] = {}
+            for priority, entry in self._io_stats.items():
+                requests = max(1, int(entry["requests"]))
+                stats[priority] = {
+                    "requests": int(entry["requests"]),
+                    "cancelled": int(entry["cancelled"]),
+                    "queue_wait_ms_avg": round(float(entry["queue_wait_ms_total"]) / requests, 2),
+                    "queue_wait_ms_max": round(float(entry["queue_wait_ms_max"]), 2),
+                    "rtt_ms_avg": round(float(entry["rtt_ms_total"]) / requests, 2),
+                    "rtt_ms_max": round(float(entry["rtt_ms_max"]), 2),
+                }
+            return stats
+
+    def _submit_io(self, work: object, priority: Optional[int] = None) -> Future:
+        """Queue a command string or a callable for the I/O thread; run inline when no worker is up."""
+        request_priority = self._current_io_priority() if priority is None else int(priority)
+        future: Future = Future()
+        if threading.get_ident() != self._io_thread_ident:
+            with self._io_lifecycle_lock:
+                if self._io_accepting and self.is_io_worker_running():
+                    self._io_queue.put((request_priority, next(self._io_seq), work, future, time.perf_counter()))
+                    return future
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(work() if callable(work) else self._send_command_now(str(work)))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def _run_io(self, work: object, timeout: float, default: object = None) -> object:
+        if not self.is_io_worker_running() or threading.get_ident() == self._io_thread_ident:
+            return work() if callable(work) else self._send_command_now(str(work))
+        future = self._submit_io(work)
+        try:
+            return future.result(timeout=max(0.1, float(timeout)))
+        except FutureTimeoutError:
+            future.cancel()
+            return default
+
+    def submit_command(self, command: str, priority: Optional[int] = None) -> Future:
+        """Queue a command for the I/O thread and return a future for its response text."""
+        return self._submit_io(str(command), priority=priority)
+
     def send_command(self, command: str) -> Optional[str]:
-        """Send a command to RetroArch and get response."""
+        """Send a command to RetroArch and get response (via the I/O thread when it is running)."""
+        return self._run_io(str(command), timeout=max(2.0, float(self.command_timeout_seconds) * 4.0))
+
+    def _can_pipeline(self) -> bool:
+        return int(self.pipeline_window) > 1 and bool(self.connected) and self.socket is not None
+
+    def read_pipelined(self, requests: List[Tuple[int, int]], window: Optional[int] = None) -> Dict[Tuple[int, int], bytes]:
+        """Read many (address, length) ranges with up to ``window`` READ_CORE_MEMORY commands in flight.
+
+        Replies are matched by the echoed address and payload length, so arrival order does not matter;
+        only requests that time out are resent. Returns ``{(address, length): bytes}`` for the ranges that
+        were answered; each range must fit in one datagram (``read_chunk_limit()``).
+        """
+        unique: List[Tuple[int, int]] = []
+        for addr, length in requests or []:
+            key = (int(addr), int(length))
+            if key[1] > 0 and key not in unique:
+                unique.append(key)
+        if not unique:
+            return {}
+        in_flight_window = max(1, int(self.pipeline_window if window is None else window))
+        rounds = (len(unique) + in_flight_window - 1) // in_flight_window
+        timeout = max(2.0, float(self.command_timeout_seconds) * 2.0 * rounds + 1.0)
+        result = self._run_io(lambda: self._read_pipelined_now(unique, in_flight_window), timeout=timeout, default={})
+        result = result if isinstance(result, dict) else {}
+        writer = self._trace_writer
+        if writer is not None:
+            for key in unique:
+                writer.record_read(key[0], key[1], result.get(key))
+        return result
+
+    def get_pipeline_stats(self) -> Dict[str, int]:
+        return dict(self._pipeline_stats)
+
+    def _read_pipelined_now(self, requests: List[Tuple[int, int]], window: int) -> Dict[Tuple[int, int], bytes]:
+        results: Dict[Tuple[int, int], bytes] = {}
+        with self.lock:
+            if not self.connected or not self.socket or self._waiting_for_launch:
+                return results
+            if float(self._reconnect_grace_until_ts) > 0 and time.time() < float(self._reconnect_grace_until_ts):
+                return results
+
+            self._pipeline_stats["batches"] += 1
+            self._pipeline_stats["requests"] += len(requests)
+            max_attempts = 1 if self.is_unstable_io() else 2
+            pending: deque = deque(requests)
+            attempts: Dict[Tuple[int, int], int] = {}
+            in_flight: Dict[Tuple[int, int], float] = {}
+            timed_out = 0
+            try:
+                self._drain_stale_packets(max_packets=24)
+                while pending or in_flight:
+                    while pending and len(in_flight) < int(window):
+                        key = pending.popleft()
+                        attempts[key] = int(attempts.get(key, 0)) + 1
+                        if attempts[key] > 1:
+                            self._pipeline_stats["resends"] += 1
+                        self.socket.sendto(f"READ_CORE_MEMORY {hex(key[0])} {key[1]}\n".encode(), (self.host, self.port))
+                        in_flight[key] = time.monotonic() + float(self.command_timeout_seconds)
+
+                    now = time.monotonic()
+                    expired = [key for key, deadline in in_flight.items() if deadline <= now]
+                    for key in expired:
+                        in_flight.pop(key, None)
+                        timed_out += 1
+                        if int(attempts.get(key, 0)) < max_attempts:
+                            pending.append(key)
+                        else:
+                            self._pipeline_stats["failed"] += 1
+                    if expired or not in_flight:
+                        continue
+
+                    self.socket.settimeout(max(0.001, min(in_flight.values()) - now))
+                    try:
+                        response, _addr = self.socket.recvfrom(self.UDP_RECV_BUFFER_BYTES)
+                    except socket.timeout:
+                        continue
+                    text = response.decode(errors="replace").strip()
+                    parts = text.split(None, 2)
+                    matched_key: Optional[Tuple[int, int]] = None
+                    payload: Optional[bytes] = None
+                    if len(parts) == 3 and parts[0] == "READ_CORE_MEMORY":
+                        try:
+                            response_addr = int(parts[1], 16)
+                            payload = bytes.fromhex(parts[2])
+                        except ValueError:
+                            payload = None
+                        if payload is not None:
+                            exact = (response_addr, len(payload))
+                            if exact in in_flight:
+                                matched_key = exact
+                            else:
+                                for key in in_flight:
+                                    if key[0] == response_addr and key[1] <= len(payload):
+                                        matched_key = key
+                                        break
+                    if matched_key is None or payload is None:
+                        self._pipeline_stats["stray_packets"] += 1
+                        continue
+                    in_flight.pop(matched_key, None)
+                    results[matched_key] = payload[:matched_key[1]]
+            except ConnectionResetError as exc:
+                self._io_error_streak += 1
+                self._last_io_error_ts = time.time()
+                self._enter_waiting_for_launch(command="READ_CORE_MEMORY", reason="socket_reset", error=str(exc))
+                return results
+            except OSError as exc:
+                self._io_error_streak += 1
+                self._last_io_error_ts = time.time()
+                self.connected = False
+                log_event(
+                    logging.ERROR,
+                    "retroarch_socket_error",
+                    command="READ_CORE_MEMORY (pipelined)",
+                    error_type=type(exc).__name__,
+                    error=str(exc),
+                )
+                return results
+            finally:
+                try:
+                    if self.socket:
+                        self.socket.settimeout(self.command_timeout_seconds)
+                except OSError:
+                    pass
+
+            if results:
+                self._exit_waiting_for_launch(command="READ_CORE_MEMORY")
+                self._command_timeout_count = 0
+                self._io_error_streak = 0
+                self._last_io_error_ts = 0.0
+            elif timed_out:
+                self._command_timeout_count += 1
+                self._io_error_streak += 1
+                self._last_io_error_ts = time.time()
+        return results
+
+    def start_recording(self, path: str) -> RetroArchTraceWriter:
+        """Log every READ_CORE_MEMORY reply and GET_STATUS response to a binary trace at ``path``."""
+        self.stop_recording()
+        self._trace_writer = RetroArchTraceWriter(path)
+        log_event(logging.INFO, "retroarch_trace_recording_started", path=str(path))
+        return self._trace_writer
+
+    def flush_recording(self):
+        """Push buffered trace records to disk without ending the recording."""
+        writer = self._trace_writer
+        if writer is not None:
+            writer.flush()
+
+    def stop_recording(self) -> Optional[Dict[str, int]]:
+        writer, self._trace_writer = self._trace_writer, None
+        if writer is None:
+            return None
+        writer.close()
+        stats = {"records": int(writer.records), "bytes": int(writer.bytes_written)}
+        log_event(logging.INFO, "retroarch_trace_recording_stopped", path=writer.path, **stats)
+        return stats
+
+    def _record_trace(self, command: str, response: Optional[str]):
+        writer = self._trace_writer
+        if writer is None:
+            return
+        parts = str(command).split()
+        if parts and parts[0] == "GET_STATUS":
+            if response is not None:
+                writer.record_status(response)
+            return
+        if len(parts) < 3 or parts[0] != "READ_CORE_MEMORY":
+            return
+        try:
+            address = int(parts[1], 16)
+            num_bytes = int(parts[2], 0)
+        except ValueError:
+            return
+        writer.record_read(address, num_bytes, self._parse_read_response(response))
+
+    def _send_command_now(self, command: str) -> Optional[str]:
+        """Send a command on the calling thread and wait for its response."""
+        response = self._send_command_wire(command)
+        if self._trace_writer is not None:
+            self._record_trace(command, response)
+        return response
+
+    def _send_command_wire(self, command: str) -> Optional[str]:
+        """Socket round trip for one command; ``_send_command_now`` adds trace recording on top."""
         with self.lock:
             if not self.connected or not self.socket:
                 return None
@@ -1293,7 +2414,7 @@ class RetroArchClient:
                 mismatched = 0
                 self.socket.settimeout(self.command_timeout_seconds)
 
-                response, _addr = self.socket.recvfrom(4096)
+                response, _addr = self.socket.recvfrom(self.UDP_RECV_BUFFER_BYTES)
                 candidate = response.decode(errors="replace").strip()
                 if _response_matches(candidate):
                     response_text = candidate
@@ -1304,7 +2425,7 @@ class RetroArchClient:
                     self.socket.settimeout(short_timeout)
                     for _ in range(max_recovery_reads):
                         try:
-                            response, _addr = self.socket.recvfrom(4096)
+                            response, _addr = self.socket.recvfrom(self.UDP_RECV_BUFFER_BYTES)
                         except socket.timeout:
                             break
                         candidate = response.decode(errors="replace").strip()
@@ -1435,7 +2556,14 @@ class RetroArchClient:
 
     def get_current_game(self) -> Optional[str]:
         """Get name of currently loaded game from GET_STATUS"""
-        response = self.send_command("GET_STATUS")
+        game_name = self._parse_current_game(self.send_command("GET_STATUS"))
+        if game_name and game_name != self._region_game_name:
+            if self._region_game_name is not None:
+                self.region_scheduler.invalidate()
+            self._region_game_name = game_name
+        return game_name
+
+    def _parse_current_game(self, response: Optional[str]) -> Optional[str]:
         if response:
             normalized = self._normalize_game_name(response)
             if normalized:
@@ -1470,24 +2598,108 @@ class RetroArchClient:
                 pass
         return None
     
-    def read_memory(self, address: str, num_bytes: int = 1) -> Optional[int]:
-        """Read memory from the emulator."""
-
-        def _parse_response(response: Optional[str]) -> Optional[List[int]]:
-            if response and response.startswith("READ_CORE_MEMORY"):
-                parts = response.split()
-                if len(parts) >= 3:
-                    try:
-                        return [int(x, 16) for x in parts[2:]]
-                    except ValueError:
-                        return None
+    @staticmethod
+    def _parse_read_response(response: Optional[str]) -> Optional[bytes]:
+        """Decode a READ_CORE_MEMORY hex payload straight into bytes (no per-byte int parsing)."""
+        if not response or not response.startswith("READ_CORE_MEMORY"):
+            return None
+        parts = response.split(None, 2)
+        if len(parts) < 3:
             return None
+        try:
+            # fromhex skips the single spaces between byte tokens; error replies ("-1 ...") raise.
+            return bytes.fromhex(parts[2])
+        except ValueError:
+            return None
+
+    def _chunk_host_key(self) -> Tuple[str, int]:
+        return (str(self.host), int(self.port))
+
+    def read_chunk_limit(self) -> int:
+        """Largest READ_CORE_MEMORY length currently known to work against this host."""
+        if not self.adaptive_chunking_enabled:
+            return int(self.MAX_READ_CHUNK_BYTES)
+        with self._chunk_limits_lock:
+            state = self._chunk_limits_by_host.get(self._chunk_host_key())
+        if not state:
+            return int(self.MAX_READ_CHUNK_BYTES)
+        return max(int(self.MAX_READ_CHUNK_BYTES), int(state.get("good", 0)))
+
+    def _chunk_probe_sizes(self, address: int, total_bytes: int) -> List[int]:
+        """Sizes still worth probing for a read of ``total_bytes`` (between known-good and known-bad)."""
+        if not self.adaptive_chunking_enabled or not self.connected:
+            return []
+        with self._chunk_limits_lock:
+            state = dict(self._chunk_limits_by_host.get(self._chunk_host_key()) or {})
+        good = max(int(self.MAX_READ_CHUNK_BYTES), int(state.get("good", 0)))
+        bad = int(state.get("bad", 0))
+        if bad and (time.monotonic() - float(state.get("bad_at", 0.0))) >= float(self.READ_CHUNK_REPROBE_COOLDOWN_S):
+            bad = 0
+        sizes: List[int] = []
+        for candidate in self.READ_CHUNK_PROBE_SIZES:
+            size = min(int(candidate), int(total_bytes))
+            if size > good and (not bad or size < bad) and size not in sizes:
+                sizes.append(size)
+        return sizes
+
+    def _update_chunk_limit(self, good: Optional[int] = None, bad: Optional[int] = None):
+        with self._chunk_limits_lock:
+            state = self._chunk_limits_by_host.setdefault(self._chunk_host_key(), {"good": float(self.MAX_READ_CHUNK_BYTES)})
+            if good is not None:
+                state["good"] = float(max(int(state.get("good", 0)), int(good)))
+            if bad is not None:
+                state["bad"] = float(bad)
+                state["bad_at"] = time.monotonic()
+                if int(state.get("good", 0)) >= int(bad):
+                    state["good"] = float(self.MAX_READ_CHUNK_BYTES)
+
+    def _probe_chunk_read(self, address: int, total_bytes: int) -> Optional[bytes]:
+        """Try one large READ_CORE_MEMORY for a multi-chunk read; learn the host limit from the result.
+
+        Returns the bytes when a probed size covered the whole read. Sizes that fail (timeout, error reply
+        or short payload) are remembered as too large for this host until the cooldown expires.
+        """
+        for size in self._chunk_probe_sizes(address, total_bytes):
+            self._chunk_stats["probes"] += 1
+            parsed = self._parse_read_response(self.send_command(f"READ_CORE_MEMORY {hex(address)} {size}"))
+            if parsed is not None and len(parsed) >= size:
+                self._update_chunk_limit(good=size)
+                log_event(logging.INFO, "retroarch_read_chunk_probed", host=self.host, port=self.port, chunk_bytes=size)
+                if size >= total_bytes:
+                    return parsed[:total_bytes]
+                return None
+            self._chunk_stats["probe_failures"] += 1
+            self._update_chunk_limit(bad=size)
+        return None
 
-        def _read_chunk_with_retry(read_addr: str, read_len: int) -> Optional[List[int]]:
+    def _note_large_chunk_failure(self, chunk_bytes: int):
+        """Drop back to the safe chunk size after a read failed at a probed (larger) size."""
+        if int(chunk_bytes) <= int(self.MAX_READ_CHUNK_BYTES):
+            return
+        self._chunk_stats["fallbacks"] += 1
+        self._update_chunk_limit(bad=int(chunk_bytes))
+        log_event(logging.WARNING, "retroarch_read_chunk_fallback", host=self.host, port=self.port, failed_chunk_bytes=int(chunk_bytes), chunk_bytes=int(self.MAX_READ_CHUNK_BYTES))
+
+    def _count_chunks_avoided(self, total_bytes: int, chunk_bytes: int):
+        floor = int(self.MAX_READ_CHUNK_BYTES)
+        if int(chunk_bytes) > floor:
+            baseline = (int(total_bytes) + floor - 1) // floor
+            used = (int(total_bytes) + int(chunk_bytes) - 1) // int(chunk_bytes)
+            self._chunk_stats["chunks_avoided"] += max(0, baseline - used)
+
+    def get_chunk_stats(self) -> Dict[str, int]:
+        stats = dict(self._chunk_stats)
+        stats["chunk_bytes"] = int(self.read_chunk_limit())
+        return stats
+
+    def read_bytes(self, address: str, num_bytes: int = 1) -> Optional[bytes]:
+        """Read memory from the emulator as a raw ``bytes`` buffer."""
+
+        def _read_chunk_with_retry(read_addr: str, read_len: int) -> Optional[bytes]:
             attempts = 1 if self.is_unstable_io() else 2
             for _ in range(attempts):
-                parsed = _parse_response(self.send_command(f"READ_CORE_MEMORY {read_addr} {read_len}"))
-                if isinstance(parsed, list) and len(parsed) >= int(read_len):
+                parsed = self._parse_read_response(self.send_command(f"READ_CORE_MEMORY {read_addr} {read_len}"))
+                if parsed is not None and len(parsed) >= int(read_len):
                     return parsed
             return None
 
@@ -1498,35 +2710,205 @@ class RetroArchClient:
         if total_bytes <= 0:
             return None
 
-        # Avoid oversized UDP payloads/responses on Windows (WinError 10040).
-        max_chunk_bytes = 1200
+        try:
+            base_addr: Optional[int] = int(str(address), 16)
+        except (TypeError, ValueError):
+            base_addr = None
+
+        snapshot = self._snapshot
+        if base_addr is not None and snapshot is not None and self._snapshot_thread_id == threading.get_ident():
+            cached = snapshot.lookup(base_addr, total_bytes)
+            if cached is not None:
+                return cached
+        if base_addr is not None and self.connected and self.region_scheduler.has_subscriptions():
+            cached = self.region_scheduler.lookup(base_addr, total_bytes, time.monotonic())
+            if cached is not None:
+                return cached
+
+        if total_bytes <= int(self.MAX_READ_CHUNK_BYTES) or base_addr is None:
+            parsed = _read_chunk_with_retry(str(address), int(total_bytes))
+            return parsed[:total_bytes] if parsed is not None else None
+
+        max_chunk_bytes = self.read_chunk_limit()
         if total_bytes > max_chunk_bytes:
-            try:
-                base_addr = int(str(address), 16)
-            except (TypeError, ValueError):
-                parsed = _read_chunk_with_retry(str(address), int(total_bytes))
-                if parsed is None:
-                    return None
-                return parsed[0] if len(parsed) == 1 else parsed
-
-            values: List[int] = []
-            offset = 0
-            remaining = int(total_bytes)
-            while remaining > 0:
-                chunk = min(max_chunk_bytes, remaining)
-                chunk_addr = hex(base_addr + offset)
-                parsed = _read_chunk_with_retry(chunk_addr, int(chunk))
+            probed = self._probe_chunk_read(base_addr, total_bytes)
+            if probed is not None:
+                self._count_chunks_avoided(total_bytes, total_bytes)
+                return probed
+            max_chunk_bytes = self.read_chunk_limit()
+
+        def _read_chunked(chunk_bytes: int) -> Optional[bytes]:
+            if self._can_pipeline():
+                chunk_keys = [
+                    (base_addr + offset, min(chunk_bytes, total_bytes - offset))
+                    for offset in range(0, total_bytes, chunk_bytes)
+                ]
+                pipelined = self.read_pipelined(chunk_keys)
+                if all(key in pipelined for key in chunk_keys):
+                    return b"".join(pipelined[key] for key in chunk_keys)
+                return None
+            chunks: List[bytes] = []
+            for offset in range(0, total_bytes, chunk_bytes):
+                chunk = min(chunk_bytes, total_bytes - offset)
+                parsed = _read_chunk_with_retry(hex(base_addr + offset), int(chunk))
                 if not parsed:
                     return None
-                values.extend(parsed[:chunk])
-                remaining -= chunk
-                offset += chunk
-            return values
+                chunks.append(parsed[:chunk])
+            return b"".join(chunks)
+
+        data = _read_chunked(max_chunk_bytes)
+        if data is None and max_chunk_bytes > int(self.MAX_READ_CHUNK_BYTES):
+            self._note_large_chunk_failure(max_chunk_bytes)
+            max_chunk_bytes = int(self.MAX_READ_CHUNK_BYTES)
+            data = _read_chunked(max_chunk_bytes)
+        if data is not None:
+            self._count_chunks_avoided(total_bytes, max_chunk_bytes)
+        return data
+
+    def read_memory(self, address: str, num_bytes: int = 1) -> Optional[int]:
+        """Read memory from the emulator (one int for single bytes, else a list of ints)."""
+        data = self.read_bytes(address, num_bytes)
+        if data is None or not data:
+            return None
+        return data[0] if len(data) == 1 else list(data)
+
+    @staticmethod
+    def _coalesce_read_ranges(ranges: List[Tuple[int, int]], max_gap: int = 0) -> List[Tuple[int, int]]:
+        """Merge overlapping/adjacent (start, length) ranges into sorted (start, end) spans."""
+        spans: List[List[int]] = []
+        for start, length in sorted(ranges):
+            end = int(start) + int(length)
+            if spans and int(start) <= spans[-1][1] + int(max_gap):
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([int(start), end])
+        return [(int(start), int(end)) for start, end in spans]
+
+    def read_many(self, ranges: List[Tuple[object, int]], max_gap: Optional[int] = None) -> Dict[int, bytes]:
+        """Read several memory ranges with as few READ_CORE_MEMORY commands as possible.
+
+        ``ranges`` is a list of ``(address, num_bytes)`` pairs; addresses may be hex strings or ints.
+        Overlapping ranges, and ranges separated by at most ``max_gap`` bytes, are merged into one span
+        and each span is fetched via ``read_bytes`` (which still splits at ``read_chunk_limit()``).
+        Returns ``{address: bytes}`` keyed by integer start address; ranges whose span could not
+        be read are omitted so callers can fall back to single reads.
+        """
+        gap = int(self.READ_MANY_MAX_GAP_BYTES if max_gap is None else max_gap)
+        requested: List[Tuple[int, int]] = []
+        for raw_addr, raw_len in ranges or []:
+            try:
+                addr_int = int(raw_addr) if isinstance(raw_addr, int) else int(str(raw_addr), 16)
+                length = int(raw_len)
+            except (TypeError, ValueError):
+                continue
+            if addr_int < 0 or length <= 0:
+                continue
+            requested.append((addr_int, length))
+        if not requested:
+            return {}
+
+        spans = self._coalesce_read_ranges(requested, max_gap=gap)
+        self._read_many_stats["calls"] += 1
+        self._read_many_stats["ranges"] += len(requested)
+        self._read_many_stats["spans"] += len(spans)
+
+        span_data: List[Tuple[int, int, bytes]] = []
+        snapshot = self._snapshot if self._snapshot_thread_id == threading.get_ident() else None
+        if self._can_pipeline() and snapshot is None and len(spans) > 1:
+            # Put every span (chunked to datagram size) in flight at once instead of one RTT per span.
+            max_chunk_bytes = self.read_chunk_limit()
+            span_chunks: List[List[Tuple[int, int]]] = [
+                [(start + off, min(max_chunk_bytes, (end - start) - off)) for off in range(0, end - start, max_chunk_bytes)]
+                for start, end in spans
+            ]
+            pipelined = self.read_pipelined([key for chunk_keys in span_chunks for key in chunk_keys])
+            large_chunk_failed = False
+            for (span_start, span_end), chunk_keys in zip(spans, span_chunks):
+                if all(key in pipelined for key in chunk_keys):
+                    span_data.append((span_start, span_end, b"".join(pipelined[key] for key in chunk_keys)))
+                    self._count_chunks_avoided(span_end - span_start, max_chunk_bytes)
+                else:
+                    self._read_many_stats["failed_spans"] += 1
+                    large_chunk_failed = large_chunk_failed or any(length > int(self.MAX_READ_CHUNK_BYTES) for _addr, length in chunk_keys)
+            if large_chunk_failed:
+                self._note_large_chunk_failure(max_chunk_bytes)
+        else:
+            for span_start, span_end in spans:
+                span_len = int(span_end - span_start)
+                data = self.read_bytes(hex(span_start), span_len)
+                if data is None or len(data) < span_len:
+                    self._read_many_stats["failed_spans"] += 1
+                    continue
+                span_data.append((span_start, span_end, data))
+
+        results: Dict[int, bytes] = {}
+        for addr_int, length in requested:
+            for span_start, span_end, data in span_data:
+                if span_start <= addr_int and addr_int + length <= span_end:
+                    offset = addr_int - span_start
+                    results[addr_int] = data[offset:offset + length]
+                    break
+        return results
+
+    def get_read_many_stats(self) -> Dict[str, int]:
+        """Return cumulative read_many counters (requested ranges vs. spans actually read)."""
+        return dict(self._read_many_stats)
+
+    def begin_snapshot(self, regions: List[Tuple[object, int]]) -> Optional[RetroArchMemorySnapshot]:
+        """Fetch hot regions once and serve covered reads from memory on this thread until end_snapshot.
+
+        Only the calling thread sees the snapshot, so GUI-thread hunt reads stay live.
+        """
+        self.end_snapshot()
+        if not regions:
+            return None
+        snapshot = RetroArchMemorySnapshot(self.read_many(regions))
+        if snapshot.region_count <= 0:
+            return None
+        self._snapshot = snapshot
+        self._snapshot_thread_id = threading.get_ident()
+        self._snapshot_totals["snapshots"] += 1
+        return snapshot
+
+    def subscribe_regions(self, owner: str, regions: List[Tuple[object, int]], period_s: float = 0.0, priority: Optional[int] = None):
+        """Declare the regions ``owner`` reads; they are refreshed at most once per ``period_s``."""
+        self.region_scheduler.subscribe(owner, regions, period_s=period_s, priority=self.IO_PRIORITY_DEFAULT if priority is None else int(priority))
+
+    def unsubscribe_regions(self, owner: Optional[str] = None):
+        self.region_scheduler.unsubscribe(owner)
 
-        parsed = _read_chunk_with_retry(str(address), int(total_bytes))
-        if parsed is None:
+    def begin_scheduled_snapshot(self) -> Optional[RetroArchMemorySnapshot]:
+        """Fetch the subscribed regions that are due this tick, then snapshot every cached region."""
+        self.end_snapshot()
+        now = time.monotonic()
+        due = self.region_scheduler.due(now, byte_budget=int(self.SUBSCRIPTION_TICK_BYTE_BUDGET))
+        if due:
+            self.region_scheduler.store(due, self.read_many(due), now)
+        snapshot = RetroArchMemorySnapshot(self.region_scheduler.cached_regions())
+        if snapshot.region_count <= 0:
             return None
-        return parsed[0] if len(parsed) == 1 else parsed
+        self._snapshot = snapshot
+        self._snapshot_thread_id = threading.get_ident()
+        self._snapshot_totals["snapshots"] += 1
+        return snapshot
+
+    def get_subscription_stats(self) -> Dict[str, int]:
+        return dict(self.region_scheduler.stats)
+
+    def end_snapshot(self) -> Optional[Dict[str, int]]:
+        """Drop the active snapshot and return its hit/miss counts."""
+        snapshot = self._snapshot
+        self._snapshot = None
+        self._snapshot_thread_id = None
+        if snapshot is None:
+            return None
+        self._snapshot_totals["hits"] += int(snapshot.hits)
+        self._snapshot_totals["misses"] += int(snapshot.misses)
+        return snapshot.stats()
+
+    def get_snapshot_stats(self) -> Dict[str, int]:
+        """Return cumulative snapshot counters across poll cycles."""
+        return dict(self._snapshot_totals)
 
     def get_status(self) -> Dict:
         """Get RetroArch status"""
@@ -1541,6 +2923,600 @@ class RetroArchClient:
         return {"status": "DISCONNECTED", "game": None}
 
 
+class RetroArchReplayClient(RetroArchClient):
+    """RetroArchClient stand-in that answers commands from a recorded RAM trace at full speed.
+
+    The replay clock only moves through ``advance_to``/``advance``, so a driver can step through
+    hours of recorded polling in seconds while the reader code runs unchanged.
+    """
+
+    def __init__(self, trace: RetroArchTrace):
+        super().__init__(host="replay", port=0)
+        self.trace = trace
+        self.io_worker_enabled = False
+        self.pipeline_window = 1
+        # Recorded reads are matched by covering range, so keep the default chunk size.
+        self.adaptive_chunking_enabled = False
+        # Start at the first recorded exchange; nothing is known about RAM before it.
+        self.virtual_time_s = float(trace.started_s or 0.0)
+        self.replayed_reads = 0
+        self.missing_reads = 0
+
+    @classmethod
+    def from_file(cls, path: str) -> "RetroArchReplayClient":
+        return cls(RetroArchTrace.load(path))
+
+    def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def disconnect(self):
+        self.connected = False
+
+    def advance_to(self, at_s: float):
+        self.virtual_time_s = max(0.0, float(at_s))
+
+    def advance(self, seconds: float):
+        self.advance_to(self.virtual_time_s + float(seconds))
+
+    def finished(self) -> bool:
+        return self.virtual_time_s >= float(self.trace.duration_s)
+
+    def _send_command_now(self, command: str) -> Optional[str]:
+        if not self.connected:
+            return None
+        parts = str(command).split()
+        if parts and parts[0] == "GET_STATUS":
+            return self.trace.status_at(self.virtual_time_s)
+        if len(parts) < 3 or parts[0] != "READ_CORE_MEMORY":
+            return None
+        try:
+            address = int(parts[1], 16)
+            num_bytes = int(parts[2], 0)
+        except ValueError:
+            return None
+        payload = self.trace.lookup(address, num_bytes, self.virtual_time_s)
+        if payload is None:
+            self.missing_reads += 1
+            return None
+        self.replayed_reads += 1
+        return f"READ_CORE_MEMORY {address:x} {payload.hex(' ')}"
+
+
+SPRITE_SIGNATURE_HEX_LEN = 64
+SPRITE_SIGNATURE_WORDS = SPRITE_SIGNATURE_HEX_LEN // 16
+_POPCOUNT8 = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8) if np is not None else None
+
+
+class SpriteSignatureIndex:
+    """Packed reference sprite signatures for one game variant.
+
+    Every 256-bit average-hash signature is stored as four uint64 words, grouped by
+    species, so a query against any candidate subset is a single XOR + popcount over
+    the selected rows followed by a per-species min. Without numpy the same rows are
+    kept as Python ints and compared with int.bit_count.
+    """
+
+    def __init__(self):
+        self._ranges: Dict[int, Tuple[int, int]] = {}
+        self._ints: List[int] = []
+        self._words = None
+        self._packed_rows = 0
+        self._subset_key: Tuple[int, ...] = ()
+        self._subset_species = -1
+        self._subset: Tuple[List[int], object, object] = ([], None, None)
+
+    def __len__(self) -> int:
+        return len(self._ints)
+
+    def has_species(self, species_id: int) -> bool:
+        return int(species_id) in self._ranges
+
+    def add_species(self, species_id: int, signatures: List[str]) -> None:
+        """Append a species' signatures; an empty list records that it has no references."""
+        pid = int(species_id)
+        if pid in self._ranges:
+            return
+        start = len(self._ints)
+        for signature in signatures:
+            value = self.pack(signature)
+            if value is not None:
+                self._ints.append(value)
+        self._ranges[pid] = (start, len(self._ints))
+
+    @staticmethod
+    def pack(signature: str) -> Optional[int]:
+        text = str(signature or "").strip().lower()
+        if len(text) != SPRITE_SIGNATURE_HEX_LEN:
+            return None
+        try:
+            return int(text, 16)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _words_from_ints(values: List[int]):
+        raw = b"".join(int(value).to_bytes(SPRITE_SIGNATURE_HEX_LEN // 2, "big") for value in values)
+        return np.frombuffer(raw, dtype=np.uint64).reshape(-1, SPRITE_SIGNATURE_WORDS)
+
+    def _packed_words(self):
+        if self._words is None or self._packed_rows != len(self._ints):
+            self._words = self._words_from_ints(self._ints)
+            self._packed_rows = len(self._ints)
+        return self._words
+
+    def _select(self, species_ids: List[int]) -> Tuple[List[int], object, object]:
+        """Species with references, their row indices and segment offsets (last subset is cached)."""
+        key = tuple(int(pid) for pid in species_ids)
+        if key == self._subset_key and self._subset_species == len(self._ranges):
+            return self._subset
+        owners: List[int] = []
+        rows: List[int] = []
+        offsets: List[int] = []
+        seen: Set[int] = set()
+        for pid in key:
+            span = self._ranges.get(pid)
+            if pid in seen or span is None or span[0] >= span[1]:
+                continue
+            seen.add(pid)
+            owners.append(pid)
+            offsets.append(len(rows))
+            rows.extend(range(span[0], span[1]))
+        self._subset_key = key
+        self._subset_species = len(self._ranges)
+        self._subset = (owners, np.asarray(rows, dtype=np.intp), np.asarray(offsets, dtype=np.intp))
+        return self._subset
+
+    def query(self, query_signatures: List[str], species_ids: List[int]) -> Tuple[Dict[int, int], Tuple[int, int, int]]:
+        """Best Hamming distance per candidate species plus (best species, best, second best).
+
+        Species without reference signatures are absent from the result; a species whose
+        signatures cannot be compared to any query gets 256, like _sprite_hamming_distance.
+        """
+        queries = [value for value in (self.pack(signature) for signature in query_signatures) if value is not None]
+        if np is None:
+            return self._query_python(queries, species_ids)
+
+        owners, rows, offsets = self._select(species_ids)
+        if not owners:
+            return {}, (0, 999, 999)
+        if not queries:
+            best = np.full(len(owners), 256, dtype=np.int32)
+        else:
+            xored = self._packed_words()[rows][None, :, :] ^ self._words_from_ints(queries)[:, None, :]
+            if hasattr(np, "bitwise_count"):
+                distances = np.bitwise_count(xored).sum(axis=2, dtype=np.int32)
+            else:
+                distances = _POPCOUNT8[xored.view(np.uint8)].sum(axis=2, dtype=np.int32)
+            best = np.minimum.reduceat(distances.min(axis=0), offsets)
+
+        order = np.argsort(best, kind="stable")[:2]
+        second = int(best[order[1]]) if len(order) > 1 else 999
+        top2 = (int(owners[order[0]]), int(best[order[0]]), second)
+        return dict(zip(owners, best.tolist())), top2
+
+    def _query_python(self, queries: List[int], species_ids: List[int]) -> Tuple[Dict[int, int], Tuple[int, int, int]]:
+        result: Dict[int, int] = {}
+        for pid in species_ids:
+            span = self._ranges.get(int(pid))
+            if int(pid) in result or span is None or span[0] >= span[1]:
+                continue
+            best = 256
+            for value in self._ints[span[0]:span[1]]:
+                for query in queries:
+                    distance = (value ^ query).bit_count()
+                    if distance < best:
+                        best = distance
+            result[int(pid)] = int(best)
+        ranked = sorted(result.items(), key=lambda item: item[1])
+        if not ranked:
+            return result, (0, 999, 999)
+        return result, (int(ranked[0][0]), int(ranked[0][1]), int(ranked[1][1]) if len(ranked) > 1 else 999)
+
+
+class SpriteTemplateIndex:
+    """Reference structural templates for one game variant, stacked for matrix scoring.
+
+    Masks and edges are boolean and grayscale uint8 columns, one per template and
+    grouped by species, in preallocated pixel-major matrices that grow by doubling
+    (pixel-major so a query can gather just the pixels set in its own mask). A query scores every
+    template of the candidate subset with a handful of array reductions using the
+    same weights as _sprite_template_similarity (mask IoU 0.56, edge IoU 0.30,
+    overlap intensity 0.14). Requires numpy; callers fall back to the per-template loop.
+    """
+
+    def __init__(self):
+        self._ranges: Dict[int, Tuple[int, int]] = {}
+        self._with_templates: Set[int] = set()
+        self._pixels = 0
+        self._rows = 0
+        self._masks = None
+        self._edges = None
+        self._grays = None
+        self._mask_counts = None
+        self._edge_counts = None
+        self._subset_key: Tuple[int, ...] = ()
+        self._subset_species = -1
+        self._subset: Tuple[List[int], object, object, object, object, object, object] = ([], None, None, None, None, None, None)
+
+    def __len__(self) -> int:
+        return int(self._rows)
+
+    def has_species(self, species_id: int) -> bool:
+        return int(species_id) in self._ranges
+
+    @staticmethod
+    def _template_rows(tpl: Dict[str, object]):
+        try:
+            mask = np.asarray(tpl.get("mask") or [], dtype=np.int64) > 0
+            edge = np.asarray(tpl.get("edge") or [], dtype=np.int64) > 0
+            gray = np.asarray(tpl.get("gray") or [], dtype=np.int64)
+        except (TypeError, ValueError):
+            return None
+        if mask.size == 0 or mask.ndim != 1 or edge.shape != mask.shape or gray.shape != mask.shape:
+            return None
+        return mask, edge, gray.astype(np.uint8)
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._rows + int(extra)
+        capacity = 0 if self._masks is None else int(self._masks.shape[1])
+        if needed <= capacity:
+            return
+        capacity = max(64, capacity * 2, needed)
+        masks = np.zeros((self._pixels, capacity), dtype=bool)
+        edges = np.zeros((self._pixels, capacity), dtype=bool)
+        grays = np.zeros((self._pixels, capacity), dtype=np.uint8)
+        mask_counts = np.zeros(capacity, dtype=np.int64)
+        edge_counts = np.zeros(capacity, dtype=np.int64)
+        if self._rows:
+            masks[:, :self._rows] = self._masks[:, :self._rows]
+            edges[:, :self._rows] = self._edges[:, :self._rows]
+            grays[:, :self._rows] = self._grays[:, :self._rows]
+            mask_counts[:self._rows] = self._mask_counts[:self._rows]
+            edge_counts[:self._rows] = self._edge_counts[:self._rows]
+        self._masks, self._edges, self._grays = masks, edges, grays
+        self._mask_counts, self._edge_counts = mask_counts, edge_counts
+
+    def add_species(self, species_id: int, templates: List[Dict[str, object]]) -> None:
+        """Append a species' templates; ones whose pixel count differs from the first template score 0."""
+        pid = int(species_id)
+        if pid in self._ranges:
+            return
+        rows = [row for row in (self._template_rows(tpl) for tpl in templates if isinstance(tpl, dict)) if row is not None]
+        if templates:
+            self._with_templates.add(pid)
+        if rows and not self._pixels:
+            self._pixels = int(rows[0][0].size)
+        rows = [row for row in rows if int(row[0].size) == self._pixels]
+        start = self._rows
+        self._reserve(len(rows))
+        for mask, edge, gray in rows:
+            self._masks[:, self._rows] = mask
+            self._edges[:, self._rows] = edge
+            self._grays[:, self._rows] = gray
+            self._mask_counts[self._rows] = int(np.count_nonzero(mask))
+            self._edge_counts[self._rows] = int(np.count_nonzero(edge))
+            self._rows += 1
+        self._ranges[pid] = (start, self._rows)
+
+    def _select(self, species_ids: List[int]):
+        """Candidate template columns gathered into contiguous matrices (the last subset is cached)."""
+        key = tuple(int(pid) for pid in species_ids)
+        if key == self._subset_key and self._subset_species == len(self._ranges):
+            return self._subset
+        owners: List[int] = []
+        rows: List[int] = []
+        offsets: List[int] = []
+        seen: Set[int] = set()
+        for pid in key:
+            span = self._ranges.get(pid)
+            if pid in seen or span is None or span[0] >= span[1]:
+                continue
+            seen.add(pid)
+            owners.append(pid)
+            offsets.append(len(rows))
+            rows.extend(range(span[0], span[1]))
+        index = np.asarray(rows, dtype=np.intp)
+        self._subset_key = key
+        self._subset_species = len(self._ranges)
+        if owners:
+            self._subset = (
+                owners,
+                np.asarray(offsets, dtype=np.intp),
+                np.ascontiguousarray(self._masks[:, index]),
+                np.ascontiguousarray(self._edges[:, index]),
+                self._grays[:, index].astype(np.int16, order="C"),
+                self._mask_counts[index],
+                self._edge_counts[index],
+            )
+        else:
+            self._subset = ([], None, None, None, None, None, None)
+        return self._subset
+
+    def query(self, query_tpl: Dict[str, object], species_ids: List[int]) -> Dict[int, float]:
+        """Best similarity per candidate species that has reference templates."""
+        result = {int(pid): 0.0 for pid in species_ids if int(pid) in self._with_templates}
+        query = self._template_rows(query_tpl) if isinstance(query_tpl, dict) else None
+        if query is None or int(query[0].size) != self._pixels:
+            return result
+        owners, offsets, masks, edges, grays, mask_counts, edge_counts = self._select(species_ids)
+        if not owners:
+            return result
+        q_mask, q_edge, q_gray = query
+
+        # Intersections and the intensity term only involve pixels set in the query, so gather those rows once.
+        mask_pixels = np.flatnonzero(q_mask)
+        overlap = masks[mask_pixels]
+        mask_inter = np.count_nonzero(overlap, axis=0)
+        mask_union = mask_counts + int(mask_pixels.size) - mask_inter
+        edge_pixels = np.flatnonzero(q_edge)
+        edge_inter = np.count_nonzero(edges[edge_pixels], axis=0)
+        edge_union = edge_counts + int(edge_pixels.size) - edge_inter
+        mask_iou = np.where(mask_union > 0, mask_inter / np.maximum(mask_union, 1), 0.0)
+        edge_iou = np.where(edge_union > 0, edge_inter / np.maximum(edge_union, 1), 0.0)
+
+        diffs = grays[mask_pixels] - q_gray[mask_pixels, None].astype(np.int16)
+        np.abs(diffs, out=diffs)
+        diffs *= overlap
+        mad = diffs.sum(axis=0, dtype=np.int64) / np.maximum(mask_inter, 1)
+        intensity = np.where(mask_inter > 0, np.clip(1.0 - (mad / 255.0), 0.0, 1.0), 0.0)
+
+        scores = np.clip((mask_iou * 0.56) + (edge_iou * 0.30) + (intensity * 0.14), 0.0, 1.0)
+        best = np.maximum.reduceat(scores, offsets)
+        result.update(zip(owners, best.tolist()))
+        return result
+
+
+SPRITE_FEATURE_CACHE_MAGIC = b"PKFC"
+SPRITE_FEATURE_CACHE_VERSION = 1
+SPRITE_FEATURE_CACHE_DIRNAME = ".feature_cache"
+# Config keys read while extracting reference signatures, colour profiles and templates.
+SPRITE_FEATURE_CONFIG_KEYS = (
+    "video_reference_canvas_size",
+    "video_reference_bg_luma",
+    "video_reference_sprite_scales",
+    "video_sprite_color_hue_bins",
+    "video_sprite_color_sat_bins",
+    "video_sprite_color_sat_cutoff",
+    "video_sprite_color_opaque_mask_min_ratio",
+    "video_sprite_color_fg_delta_threshold",
+    "video_sprite_color_fg_min_coverage_ratio",
+    "video_sprite_color_fg_max_coverage_ratio",
+    "video_sprite_color_fg_min_area_ratio",
+    "video_sprite_color_fg_max_area_ratio",
+    "video_sprite_color_fg_target_coverage_ratio",
+    "video_sprite_color_fg_target_area_ratio",
+    "video_sprite_template_opaque_mask_min_ratio",
+    "video_sprite_template_target_coverage_ratio",
+    "video_sprite_template_target_area_ratio",
+    "video_sprite_fg_delta_threshold",
+    "video_structural_canvas_size",
+    "video_structural_target_size",
+)
+# magic, version, config fingerprint, entry count
+_SPRITE_FEATURE_HEADER = struct.Struct("<4sH32sI")
+# path length, record offset, record length
+_SPRITE_FEATURE_ENTRY = struct.Struct("<HII")
+# mtime_ns, file size, signature count, template size (0 = none), colour JSON length (0 = none)
+_SPRITE_FEATURE_RECORD = struct.Struct("<qqBHI")
+_SPRITE_FEATURE_TEMPLATE_COUNTS = struct.Struct("<II")
+_BITS8 = tuple(tuple((value >> (7 - bit)) & 1 for bit in range(8)) for value in range(256))
+
+
+class SpriteFeatureCache:
+    """On-disk cache of per-sprite reference features for one sprite library + game variant.
+
+    Each record holds the multi-scale signatures, colour profile and structural
+    template extracted from one sprite PNG, keyed by its path and stamped with the
+    file's mtime and size. The header carries a fingerprint of the extraction config,
+    so changing canvas size, scales, background luma etc. starts a fresh cache. The
+    file is memory-mapped and records decode on lookup; new or changed sprites are
+    kept in memory and written back by flush().
+    """
+
+    def __init__(self, path: Path, fingerprint: bytes):
+        self.path = Path(path)
+        self.fingerprint = bytes(fingerprint)
+        self._payload = None
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        self._fresh: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def config_fingerprint(config: Dict[str, Any]) -> bytes:
+        values = {key: config.get(key) for key in SPRITE_FEATURE_CONFIG_KEYS}
+        text = json.dumps([SPRITE_FEATURE_CACHE_VERSION, values], sort_keys=True, default=str)
+        return sha256(text.encode("utf-8")).digest()
+
+    def __len__(self) -> int:
+        return len(set(self._entries) | set(self._fresh))
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._fresh)
+
+    def _load(self) -> None:
+        if not self.path.is_file():
+            return
+        try:
+            with open(self.path, "rb") as handle:
+                payload: object = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        try:
+            magic, version, fingerprint, count = _SPRITE_FEATURE_HEADER.unpack_from(payload, 0)
+            if magic != SPRITE_FEATURE_CACHE_MAGIC or version != SPRITE_FEATURE_CACHE_VERSION or fingerprint != self.fingerprint:
+                payload.close()
+                return
+            cursor = _SPRITE_FEATURE_HEADER.size
+            entries: Dict[str, Tuple[int, int]] = {}
+            for _ in range(count):
+                path_len, offset, length = _SPRITE_FEATURE_ENTRY.unpack_from(payload, cursor)
+                cursor += _SPRITE_FEATURE_ENTRY.size
+                entries[bytes(payload[cursor:cursor + path_len]).decode("utf-8")] = (int(offset), int(length))
+                cursor += path_len
+        except (struct.error, UnicodeDecodeError) as exc:
+            log_event(logging.WARNING, "sprite_feature_cache_unusable", path=str(self.path), error=str(exc))
+            payload.close()
+            return
+        self._payload = payload
+        self._entries = entries
+
+    def close(self) -> None:
+        with self._lock:
+            if self._payload is not None:
+                self._payload.close()
+            self._payload = None
+            self._entries = {}
+
+    @staticmethod
+    def _stamp(sprite_path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = Path(sprite_path).stat()
+        except OSError:
+            return None
+        return int(stat.st_mtime_ns), int(stat.st_size)
+
+    def _record(self, key: str) -> Optional[bytes]:
+        fresh = self._fresh.get(key)
+        if fresh is not None:
+            return fresh
+        span = self._entries.get(key)
+        if span is None or self._payload is None:
+            return None
+        return bytes(self._payload[span[0]:span[0] + span[1]])
+
+    def get(self, sprite_path: Path) -> Optional[Dict[str, object]]:
+        """Cached features for a sprite, or None when missing or the file has changed."""
+        stamp = self._stamp(sprite_path)
+        if stamp is None:
+            return None
+        with self._lock:
+            record = self._record(str(sprite_path))
+        if record is None:
+            return None
+        try:
+            mtime_ns, size, _, _, _ = _SPRITE_FEATURE_RECORD.unpack_from(record, 0)
+            if (int(mtime_ns), int(size)) != stamp:
+                return None
+            return self.decode_record(record)
+        except (struct.error, ValueError, UnicodeDecodeError):
+            return None
+
+    def put(self, sprite_path: Path, features: Dict[str, object]) -> None:
+        stamp = self._stamp(sprite_path)
+        if stamp is None:
+            return
+        record = self.encode_record(stamp, features)
+        with self._lock:
+            self._fresh[str(sprite_path)] = record
+
+    @staticmethod
+    def _pack_bits(bits: List[int]) -> bytes:
+        if np is not None:
+            return np.packbits(np.asarray(bits, dtype=np.uint8) > 0).tobytes()
+        out = bytearray((len(bits) + 7) // 8)
+        for idx, bit in enumerate(bits):
+            if int(bit) > 0:
+                out[idx >> 3] |= 0x80 >> (idx & 7)
+        return bytes(out)
+
+    @staticmethod
+    def _unpack_bits(raw: bytes, count: int) -> List[int]:
+        if np is not None:
+            return np.unpackbits(np.frombuffer(raw, dtype=np.uint8), count=count).tolist()
+        return [bit for value in raw for bit in _BITS8[value]][:count]
+
+    @classmethod
+    def encode_record(cls, stamp: Tuple[int, int], features: Dict[str, object]) -> bytes:
+        signatures = [bytes.fromhex(str(sig)) for sig in (features.get("signatures") or [])][:255]
+        color = features.get("color")
+        color_json = json.dumps(color, sort_keys=True).encode("utf-8") if isinstance(color, dict) else b""
+        template = features.get("template")
+        template_size = int(template.get("size", 0) or 0) if isinstance(template, dict) else 0
+        out = bytearray(_SPRITE_FEATURE_RECORD.pack(int(stamp[0]), int(stamp[1]), len(signatures), template_size, len(color_json)))
+        out += b"".join(signatures)
+        out += color_json
+        if template_size > 0:
+            out += _SPRITE_FEATURE_TEMPLATE_COUNTS.pack(int(template["fg_count"]), int(template["edge_count"]))
+            out += cls._pack_bits(template["mask"])
+            out += cls._pack_bits(template["edge"])
+            out += bytes(template["gray"])
+        return bytes(out)
+
+    @classmethod
+    def decode_record(cls, record: bytes) -> Dict[str, object]:
+        _, _, sig_count, template_size, color_len = _SPRITE_FEATURE_RECORD.unpack_from(record, 0)
+        cursor = _SPRITE_FEATURE_RECORD.size
+        signatures = [record[cursor + idx * 32:cursor + (idx + 1) * 32].hex() for idx in range(sig_count)]
+        cursor += sig_count * 32
+        color = json.loads(record[cursor:cursor + color_len].decode("utf-8")) if color_len else None
+        cursor += color_len
+        template = None
+        if template_size > 0:
+            pixel_count = int(template_size) * int(template_size)
+            packed_len = (pixel_count + 7) // 8
+            fg_count, edge_count = _SPRITE_FEATURE_TEMPLATE_COUNTS.unpack_from(record, cursor)
+            cursor += _SPRITE_FEATURE_TEMPLATE_COUNTS.size
+            mask = cls._unpack_bits(record[cursor:cursor + packed_len], pixel_count)
+            cursor += packed_len
+            edge = cls._unpack_bits(record[cursor:cursor + packed_len], pixel_count)
+            cursor += packed_len
+            gray = list(record[cursor:cursor + pixel_count])
+            if len(gray) != pixel_count:
+                raise ValueError("truncated sprite template")
+            template = {
+                "size": int(template_size),
+                "mask": mask,
+                "edge": edge,
+                "gray": gray,
+                "fg_count": int(fg_count),
+                "edge_count": int(edge_count),
+            }
+        return {"signatures": signatures, "color": color, "template": template}
+
+    def flush(self) -> bool:
+        """Rewrite the cache file with the new records merged in; False when nothing changed."""
+        with self._lock:
+            if not self._fresh:
+                return False
+            records: Dict[str, bytes] = {}
+            for key in self._entries:
+                if key not in self._fresh:
+                    record = self._record(key)
+                    if record is not None:
+                        records[key] = record
+            records.update(self._fresh)
+
+            toc = bytearray(_SPRITE_FEATURE_HEADER.pack(SPRITE_FEATURE_CACHE_MAGIC, SPRITE_FEATURE_CACHE_VERSION, self.fingerprint, len(records)))
+            toc_size = len(toc) + sum(_SPRITE_FEATURE_ENTRY.size + len(key.encode("utf-8")) for key in records)
+            body = bytearray()
+            for key, record in records.items():
+                key_bytes = key.encode("utf-8")
+                toc += _SPRITE_FEATURE_ENTRY.pack(len(key_bytes), toc_size + len(body), len(record))
+                toc += key_bytes
+                body += record
+
+            # The old mapping must be closed before replacing the file on Windows.
+            if self._payload is not None:
+                self._payload.close()
+                self._payload = None
+            self._entries = {}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(self.path.name + ".tmp")
+                tmp_path.write_bytes(bytes(toc) + bytes(body))
+                os.replace(tmp_path, self.path)
+            except OSError as exc:
+                log_event(logging.WARNING, "sprite_feature_cache_write_failed", path=str(self.path), error=str(exc))
+                self._fresh = records
+                return False
+            self._fresh = {}
+            self._load()
+        return True
+
+
 class OBSVideoEncounterReader:
     """Video-based encounter reader using OBS screenshots and OCR."""
 
@@ -1570,6 +3546,9 @@ class OBSVideoEncounterReader:
         self._last_error: str = ""
         self._obs_client = None
         self._obs_conn_fingerprint = ""
+        # Held for a whole config-update/read cycle so the background video worker and
+        # the settings preview never interleave on the OBS client or scene state.
+        self.pipeline_lock = threading.RLock()
         self._pending_signature = ""
         self._pending_count = 0
         self._last_emitted_signature = ""
@@ -1590,6 +3569,11 @@ class OBSVideoEncounterReader:
         self._scene_encounter_seq = 0
         self._sprite_reference_signature_cache: Dict[Tuple[str, int], List[str]] = {}
         self._sprite_reference_missing: Set[Tuple[str, int]] = set()
+        self._sprite_reference_index: Dict[str, SpriteSignatureIndex] = {}
+        self._sprite_template_index: Dict[str, SpriteTemplateIndex] = {}
+        self._sprite_feature_caches: Dict[str, SpriteFeatureCache] = {}
+        self._sprite_feature_memo: Dict[str, Dict[str, object]] = {}
+        self._sprite_feature_fingerprint = b""
         self._sprite_reference_template_cache: Dict[Tuple[str, int], List[Dict[str, object]]] = {}
         self._sprite_reference_template_missing: Set[Tuple[str, int]] = set()
         self._sprite_reference_color_cache: Dict[Tuple[str, int], List[Dict[str, object]]] = {}
@@ -1656,6 +3640,7 @@ class OBSVideoEncounterReader:
             self._sprite_reference_templates_for_species(game_name, species_id)
             self._sprite_reference_color_profiles_for_species(game_name, species_id)
             warmed += 1
+        self._flush_sprite_feature_caches()
 
     def get_last_meta(self) -> Dict[str, object]:
         return dict(self._last_meta) if isinstance(self._last_meta, dict) else {}
@@ -3197,7 +5182,64 @@ class OBSVideoEncounterReader:
         except Exception:
             return []
 
+    def _pixel_array(self, img) -> Optional[Any]:
+        """uint8 ndarray of a PIL image for the NumPy pixel engine; None selects the pure-Python path."""
+        if np is None or img is None or not self._cfg_bool("video_numpy_pixel_engine", True):
+            return None
+        try:
+            return np.asarray(img, dtype=np.uint8)
+        except Exception:
+            return None
+
+    def _grayscale_detail_stats(self, gray_img, detail_threshold: float) -> Optional[Dict[str, float]]:
+        """Mean, detail/dark/bright pixel counts and summed right+down edge deltas of an "L" image."""
+        width = int(getattr(gray_img, "width", 0) or 0)
+        height = int(getattr(gray_img, "height", 0) or 0)
+        arr = self._pixel_array(gray_img)
+        if arr is not None and arr.ndim == 2 and arr.size > 0:
+            total = float(arr.size)
+            values = arr.astype(np.int32)
+            mean = float(int(values.sum())) / total
+            core = values[:-1, :-1]
+            edge_total = float(int(np.abs(core - values[:-1, 1:]).sum()) + int(np.abs(core - values[1:, :-1]).sum()))
+            return {
+                "total": total,
+                "mean": mean,
+                "detail": float(np.count_nonzero(np.abs(values - mean) >= float(detail_threshold))),
+                "dark": float(np.count_nonzero(values <= 86)),
+                "bright": float(np.count_nonzero(values >= 170)),
+                "edge_total": edge_total,
+            }
+
+        pixels = self._image_pixels_flat(gray_img)
+        if not pixels or len(pixels) < width * height:
+            return None
+        total = float(len(pixels))
+        mean = float(sum(int(px) for px in pixels)) / total
+        edge_total = 0.0
+        for y in range(height - 1):
+            row = y * width
+            next_row = (y + 1) * width
+            for x in range(width - 1):
+                idx = row + x
+                px = float(int(pixels[idx]))
+                edge_total += abs(px - float(int(pixels[idx + 1])))
+                edge_total += abs(px - float(int(pixels[next_row + x])))
+        return {
+            "total": total,
+            "mean": mean,
+            "detail": float(sum(1 for px in pixels if abs(float(int(px)) - mean) >= float(detail_threshold))),
+            "dark": float(sum(1 for px in pixels if int(px) <= 86)),
+            "bright": float(sum(1 for px in pixels if int(px) >= 170)),
+            "edge_total": edge_total,
+        }
+
     def _signature_from_grayscale(self, gray_img) -> str:
+        arr = self._pixel_array(gray_img)
+        if arr is not None and arr.ndim == 2 and arr.size == 256:
+            values = arr.astype(np.int32)
+            bits = values >= (float(int(values.sum())) / float(values.size))
+            return np.packbits(bits.ravel()).tobytes().hex()
         pixels = self._image_pixels_flat(gray_img)
         if not pixels:
             return ""
@@ -3219,28 +5261,38 @@ class OBSVideoEncounterReader:
         except Exception:
             return None, 0.0, 0.0
 
-        pixels = self._image_pixels_flat(gray)
         width = int(gray.width)
         height = int(gray.height)
-        if not pixels or width <= 1 or height <= 1:
+        if width <= 1 or height <= 1:
             return None, 0.0, 0.0
-
-        border_values: List[int] = []
-        top_row = 0
-        bottom_row = max(0, (height - 1) * width)
-        for x in range(width):
-            border_values.append(int(pixels[top_row + x]))
-            border_values.append(int(pixels[bottom_row + x]))
-        for y in range(1, max(1, height - 1)):
-            row = y * width
-            border_values.append(int(pixels[row]))
-            border_values.append(int(pixels[row + max(0, width - 1)]))
-
-        if border_values:
-            ordered = sorted(border_values)
-            bg_luma = int(ordered[len(ordered) // 2])
+        arr = self._pixel_array(gray)
+        if arr is not None and arr.shape == (height, width):
+            values = arr.astype(np.int16)
+            border = np.concatenate((values[0], values[height - 1], values[1:height - 1, 0], values[1:height - 1, width - 1]))
+            bg_luma = int(np.partition(border, border.size // 2)[border.size // 2])
+            pixels: List[int] = []
         else:
-            bg_luma = 128
+            arr = None
+            pixels = self._image_pixels_flat(gray)
+            if not pixels:
+                return None, 0.0, 0.0
+
+            border_values: List[int] = []
+            top_row = 0
+            bottom_row = max(0, (height - 1) * width)
+            for x in range(width):
+                border_values.append(int(pixels[top_row + x]))
+                border_values.append(int(pixels[bottom_row + x]))
+            for y in range(1, max(1, height - 1)):
+                row = y * width
+                border_values.append(int(pixels[row]))
+                border_values.append(int(pixels[row + max(0, width - 1)]))
+
+            if border_values:
+                ordered = sorted(border_values)
+                bg_luma = int(ordered[len(ordered) // 2])
+            else:
+                bg_luma = 128
 
         fg_delta = max(8, min(96, self._cfg_int("video_sprite_fg_delta_threshold", 22)))
         min_coverage = max(0.002, min(0.95, self._cfg_float("video_sprite_fg_min_coverage_ratio", 0.010)))
@@ -3261,26 +5313,44 @@ class OBSVideoEncounterReader:
         ]
         delta_candidates = sorted({max(4, min(120, int(v))) for v in delta_candidates})
 
+        # (delta, foreground pixel count, pixel total, bbox, mask image or None) per threshold in the sweep.
+        sweep: List[Tuple[int, int, int, Optional[Tuple[int, int, int, int]], Optional[Any]]] = []
+        if arr is not None:
+            # One |luma - background| pass serves every delta: foreground counts come from a
+            # suffix sum of its histogram, bounding boxes from per-row/per-column maxima.
+            diff = np.abs(values - int(bg_luma))
+            at_least = np.cumsum(np.bincount(diff.ravel(), minlength=256)[::-1])[::-1]
+            row_max = diff.max(axis=1)
+            col_max = diff.max(axis=0)
+            for delta in delta_candidates:
+                fg_count = int(at_least[int(delta)]) if int(delta) < at_least.size else 0
+                rows = np.flatnonzero(row_max >= int(delta))
+                cols = np.flatnonzero(col_max >= int(delta))
+                bbox = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1) if rows.size and cols.size else None
+                sweep.append((int(delta), fg_count, int(diff.size), bbox, None))
+        else:
+            for delta in delta_candidates:
+                try:
+                    mask = gray.point(lambda px, d=int(delta): 255 if abs(int(px) - int(bg_luma)) >= int(d) else 0)
+                    mask_pixels = self._image_pixels_flat(mask)
+                except Exception:
+                    continue
+                if not mask_pixels:
+                    continue
+                sweep.append((int(delta), sum(1 for px in mask_pixels if int(px) > 0), len(mask_pixels), mask.getbbox(), mask))
+
         best_mask = None
+        best_delta = None
         best_bbox = None
         best_area_ratio = 0.0
         best_coverage_ratio = 0.0
         best_score = float("inf")
         best_in_bounds = False
-        for delta in delta_candidates:
-            try:
-                mask = gray.point(lambda px, d=int(delta): 255 if abs(int(px) - int(bg_luma)) >= int(d) else 0)
-                mask_pixels = self._image_pixels_flat(mask)
-            except Exception:
-                continue
-            if not mask_pixels:
-                continue
-            total = float(len(mask_pixels))
-            fg_pixels = sum(1 for px in mask_pixels if int(px) > 0)
-            if fg_pixels < max(16, int(0.002 * len(mask_pixels))):
+        for delta, fg_pixels, pixel_total, bbox, mask in sweep:
+            total = float(pixel_total)
+            if fg_pixels < max(16, int(0.002 * pixel_total)):
                 continue
             coverage_ratio = float(fg_pixels) / total if total > 0 else 0.0
-            bbox = mask.getbbox()
             if not bbox:
                 continue
             bx1, by1, bx2, by2 = bbox
@@ -3300,21 +5370,27 @@ class OBSVideoEncounterReader:
                 + (0.18 if bool(touches_edge) else 0.0)
             )
             if (
-                best_mask is None
+                best_delta is None
                 or float(score) < float(best_score)
                 or (float(score) == float(best_score) and bool(in_bounds) and not bool(best_in_bounds))
             ):
                 best_mask = mask
+                best_delta = int(delta)
                 best_bbox = bbox
                 best_area_ratio = float(area_ratio)
                 best_coverage_ratio = float(coverage_ratio)
                 best_score = float(score)
                 best_in_bounds = bool(in_bounds)
 
-        if best_mask is None or best_bbox is None:
+        if best_delta is None or best_bbox is None:
             return None, 0.0, 0.0
         if float(best_coverage_ratio) < 0.001 or float(best_area_ratio) < 0.001:
             return None, float(best_area_ratio), float(best_coverage_ratio)
+        if best_mask is None:
+            try:
+                best_mask = Image.fromarray(np.where(diff >= int(best_delta), 255, 0).astype(np.uint8))
+            except Exception:
+                return None, float(best_area_ratio), float(best_coverage_ratio)
 
         sprite = crop_rgba.crop(best_bbox)
         alpha = best_mask.crop(best_bbox)
@@ -3344,27 +5420,14 @@ class OBSVideoEncounterReader:
             resample = Image.BILINEAR
 
         metric_img = crop.resize((32, 32), resample)
-        pixels = self._image_pixels_flat(metric_img)
-        if not pixels:
+        stats = self._grayscale_detail_stats(metric_img, 20.0)
+        if not stats:
             return 0, "", 0.0, 0.0
 
-        total = float(len(pixels))
-        mean = float(sum(int(px) for px in pixels)) / total
-        detail_count = sum(1 for px in pixels if abs(float(int(px)) - mean) >= 20.0)
-        detail_ratio = float(detail_count) / total
-
-        edge_total = 0.0
+        detail_ratio = float(stats["detail"]) / float(stats["total"])
+        edge_total = float(stats["edge_total"])
         width = 32
         height = 32
-        for y in range(height - 1):
-            row = y * width
-            next_row = (y + 1) * width
-            for x in range(width - 1):
-                idx = row + x
-                px = float(int(pixels[idx]))
-                edge_total += abs(px - float(int(pixels[idx + 1])))
-                edge_total += abs(px - float(int(pixels[next_row + x])))
-
         max_edge = float((width - 1) * (height - 1) * 255 * 2)
         edge_ratio = (edge_total / max_edge) if max_edge > 0 else 0.0
 
@@ -3401,11 +5464,9 @@ class OBSVideoEncounterReader:
         if not sig_a or not sig_b or len(sig_a) != len(sig_b):
             return 256
         try:
-            bits_a = bin(int(sig_a, 16))[2:].zfill(len(sig_a) * 4)
-            bits_b = bin(int(sig_b, 16))[2:].zfill(len(sig_b) * 4)
+            return int((int(sig_a, 16) ^ int(sig_b, 16)).bit_count())
         except Exception:
             return 256
-        return int(sum(1 for a, b in zip(bits_a, bits_b) if a != b))
 
     def _sprite_present(self, image, sprite_roi_raw: Optional[str] = None) -> Tuple[bool, int, str, float, float]:
         score, signature, detail_ratio, edge_ratio = self._sprite_metrics(image, sprite_roi_raw=sprite_roi_raw)
@@ -3930,9 +5991,6 @@ class OBSVideoEncounterReader:
             except Exception:
                 resample = Image.BILINEAR
             sample = gray.resize((int(sample_w), int(sample_h)), resample)
-            px = self._image_pixels_flat(sample)
-            if not px:
-                return None
             w = int(sample.width)
             h = int(sample.height)
             edge_thr = max(6, min(80, self._cfg_int("video_frame_edge_threshold", 22)))
@@ -3942,25 +6000,40 @@ class OBSVideoEncounterReader:
             max_x = -1
             max_y = -1
             count = 0
-            for y in range(1, h - 1):
-                row = y * w
-                for x in range(1, w - 1):
-                    idx = row + x
-                    center = int(px[idx])
-                    dx = abs(center - int(px[idx + 1]))
-                    dy = abs(center - int(px[idx + w]))
-                    edge = max(dx, dy)
-                    if edge < int(edge_thr):
-                        continue
-                    count += 1
-                    if x < min_x:
-                        min_x = x
-                    if y < min_y:
-                        min_y = y
-                    if x > max_x:
-                        max_x = x
-                    if y > max_y:
-                        max_y = y
+            arr = self._pixel_array(sample)
+            if arr is not None and arr.shape == (h, w):
+                values = arr.astype(np.int16)
+                center = values[1:h - 1, 1:w - 1]
+                edges = np.maximum(np.abs(center - values[1:h - 1, 2:w]), np.abs(center - values[2:h, 1:w - 1])) >= int(edge_thr)
+                count = int(np.count_nonzero(edges))
+                if count > 0:
+                    cols = np.flatnonzero(edges.any(axis=0))
+                    rows = np.flatnonzero(edges.any(axis=1))
+                    min_x, max_x = int(cols[0]) + 1, int(cols[-1]) + 1
+                    min_y, max_y = int(rows[0]) + 1, int(rows[-1]) + 1
+            else:
+                px = self._image_pixels_flat(sample)
+                if not px:
+                    return None
+                for y in range(1, h - 1):
+                    row = y * w
+                    for x in range(1, w - 1):
+                        idx = row + x
+                        center = int(px[idx])
+                        dx = abs(center - int(px[idx + 1]))
+                        dy = abs(center - int(px[idx + w]))
+                        edge = max(dx, dy)
+                        if edge < int(edge_thr):
+                            continue
+                        count += 1
+                        if x < min_x:
+                            min_x = x
+                        if y < min_y:
+                            min_y = y
+                        if x > max_x:
+                            max_x = x
+                        if y > max_y:
+                            max_y = y
             if count < int(min_edges) or max_x <= min_x or max_y <= min_y:
                 return None
             pad_x = max(2, int((max_x - min_x) * 0.05))
@@ -4803,6 +6876,53 @@ class OBSVideoEncounterReader:
 
         return [path_obj for path_obj in candidates if path_obj.exists()]
 
+    def _sprite_feature_cache(self, game_name: str, fingerprint: bytes) -> Optional[SpriteFeatureCache]:
+        if not self._cfg_bool("video_sprite_feature_cache_enabled", True):
+            return None
+        safe_key = re.sub(r"[^a-z0-9]+", "_", self._sprite_reference_variant_key(game_name)).strip("_") or "default"
+        cache_path = self._sprite_library_dir() / SPRITE_FEATURE_CACHE_DIRNAME / f"{safe_key}.pkfc"
+        cache = self._sprite_feature_caches.get(str(cache_path))
+        if cache is not None and cache.fingerprint != fingerprint:
+            # Extraction settings changed mid-session; features from here on belong to a fresh file.
+            cache.close()
+            cache = None
+        if cache is None:
+            cache = SpriteFeatureCache(cache_path, fingerprint)
+            self._sprite_feature_caches[str(cache_path)] = cache
+        return cache
+
+    def _flush_sprite_feature_caches(self):
+        for cache in list(self._sprite_feature_caches.values()):
+            if cache.dirty and cache.flush():
+                log_event(logging.INFO, "sprite_feature_cache_saved", path=str(cache.path), entries=len(cache))
+
+    def _sprite_reference_features(self, game_name: str, sprite_path: Path) -> Optional[Dict[str, object]]:
+        """Signatures, colour profile and template for one reference sprite, read from the feature cache when current."""
+        fingerprint = SpriteFeatureCache.config_fingerprint(self.config)
+        if fingerprint != self._sprite_feature_fingerprint:
+            self._sprite_feature_memo.clear()
+            self._sprite_feature_fingerprint = fingerprint
+        memo_key = str(sprite_path)
+        features = self._sprite_feature_memo.get(memo_key)
+        if features is not None:
+            return features
+        cache = self._sprite_feature_cache(game_name, fingerprint)
+        features = cache.get(sprite_path) if cache is not None else None
+        if features is None:
+            try:
+                with Image.open(sprite_path) as raw_img:
+                    features = {
+                        "signatures": self._sprite_reference_signatures_from_image(raw_img),
+                        "color": self._sprite_color_profile_from_image(raw_img),
+                        "template": self._sprite_template_from_image(raw_img),
+                    }
+            except Exception:
+                return None
+            if cache is not None:
+                cache.put(sprite_path, features)
+        self._sprite_feature_memo[memo_key] = features
+        return features
+
     def _sprite_reference_signatures_from_image(self, image) -> List[str]:
         if image is None or not PIL_AVAILABLE:
             return []
@@ -4879,6 +6999,24 @@ class OBSVideoEncounterReader:
                 signatures.append(signature)
         return signatures
 
+    @staticmethod
+    def _sprite_reference_variant_key(game_name: str) -> str:
+        variant_key = _party_game_variant_from_name(game_name)
+        game_key = re.sub(r"[^a-z0-9]+", "_", str(game_name or "").lower()).strip("_")
+        return f"{str(variant_key)}:{game_key}"
+
+    def _sprite_reference_hamming_query(self, game_name: str, candidate_ids: List[int], query_signatures: List[str]) -> Tuple[Dict[int, int], Tuple[int, int, int]]:
+        """Best reference Hamming distance per candidate species via the packed per-variant index."""
+        variant_key = self._sprite_reference_variant_key(game_name)
+        index = self._sprite_reference_index.get(variant_key)
+        if index is None:
+            index = SpriteSignatureIndex()
+            self._sprite_reference_index[variant_key] = index
+        for species_id in candidate_ids:
+            if not index.has_species(species_id):
+                index.add_species(species_id, self._sprite_reference_signatures_for_species(game_name, species_id))
+        return index.query(query_signatures, candidate_ids)
+
     def _sprite_reference_signatures_for_species(self, game_name: str, species_id: int) -> List[str]:
         try:
             pid = int(species_id)
@@ -4887,9 +7025,7 @@ class OBSVideoEncounterReader:
         if pid <= 0:
             return []
 
-        variant_key = _party_game_variant_from_name(game_name)
-        game_key = re.sub(r"[^a-z0-9]+", "_", str(game_name or "").lower()).strip("_")
-        cache_key = (f"{str(variant_key)}:{game_key}", int(pid))
+        cache_key = (self._sprite_reference_variant_key(game_name), int(pid))
         cached = self._sprite_reference_signature_cache.get(cache_key)
         if isinstance(cached, list):
             return list(cached)
@@ -4899,11 +7035,9 @@ class OBSVideoEncounterReader:
         signatures: List[str] = []
         paths = self._sprite_reference_paths(game_name, pid)
         for sprite_path in paths[:4]:
-            try:
-                with Image.open(sprite_path) as raw_img:
-                    signatures.extend(self._sprite_reference_signatures_from_image(raw_img))
-            except Exception:
-                continue
+            features = self._sprite_reference_features(game_name, sprite_path)
+            if features is not None:
+                signatures.extend(features["signatures"])
 
         deduped: List[str] = []
         seen: Set[str] = set()
@@ -5170,9 +7304,7 @@ class OBSVideoEncounterReader:
         if pid <= 0:
             return []
 
-        variant_key = _party_game_variant_from_name(game_name)
-        game_key = re.sub(r"[^a-z0-9]+", "_", str(game_name or "").lower()).strip("_")
-        cache_key = (f"{str(variant_key)}:{game_key}", int(pid))
+        cache_key = (self._sprite_reference_variant_key(game_name), int(pid))
         cached = self._sprite_reference_color_cache.get(cache_key)
         if isinstance(cached, list):
             return list(cached)
@@ -5182,13 +7314,10 @@ class OBSVideoEncounterReader:
         profiles: List[Dict[str, object]] = []
         paths = self._sprite_reference_paths(game_name, pid)
         for sprite_path in paths[:6]:
-            try:
-                with Image.open(sprite_path) as raw_img:
-                    profile = self._sprite_color_profile_from_image(raw_img)
-                    if isinstance(profile, dict):
-                        profiles.append(profile)
-            except Exception:
-                continue
+            features = self._sprite_reference_features(game_name, sprite_path)
+            profile = features.get("color") if features is not None else None
+            if isinstance(profile, dict):
+                profiles.append(profile)
 
         if profiles:
             self._sprite_reference_color_cache[cache_key] = list(profiles)
@@ -5425,6 +7554,32 @@ class OBSVideoEncounterReader:
         score = (mask_iou * 0.56) + (edge_iou * 0.30) + (intensity * 0.14)
         return float(max(0.0, min(1.0, score)))
 
+    def _sprite_reference_template_scores(self, game_name: str, candidate_ids: List[int], query_tpl: Dict[str, object]) -> Dict[int, float]:
+        """Best template similarity per candidate species that has reference templates."""
+        if np is None:
+            scores: Dict[int, float] = {}
+            for sid in candidate_ids:
+                refs = self._sprite_reference_templates_for_species(game_name, int(sid))
+                if not refs:
+                    continue
+                species_best = 0.0
+                for ref_tpl in refs:
+                    score = float(self._sprite_template_similarity(query_tpl, ref_tpl))
+                    if score > species_best:
+                        species_best = float(score)
+                scores[int(sid)] = float(species_best)
+            return scores
+
+        variant_key = self._sprite_reference_variant_key(game_name)
+        index = self._sprite_template_index.get(variant_key)
+        if index is None:
+            index = SpriteTemplateIndex()
+            self._sprite_template_index[variant_key] = index
+        for sid in candidate_ids:
+            if not index.has_species(sid):
+                index.add_species(sid, self._sprite_reference_templates_for_species(game_name, int(sid)))
+        return index.query(query_tpl, candidate_ids)
+
     def _sprite_reference_templates_for_species(self, game_name: str, species_id: int) -> List[Dict[str, object]]:
         try:
             pid = int(species_id)
@@ -5433,9 +7588,7 @@ class OBSVideoEncounterReader:
         if pid <= 0:
             return []
 
-        variant_key = _party_game_variant_from_name(game_name)
-        game_key = re.sub(r"[^a-z0-9]+", "_", str(game_name or "").lower()).strip("_")
-        cache_key = (f"{str(variant_key)}:{game_key}", int(pid))
+        cache_key = (self._sprite_reference_variant_key(game_name), int(pid))
         cached = self._sprite_reference_template_cache.get(cache_key)
         if isinstance(cached, list):
             return list(cached)
@@ -5445,13 +7598,10 @@ class OBSVideoEncounterReader:
         templates: List[Dict[str, object]] = []
         paths = self._sprite_reference_paths(game_name, pid)
         for sprite_path in paths[:6]:
-            try:
-                with Image.open(sprite_path) as raw_img:
-                    tpl = self._sprite_template_from_image(raw_img)
-                    if isinstance(tpl, dict):
-                        templates.append(tpl)
-            except Exception:
-                continue
+            features = self._sprite_reference_features(game_name, sprite_path)
+            tpl = features.get("template") if features is not None else None
+            if isinstance(tpl, dict):
+                templates.append(tpl)
 
         if templates:
             self._sprite_reference_template_cache[cache_key] = list(templates)
@@ -5481,15 +7631,11 @@ class OBSVideoEncounterReader:
         best_score = 0.0
         second_score = 0.0
 
+        template_scores = self._sprite_reference_template_scores(game_name, candidate_ids, query_tpl)
         for sid in candidate_ids:
-            refs = self._sprite_reference_templates_for_species(game_name, int(sid))
-            if not refs:
+            species_best = template_scores.get(int(sid))
+            if species_best is None:
                 continue
-            species_best = 0.0
-            for ref_tpl in refs:
-                score = float(self._sprite_template_similarity(query_tpl, ref_tpl))
-                if score > species_best:
-                    species_best = float(score)
             if species_best > best_score:
                 second_score = float(best_score)
                 best_score = float(species_best)
@@ -5618,18 +7764,10 @@ class OBSVideoEncounterReader:
         second_rank_key = None
         rank_debug_rows: List[Dict[str, object]] = []
 
+        hamming_by_species, hamming_top2 = self._sprite_reference_hamming_query(game_name, candidate_ids, query_signatures)
+        outline_scores = self._sprite_reference_template_scores(game_name, candidate_ids, query_outline_tpl) if isinstance(query_outline_tpl, dict) else None
         for species_id in candidate_ids:
-            reference_signatures = self._sprite_reference_signatures_for_species(game_name, species_id)
-            if not reference_signatures:
-                continue
-
-            species_best = 999
-            for query_signature in query_signatures:
-                for reference_signature in reference_signatures:
-                    distance = self._sprite_hamming_distance(query_signature, reference_signature)
-                    if distance < species_best:
-                        species_best = int(distance)
-
+            species_best = hamming_by_species.get(int(species_id), 999)
             if species_best >= 999:
                 continue
             color_distance = -1.0
@@ -5648,20 +7786,14 @@ class OBSVideoEncounterReader:
                             color_penalty = int(color_penalty_floor + int(round(float(penalty_span) * float(color_norm))))
             outline_distance = -1.0
             outline_penalty = 0
-            if isinstance(query_outline_tpl, dict):
-                template_profiles = self._sprite_reference_templates_for_species(game_name, species_id)
-                if template_profiles:
-                    best_outline_similarity = 0.0
-                    for profile in template_profiles:
-                        similarity = float(self._sprite_template_similarity(query_outline_tpl, profile))
-                        if similarity > best_outline_similarity:
-                            best_outline_similarity = float(similarity)
-                    if float(best_outline_similarity) > 0.0:
-                        outline_distance = float(max(0.0, min(1.0, 1.0 - float(best_outline_similarity))))
-                        if float(outline_distance) >= float(outline_penalty_gate):
-                            outline_norm = max(0.0, min(1.0, (float(outline_distance) - float(outline_penalty_gate)) / max(0.0001, 1.0 - float(outline_penalty_gate))))
-                            outline_span = max(0, int(outline_penalty_cap) - int(outline_penalty_floor))
-                            outline_penalty = int(outline_penalty_floor + int(round(float(outline_span) * float(outline_norm))))
+            if outline_scores is not None:
+                best_outline_similarity = float(outline_scores.get(int(species_id), 0.0))
+                if float(best_outline_similarity) > 0.0:
+                    outline_distance = float(max(0.0, min(1.0, 1.0 - float(best_outline_similarity))))
+                    if float(outline_distance) >= float(outline_penalty_gate):
+                        outline_norm = max(0.0, min(1.0, (float(outline_distance) - float(outline_penalty_gate)) / max(0.0001, 1.0 - float(outline_penalty_gate))))
+                        outline_span = max(0, int(outline_penalty_cap) - int(outline_penalty_floor))
+                        outline_penalty = int(outline_penalty_floor + int(round(float(outline_span) * float(outline_norm))))
             adjusted_distance = int(species_best) + int(color_penalty) + int(outline_penalty)
             if bool(color_primary) and bool(use_color_rerank) and query_color is not None and float(color_distance) >= 0.0 and float(outline_distance) >= 0.0:
                 rank_key = (round(float(color_distance), 6), round(float(outline_distance), 6), int(species_best), int(adjusted_distance))
@@ -5812,6 +7944,7 @@ class OBSVideoEncounterReader:
             "second_color_distance": float(second_color_distance),
             "distance_margin": int(gate_margin_value),
             "hamming_distance_margin": int(margin_value),
+            "hamming_index_top2": [int(hamming_top2[0]), int(hamming_top2[1]), int(hamming_top2[2])],
             "effective_distance_margin": int(gate_margin_value),
             "distance_margin_source": str(gate_margin_source),
             "color_distance_margin": float(color_distance_margin),
@@ -5928,8 +8061,8 @@ class OBSVideoEncounterReader:
             resample = Image.BILINEAR
 
         metric_img = crop.resize((48, 18), resample)
-        pixels = self._image_pixels_flat(metric_img)
-        if not pixels:
+        stats = self._grayscale_detail_stats(metric_img, 16.0)
+        if not stats:
             return {
                 "score": 0.0,
                 "detail_ratio": 0.0,
@@ -5939,27 +8072,14 @@ class OBSVideoEncounterReader:
                 "contrast_ratio": 0.0,
             }
 
-        total = float(len(pixels))
-        mean = float(sum(int(px) for px in pixels)) / total
-        detail_count = sum(1 for px in pixels if abs(float(int(px)) - mean) >= 16.0)
-        dark_count = sum(1 for px in pixels if int(px) <= 86)
-        bright_count = sum(1 for px in pixels if int(px) >= 170)
-        detail_ratio = float(detail_count) / total
-        dark_ratio = float(dark_count) / total
-        bright_ratio = float(bright_count) / total
+        total = float(stats["total"])
+        detail_ratio = float(stats["detail"]) / total
+        dark_ratio = float(stats["dark"]) / total
+        bright_ratio = float(stats["bright"]) / total
 
-        edge_total = 0.0
+        edge_total = float(stats["edge_total"])
         width = 48
         height = 18
-        for y in range(height - 1):
-            row = y * width
-            next_row = (y + 1) * width
-            for x in range(width - 1):
-                idx = row + x
-                px = float(int(pixels[idx]))
-                edge_total += abs(px - float(int(pixels[idx + 1])))
-                edge_total += abs(px - float(int(pixels[next_row + x])))
-
         max_edge = float((width - 1) * (height - 1) * 255 * 2)
         edge_ratio = (edge_total / max_edge) if max_edge > 0 else 0.0
         contrast_ratio = min(float(dark_ratio), float(bright_ratio))
@@ -7437,9 +9557,8 @@ class OBSVideoEncounterReader:
         if width <= 0 or height <= 0:
             return 0
 
-        try:
-            import numpy as np
-            arr = np.array(crop)
+        arr = self._pixel_array(crop)
+        if arr is not None and arr.ndim == 3 and arr.shape[2] >= 3:
             sampled = arr[::sample_step, ::sample_step]
             r = sampled[:, :, 0].astype(np.int16)
             g = sampled[:, :, 1].astype(np.int16)
@@ -7455,7 +9574,7 @@ class OBSVideoEncounterReader:
             green_spark = (g >= 210) & (r <= 180) & (b <= 190)
             sparkle = bright & (near_white | warm_spark | cool_spark | pink_spark | green_spark)
             sparkle_count = int(np.count_nonzero(sparkle))
-        except (ImportError, Exception):
+        else:
             pixels = crop.load()
             total = 0
             sparkle_count = 0
@@ -11747,6 +13866,238 @@ class OBSVideoEncounterReader:
         }
 
 
+class VideoEncounterWorker:
+    """Runs video encounter reads on a dedicated thread with latest-frame semantics.
+
+    The UI submits one request per poll tick into a single-slot mailbox. A request
+    that has not started by the time the next one arrives is dropped, so the worker
+    always analyses the freshest frame and never builds a backlog. Finished reads go
+    to a FIFO the UI drains, because every one of them may carry an encounter event.
+    """
+
+    def __init__(self, run: Callable[[Dict[str, object]], Dict[str, object]], name: str = "video-encounter"):
+        self._run = run
+        self._name = str(name or "video-encounter")
+        self._cond = threading.Condition()
+        self._pending: Optional[Dict[str, object]] = None
+        self._busy = False
+        self._stopping = False
+        self._seq = 0
+        self._thread: Optional[threading.Thread] = None
+        self._results: queue.Queue = queue.Queue()
+        self._stats = {
+            "submitted": 0,
+            "dropped": 0,
+            "completed": 0,
+            "failed": 0,
+            "run_ms_total": 0.0,
+            "run_ms_max": 0.0,
+            "latency_ms_max": 0.0,
+        }
+
+    def start(self) -> None:
+        """Start the worker thread if it is not already running."""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._worker_loop, name=self._name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the worker; an unstarted request is discarded, a running one finishes first."""
+        with self._cond:
+            thread = self._thread
+            self._stopping = True
+            if self._pending is not None:
+                self._pending = None
+                self._stats["dropped"] += 1
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=max(0.0, float(timeout)))
+        with self._cond:
+            self._thread = None
+
+    def is_running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def is_busy(self) -> bool:
+        """True while a request is queued or being processed."""
+        with self._cond:
+            return bool(self._busy or self._pending is not None)
+
+    def submit(self, request: Dict[str, object]) -> bool:
+        """Offer ``request`` as the latest job; returns True when it replaced a stale one."""
+        job = dict(request) if isinstance(request, dict) else {}
+        with self._cond:
+            self._seq += 1
+            job["seq"] = int(self._seq)
+            job["submitted_at"] = time.perf_counter()
+            replaced = self._pending is not None
+            if replaced:
+                self._stats["dropped"] += 1
+            self._pending = job
+            self._stats["submitted"] += 1
+            self._cond.notify()
+        return bool(replaced)
+
+    def get_result(self) -> Optional[Dict[str, object]]:
+        """Oldest finished result, or None when nothing new has been produced."""
+        try:
+            return self._results.get_nowait()
+        except queue.Empty:
+            return None
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._cond:
+            finished = max(1, int(self._stats["completed"]) + int(self._stats["failed"]))
+            return {
+                "submitted": int(self._stats["submitted"]),
+                "dropped": int(self._stats["dropped"]),
+                "completed": int(self._stats["completed"]),
+                "failed": int(self._stats["failed"]),
+                "run_ms_avg": round(float(self._stats["run_ms_total"]) / finished, 2),
+                "run_ms_max": round(float(self._stats["run_ms_max"]), 2),
+                "latency_ms_max": round(float(self._stats["latency_ms_max"]), 2),
+                "pending_results": int(self._results.qsize()),
+            }
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    break
+                job = self._pending
+                self._pending = None
+                self._busy = True
+            started = time.perf_counter()
+            try:
+                result = self._run(job)
+                error = ""
+            except Exception as exc:
+                result = {}
+                error = str(exc)
+                log_event(logging.WARNING, "video_worker_job_failed", seq=job.get("seq"), error=error)
+            finished = time.perf_counter()
+            payload = dict(job)
+            payload.update(result if isinstance(result, dict) else {})
+            payload["error"] = error
+            payload["run_ms"] = (finished - started) * 1000.0
+            with self._cond:
+                self._busy = False
+                self._stats["completed" if not error else "failed"] += 1
+                self._stats["run_ms_total"] += float(payload["run_ms"])
+                self._stats["run_ms_max"] = max(float(self._stats["run_ms_max"]), float(payload["run_ms"]))
+                latency_ms = (finished - float(job.get("submitted_at", started) or started)) * 1000.0
+                self._stats["latency_ms_max"] = max(float(self._stats["latency_ms_max"]), float(latency_ms))
+            self._results.put(payload)
+
+
+def _parse_layout_address(value: object) -> Optional[int]:
+    if isinstance(value, int):
+        return int(value)
+    if not value:
+        return None
+    try:
+        return int(str(value), 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_layout_offset(value: object) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class GameMemoryLayout:
+    """Per-game memory layout with hex strings pre-parsed to ints (see PokemonMemoryReader.get_game_layout)."""
+    gen: int
+    max_pokemon: int
+    party_slot_size: int
+    layout_id: Optional[str] = None
+    pokedex_caught: Optional[int] = None
+    pokedex_seen: Optional[int] = None
+    pokedex_count: Optional[int] = None
+    party_count: Optional[int] = None
+    party_start: Optional[int] = None
+    badge_address: Optional[int] = None
+    champion_address: Optional[int] = None
+    hall_of_fame_address: Optional[int] = None
+    map_group: Optional[int] = None
+    map_number: Optional[int] = None
+    saveblock1_ptr: Optional[int] = None
+    saveblock2_ptr: Optional[int] = None
+    party_count_offset: Optional[int] = None
+    party_start_offset: Optional[int] = None
+    pokedex_caught_offset: Optional[int] = None
+    pokedex_seen_offset: Optional[int] = None
+    saveblock1_flags_offset: Optional[int] = None
+
+    ADDRESS_FIELDS = (
+        "pokedex_caught", "pokedex_seen", "pokedex_count", "party_count", "party_start", "badge_address",
+        "champion_address", "hall_of_fame_address", "map_group", "map_number", "saveblock1_ptr", "saveblock2_ptr",
+    )
+    OFFSET_FIELDS = (
+        "party_count_offset", "party_start_offset", "pokedex_caught_offset", "pokedex_seen_offset", "saveblock1_flags_offset",
+    )
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "GameMemoryLayout":
+        gen = int(config.get("gen", 1) or 1)
+        fields: Dict[str, object] = {
+            "gen": gen,
+            "max_pokemon": int(config.get("max_pokemon") or (151 if gen == 1 else (251 if gen == 2 else 386))),
+            "party_slot_size": int(config.get("party_slot_size") or 0),
+            "layout_id": str(config["layout_id"]) if config.get("layout_id") else None,
+        }
+        for key in cls.ADDRESS_FIELDS:
+            fields[key] = _parse_layout_address(config.get(key))
+        for key in cls.OFFSET_FIELDS:
+            fields[key] = _parse_layout_offset(config.get(key))
+        return cls(**fields)
+
+    @property
+    def pokedex_bytes(self) -> int:
+        return (self.max_pokemon + 7) // 8
+
+
+def _gen3_text_translation(charmap: Dict[int, str]) -> Dict[int, str]:
+    """Build a full 256-entry str.translate table: 0xFE is a space, unmapped non-ASCII bytes render as "?"."""
+    table: Dict[int, str] = {}
+    for byte_value in range(256):
+        if byte_value == 0xFE:
+            table[byte_value] = " "
+        elif byte_value in charmap:
+            table[byte_value] = charmap[byte_value]
+        elif 32 <= byte_value <= 126:
+            table[byte_value] = chr(byte_value)
+        else:
+            table[byte_value] = "?"
+    return table
+
+
+def _gen3_substruct_offsets(*order_tables: List[Tuple[int, int, int, int]]) -> Tuple[Tuple[Tuple[int, int, int], ...], ...]:
+    """Precompute (growth, attacks, misc) byte offsets per personality % 24, deduplicated across order tables."""
+    table: List[Tuple[Tuple[int, int, int], ...]] = []
+    for index in range(24):
+        offsets: List[Tuple[int, int, int]] = []
+        for orders in order_tables:
+            order = tuple(orders[index])
+            entry = (order.index(0) * 12, order.index(1) * 12, order.index(3) * 12)
+            if entry not in offsets:
+                offsets.append(entry)
+        table.append(tuple(offsets))
+    return tuple(table)
+
+
 class PokemonMemoryReader:
     """Reads Pokemon data from game memory"""
     
@@ -12209,6 +14560,17 @@ class PokemonMemoryReader:
         (1, 2, 0, 3), (1, 3, 0, 2), (2, 1, 0, 3), (3, 1, 0, 2), (2, 3, 0, 1), (3, 2, 0, 1),
         (1, 2, 3, 0), (1, 3, 2, 0), (2, 1, 3, 0), (3, 1, 2, 0), (2, 3, 1, 0), (3, 2, 1, 0),
     ]
+    # Decode tables: substructure offsets for both order tables, plus packed
+    # little-endian layouts for the header, the 48-byte secure block and party stats.
+    GEN3_SUBSTRUCT_OFFSETS = _gen3_substruct_offsets(GEN3_PARTY_SUBSTRUCT_ORDERS, GEN3_PARTY_SUBSTRUCT_ORDERS_ALT)
+    GEN3_SLOT_HEADER = struct.Struct("<II")
+    GEN3_SECURE_WORDS = struct.Struct("<12I")
+    GEN3_SECURE_HALFWORDS = struct.Struct("<24H")
+    GEN3_GROWTH_HEAD = struct.Struct("<HHI")
+    GEN3_ATTACKS = struct.Struct("<4H4B")
+    GEN3_PARTY_STATS = struct.Struct("<7H")
+    GEN3_U16 = struct.Struct("<H")
+    GEN3_U32 = struct.Struct("<I")
     GEN3_INTERNAL_SPECIES_MAX = 411
     GEN3_INTERNAL_UNOWN_START = 252
     GEN3_INTERNAL_UNOWN_END = 276
@@ -12259,6 +14621,8 @@ class PokemonMemoryReader:
         0xB9: "/",
         0xBA: " ",
     }
+    # str.translate table over latin-1 decoded bytes, built once from the charmap.
+    GEN3_TEXT_TRANSLATION = _gen3_text_translation(GEN3_TEXT_CHARMAP)
     GEN3_NATURE_NAMES = [
         "Hardy", "Lonely", "Brave", "Adamant", "Naughty",
         "Bold", "Docile", "Relaxed", "Impish", "Lax",
@@ -12271,6 +14635,13 @@ class PokemonMemoryReader:
         self.retroarch = retroarch
         self._saveblock_ptr_backoff_until: Dict[str, float] = {}
         self._saveblock_ptr_fail_count: Dict[str, int] = {}
+        # Saveblock pointers resolved this poll (None outside begin_poll/end_poll) and the last good value per
+        # pointer; a changed value is the relocation signal (Gen 3 moves SaveBlock1/2 on map transitions).
+        # The cache belongs to the poll thread (like the RAM snapshot); other threads always read fresh.
+        self._saveblock_ptr_poll_cache: Optional[Dict[str, Optional[int]]] = None
+        self._saveblock_ptr_poll_thread_id: Optional[int] = None
+        self._saveblock_ptr_last_value: Dict[str, int] = {}
+        self._saveblock_ptr_stats: Dict[str, int] = {"reads": 0, "shared": 0, "relocations": 0}
         self._pointer_unreadable_last_log: Dict[str, float] = {}
         self._pointer_fallback_last_log: Dict[str, float] = {}
         self._pokedex_seen_less_last_log: Dict[str, float] = {}
@@ -12289,12 +14660,37 @@ class PokemonMemoryReader:
         self._party_budget_hit_last_log: Dict[str, float] = {}
         self._party_budget_hit_suppressed: Dict[str, int] = {}
         self._party_budget_hit_consecutive_failures: Dict[str, int] = {}
-        self._gen3_gender_rates: Dict[int, int] = {}
-        self._gen3_species_ability_ids: Dict[int, Tuple[int, int]] = {}
-        self._gen3_ability_names: Dict[int, str] = {}
-        self._gen3_move_names: Dict[int, str] = {}
-        self._gen3_internal_to_national: Dict[int, int] = {}
-        self._load_gen3_reference_data()
+        # Change-detection memos: skip decoding when the raw party/slot bytes are unchanged.
+        self._party_decode_memo: Dict[str, Dict[str, object]] = {}
+        # Per-thread state of the in-flight read_party call: its (start address, bytes) bulk
+        # count+slots block and read counter. The poll thread and the Tk thread both read the party.
+        self._party_call_local = threading.local()
+        self._party_read_stats: Dict[str, int] = {"calls": 0, "reads": 0, "block_hits": 0, "block_retries": 0, "block_failures": 0, "over_budget": 0}
+        self._party_read_budget_last_log = 0.0
+        self._slot_details_memo: Dict[Tuple[object, ...], Optional[Dict[str, object]]] = {}
+        self._gen3_text_memo: Dict[bytes, str] = {}
+        self._nickname_memo: Dict[Tuple[bytes, str], Optional[str]] = {}
+        self._gen3_decode_limits_cache: Optional[Tuple[Dict[int, str], int, Tuple[int, int]]] = None
+        self._decode_memo_stats: Dict[str, int] = {"party_hits": 0, "party_misses": 0, "slot_hits": 0, "slot_misses": 0}
+        # Resolved configs/layouts per game name; game tables are static for the process lifetime.
+        self._game_config_cache: Dict[str, Optional[Dict]] = {}
+        self._game_layout_cache: Dict[str, Tuple[Dict, GameMemoryLayout]] = {}
+        # Gen 3 reference tables (_gen3_gender_rates, _gen3_move_names, ...) are deliberately not
+        # initialized here: they load on first access via __getattr__, so Gen 1/2 sessions skip them.
+        # The lock keeps the poll thread and the Tk thread from loading them twice.
+        self._gen3_reference_lock = threading.Lock()
+
+    GEN3_REFERENCE_ATTRS = frozenset({
+        "_gen3_gender_rates", "_gen3_species_ability_ids", "_gen3_ability_names", "_gen3_move_names", "_gen3_internal_to_national",
+    })
+
+    def __getattr__(self, name: str):
+        if name in PokemonMemoryReader.GEN3_REFERENCE_ATTRS:
+            with self._gen3_reference_lock:
+                if name not in self.__dict__:
+                    self._load_gen3_reference_data()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
     @staticmethod
     def _humanize_identifier(identifier: str) -> str:
@@ -12314,6 +14710,55 @@ class PokemonMemoryReader:
 
     def _load_gen3_reference_data(self):
         """Load Gen 3 metadata lookup tables for party detail decoding."""
+        if not self._load_gen3_reference_data_from_bundle():
+            self._load_gen3_reference_data_from_json()
+
+        if not (
+            self._gen3_gender_rates
+            and self._gen3_species_ability_ids
+            and self._gen3_ability_names
+            and self._gen3_move_names
+            and self._gen3_internal_to_national
+        ):
+            log_event(
+                logging.WARNING,
+                "gen3_reference_data_incomplete",
+                genders=len(self._gen3_gender_rates),
+                species_abilities=len(self._gen3_species_ability_ids),
+                abilities=len(self._gen3_ability_names),
+                moves=len(self._gen3_move_names),
+                internal_species_map=len(self._gen3_internal_to_national),
+            )
+        else:
+            log_event(
+                logging.INFO,
+                "gen3_reference_data_loaded",
+                genders=len(self._gen3_gender_rates),
+                species_abilities=len(self._gen3_species_ability_ids),
+                abilities=len(self._gen3_ability_names),
+                moves=len(self._gen3_move_names),
+                internal_species_map=len(self._gen3_internal_to_national),
+            )
+
+    def _load_gen3_reference_data_from_bundle(self) -> bool:
+        """Take the pre-normalized Gen 3 tables from the reference bundle; False when any section is missing or stale."""
+        bundle = _get_reference_bundle()
+        if bundle is None:
+            return False
+        sections = {
+            name: bundle.section(f"gen3/{name}")
+            for name in ("gender_map", "species_abilities", "ability_names", "move_names", "internal_to_national")
+        }
+        if any(value is None for value in sections.values()):
+            return False
+        self._gen3_gender_rates = {int(key): int(value) for key, value in sections["gender_map"]}
+        self._gen3_species_ability_ids = {int(key): (int(first), int(second)) for key, first, second in sections["species_abilities"]}
+        self._gen3_ability_names = dict(sections["ability_names"])
+        self._gen3_move_names = dict(sections["move_names"])
+        self._gen3_internal_to_national = {int(key): int(value) for key, value in sections["internal_to_national"]}
+        return True
+
+    def _load_gen3_reference_data_from_json(self):
         base_dir = Path(__file__).resolve().parent
         gender_path = base_dir / "gen3_gender_map.json"
         species_ability_path = base_dir / "gen3_species_abilities.json"
@@ -12408,76 +14853,65 @@ class PokemonMemoryReader:
                 internal_to_national[internal_species] = national_species
         self._gen3_internal_to_national = internal_to_national
 
-        if not (
-            self._gen3_gender_rates
-            and self._gen3_species_ability_ids
-            and self._gen3_ability_names
-            and self._gen3_move_names
-            and self._gen3_internal_to_national
-        ):
-            log_event(
-                logging.WARNING,
-                "gen3_reference_data_incomplete",
-                genders=len(self._gen3_gender_rates),
-                species_abilities=len(self._gen3_species_ability_ids),
-                abilities=len(self._gen3_ability_names),
-                moves=len(self._gen3_move_names),
-                internal_species_map=len(self._gen3_internal_to_national),
-            )
-        else:
-            log_event(
-                logging.INFO,
-                "gen3_reference_data_loaded",
-                genders=len(self._gen3_gender_rates),
-                species_abilities=len(self._gen3_species_ability_ids),
-                abilities=len(self._gen3_ability_names),
-                moves=len(self._gen3_move_names),
-                internal_species_map=len(self._gen3_internal_to_national),
-            )
-
     def get_pokemon_name(self, pokemon_id: int) -> str:
         """Get Pokemon name from ID"""
         return self.POKEMON_NAMES.get(pokemon_id, f"Pokemon #{pokemon_id}")
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _normalize_comparable_name(value: object) -> str:
         """Normalize names for nickname/species comparisons."""
         return re.sub(r"[^A-Za-z0-9]+", "", str(value or "")).upper()
 
-    def _decode_gen3_text(self, raw_bytes: object) -> str:
-        """Decode Gen 3 text bytes using a conservative character map."""
-        if not isinstance(raw_bytes, (list, tuple, bytes, bytearray)):
-            return ""
+    TEXT_MEMO_MAX = 512
 
-        rendered: List[str] = []
+    @staticmethod
+    def _gen3_text_bytes(raw_bytes: object) -> Optional[bytes]:
+        """Coerce raw text input to bytes, masking wide values and skipping non-integers."""
+        if isinstance(raw_bytes, (bytes, bytearray)):
+            return bytes(raw_bytes)
+        if not isinstance(raw_bytes, (list, tuple)):
+            return None
+        buffer = bytearray()
         for raw_value in raw_bytes:
             try:
-                byte_value = int(raw_value) & 0xFF
+                buffer.append(int(raw_value) & 0xFF)
             except (TypeError, ValueError):
                 continue
-            if byte_value == int(self.GEN3_TEXT_TERMINATOR):
-                break
-            if byte_value == 0xFE:
-                rendered.append(" ")
-                continue
-            mapped = self.GEN3_TEXT_CHARMAP.get(byte_value)
-            if isinstance(mapped, str):
-                rendered.append(mapped)
-            elif 32 <= byte_value <= 126:
-                rendered.append(chr(byte_value))
-            else:
-                rendered.append("?")
+        return bytes(buffer)
+
+    def _decode_gen3_text(self, raw_bytes: object) -> str:
+        """Decode Gen 3 text bytes using a conservative character map."""
+        raw = self._gen3_text_bytes(raw_bytes)
+        if raw is None:
+            return ""
+        cached = self._gen3_text_memo.get(raw)
+        if cached is not None:
+            return cached
 
-        text = "".join(rendered).replace("\x00", "").strip()
-        return re.sub(r"\s+", " ", text)
+        terminator = raw.find(int(self.GEN3_TEXT_TERMINATOR))
+        visible = raw if terminator < 0 else raw[:terminator]
+        text = visible.decode("latin-1").translate(self.GEN3_TEXT_TRANSLATION).replace("\x00", "")
+        text = " ".join(text.split())
+        if len(self._gen3_text_memo) >= int(self.TEXT_MEMO_MAX):
+            self._gen3_text_memo.clear()
+        self._gen3_text_memo[raw] = text
+        return text
 
     def _resolve_gen3_nickname(self, raw_nickname_bytes: object, species_name: str) -> Optional[str]:
         """Return a custom nickname when it differs from species name."""
-        nickname = self._decode_gen3_text(raw_nickname_bytes)
-        if not nickname:
-            return None
-        if self._normalize_comparable_name(nickname) == self._normalize_comparable_name(species_name):
+        raw = self._gen3_text_bytes(raw_nickname_bytes)
+        if raw is None:
             return None
+        memo_key = (raw, str(species_name))
+        if memo_key in self._nickname_memo:
+            return self._nickname_memo[memo_key]
+        nickname: Optional[str] = self._decode_gen3_text(raw)
+        if not nickname or self._normalize_comparable_name(nickname) == self._normalize_comparable_name(species_name):
+            nickname = None
+        if len(self._nickname_memo) >= int(self.TEXT_MEMO_MAX):
+            self._nickname_memo.clear()
+        self._nickname_memo[memo_key] = nickname
         return nickname
 
     def _resolve_gen1_species_id(self, raw_species_id: int) -> int:
@@ -12547,7 +14981,31 @@ class PokemonMemoryReader:
         return normalized
 
     def get_game_config(self, game_name: str) -> Optional[Dict]:
-        """Get memory addresses for current game - uses game_configs when available"""
+        """Get memory addresses for current game - uses game_configs when available
+
+        Resolved once per game name; callers must treat the returned dict as read-only.
+        """
+        cache_key = str(game_name)
+        if cache_key in self._game_config_cache:
+            return self._game_config_cache[cache_key]
+        config = self._resolve_game_config(cache_key)
+        self._game_config_cache[cache_key] = config
+        return config
+
+    def get_game_layout(self, game_name: str) -> Optional[GameMemoryLayout]:
+        """Precompiled integer layout for a game, rebuilt only when get_game_config returns a different dict."""
+        config = self.get_game_config(game_name) if game_name else None
+        if not config:
+            return None
+        cached = self._game_layout_cache.get(str(game_name))
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        layout = GameMemoryLayout.from_config(config)
+        # Holding the config keeps its identity stable for the `is` check above.
+        self._game_layout_cache[str(game_name)] = (config, layout)
+        return layout
+
+    def _resolve_game_config(self, game_name: str) -> Optional[Dict]:
         # Strip ROM hack suffixes like "(Enhanced)", "(U)", etc.
         clean_name = re.sub(r'\([^)]*\)', '', game_name).strip()
         game_key = clean_name.lower().replace(" ", "_").replace("'", "").strip()
@@ -12619,11 +15077,41 @@ class PokemonMemoryReader:
 
         return {"ok": len(failures) == 0, "failures": failures, "warnings": warnings, "checks": checks}
 
+    def _read_memory_buffer(self, address: str, num_bytes: int) -> Optional[bytes]:
+        """Read a raw byte buffer, using the client's zero-parse read_bytes path when available."""
+        try:
+            size = int(num_bytes)
+        except (TypeError, ValueError):
+            return None
+        if size <= 0:
+            return None
+        read_bytes = getattr(self.retroarch, "read_bytes", None)
+        if callable(read_bytes):
+            data = read_bytes(address, size)
+            if isinstance(data, (bytes, bytearray)) and len(data) >= size:
+                return bytes(data[:size])
+            return None
+        values = self.retroarch.read_memory(address, size)
+        if size == 1 and isinstance(values, int):
+            values = [values]
+        if isinstance(values, list) and len(values) >= size:
+            if all(isinstance(v, int) and 0 <= int(v) <= 0xFF for v in values[:size]):
+                return bytes(values[:size])
+        return None
+
+    @staticmethod
+    def _decode_flag_buffer(buffer: object, max_ids: int) -> List[int]:
+        """Return 1-based ids of set bits (LSB-first per byte) in a flag buffer."""
+        bits = int.from_bytes(bytes(buffer), "little")
+        if max_ids > 0:
+            bits &= (1 << int(max_ids)) - 1
+        return flag_ids_from_bits(bits)
+
     def _read_u32_le(self, address: str) -> Optional[int]:
         """Read a 32-bit little-endian value from memory."""
-        values = self.retroarch.read_memory(address, 4)
-        if isinstance(values, list) and len(values) >= 4:
-            return int(values[0]) | (int(values[1]) << 8) | (int(values[2]) << 16) | (int(values[3]) << 24)
+        data = self._read_memory_buffer(address, 4)
+        if data is not None:
+            return int.from_bytes(data[:4], "little")
 
         # Fallback to single-byte reads for cores that only return one byte per command.
         bytes_out: List[int] = []
@@ -12639,13 +15127,44 @@ class PokemonMemoryReader:
             bytes_out.append(val)
 
         return int(bytes_out[0]) | (int(bytes_out[1]) << 8) | (int(bytes_out[2]) << 16) | (int(bytes_out[3]) << 24)
+
+    def begin_poll(self):
+        """Resolve each saveblock pointer at most once until end_poll(); readers on this thread share the result."""
+        self._saveblock_ptr_poll_cache = {}
+        self._saveblock_ptr_poll_thread_id = threading.get_ident()
+
+    def end_poll(self):
+        self._saveblock_ptr_poll_cache = None
+        self._saveblock_ptr_poll_thread_id = None
+
+    def get_saveblock_pointer_stats(self) -> Dict[str, int]:
+        return dict(self._saveblock_ptr_stats)
+
     def _resolve_gen3_saveblock_ptr(self, pointer_addr: str, game_name: Optional[str] = None) -> Optional[int]:
         """Resolve a Gen 3 save block pointer and validate EWRAM range."""
         key = f"{(game_name or '').lower()}:{str(pointer_addr).lower()}"
+        poll_cache = self._saveblock_ptr_poll_cache if self._saveblock_ptr_poll_thread_id == threading.get_ident() else None
+        if poll_cache is not None and key in poll_cache:
+            self._saveblock_ptr_stats["shared"] += 1
+            return poll_cache[key]
+
+        ptr = self._read_gen3_saveblock_ptr(pointer_addr, key)
+        if ptr is not None:
+            previous = self._saveblock_ptr_last_value.get(key)
+            if previous is not None and previous != ptr:
+                self._saveblock_ptr_stats["relocations"] += 1
+                log_event(logging.DEBUG, "gen3_saveblock_relocated", game=game_name, pointer=str(pointer_addr), old=hex(previous), new=hex(ptr))
+            self._saveblock_ptr_last_value[key] = ptr
+        if poll_cache is not None:
+            poll_cache[key] = ptr
+        return ptr
+
+    def _read_gen3_saveblock_ptr(self, pointer_addr: str, key: str) -> Optional[int]:
         now = time.time()
         if float(self._saveblock_ptr_backoff_until.get(key, 0.0)) > now:
             return None
 
+        self._saveblock_ptr_stats["reads"] += 1
         ptr = self._read_u32_le(pointer_addr)
         if ptr is None:
             failures = int(self._saveblock_ptr_fail_count.get(key, 0)) + 1
@@ -12665,6 +15184,7 @@ class PokemonMemoryReader:
         self._saveblock_ptr_fail_count[key] = failures
         self._saveblock_ptr_backoff_until[key] = now + min(20.0, 1.5 * failures)
         return None
+
     def _resolve_gen3_saveblock1_base(self, config: Dict, game_name: Optional[str] = None) -> Optional[int]:
         """Resolve SaveBlock1 base from pointer or static fallback math."""
         ptr_addr = config.get("saveblock1_ptr")
@@ -12857,6 +15377,40 @@ class PokemonMemoryReader:
 
         return None
 
+    # Refresh periods (seconds) for regions this reader subscribes to on the poll scheduler.
+    PARTY_REGION_PERIOD_S = 0.0
+    LOCATION_REGION_PERIOD_S = 0.5
+
+    def poll_region_subscriptions(self, game_name: str) -> List[Tuple[str, List[Tuple[str, int]], float, int]]:
+        """Regions this reader wants refreshed each poll tick as ``(owner, regions, period_s, priority)``.
+
+        Party state changes constantly, so it is refetched every tick; the map bytes feed hunt route
+        detection on the GUI thread, which reuses them while they are younger than their period.
+        Wild-encounter reads are not subscribed: they stay on the live hunt-priority path.
+        """
+        layout = self.get_game_layout(game_name) if game_name else None
+        if layout is None:
+            return []
+        party: List[Tuple[int, int]] = []
+        if layout.party_count is not None:
+            party.append((layout.party_count, 1))
+        if layout.party_start is not None and layout.party_slot_size > 0:
+            party.append((layout.party_start, layout.party_slot_size * 6))
+        if layout.gen == 3:
+            # Saveblock pointers move on map transitions; every pointer-relative read depends on them.
+            for pointer in (layout.saveblock1_ptr, layout.saveblock2_ptr):
+                if pointer is not None:
+                    party.append((pointer, 4))
+        location: List[Tuple[int, int]] = []
+        if layout.gen != 3:
+            location = [(address, 1) for address in (layout.map_group, layout.map_number) if address is not None]
+        subscriptions: List[Tuple[str, List[Tuple[object, int]], float, int]] = []
+        if party:
+            subscriptions.append(("party", party, float(self.PARTY_REGION_PERIOD_S), RetroArchClient.IO_PRIORITY_COLLECTION))
+        if location:
+            subscriptions.append(("location", location, float(self.LOCATION_REGION_PERIOD_S), RetroArchClient.IO_PRIORITY_HUNT))
+        return subscriptions
+
     def read_current_location(self, game_name: str) -> Optional[str]:
         config = self.get_game_config(game_name)
         if not config:
@@ -13074,31 +15628,60 @@ class PokemonMemoryReader:
         )
         return None
 
-    def read_gen3_event_flag(self, game_name: str, flag_id: int) -> Optional[bool]:
-        """Read a Gen 3 event flag from SaveBlock1 flags array."""
+    def read_gen3_event_flag(self, game_name: str, flag_id: int) -> Optional[bool]:
+        """Read a Gen 3 event flag from SaveBlock1 flags array."""
+        try:
+            flag = int(flag_id)
+        except (TypeError, ValueError):
+            return None
+        return self.read_gen3_event_flags(game_name, [flag]).get(flag)
+
+    def read_gen3_event_flags(self, game_name: str, flag_ids: Iterable[int]) -> Dict[int, Optional[bool]]:
+        """Read several Gen 3 event flags from one SaveBlock1 flags-region read (None = unreadable)."""
+        flags: List[int] = []
+        for flag_id in flag_ids:
+            try:
+                flag = int(flag_id)
+            except (TypeError, ValueError):
+                continue
+            if flag >= 0:
+                flags.append(flag)
+        results: Dict[int, Optional[bool]] = {flag: None for flag in flags}
+        if not flags:
+            return results
+
         config = self.get_game_config(game_name)
         if not config or int(config.get("gen", 1)) != 3:
-            return None
+            return results
 
         flags_offset = config.get("saveblock1_flags_offset")
         if flags_offset is None:
-            return None
+            return results
 
         base = self._resolve_gen3_saveblock1_base(config, game_name=game_name)
         if base is None:
-            return None
-
-        try:
-            flag = int(flag_id)
-        except (TypeError, ValueError):
-            return None
-
-        byte_addr = hex(base + int(flags_offset) + (flag // 8))
-        byte_val = self.retroarch.read_memory(byte_addr)
-        if not isinstance(byte_val, int):
-            return None
-
-        return bool((int(byte_val) >> (flag & 7)) & 1)
+            return results
+
+        first_byte = min(flags) // 8
+        span = max(flags) // 8 - first_byte + 1
+        region_start = base + int(flags_offset) + first_byte
+        region = self._read_memory_buffer(hex(region_start), span)
+        if region is not None:
+            bits = int.from_bytes(region, "little")
+            for flag in flags:
+                results[flag] = bool((bits >> (flag - first_byte * 8)) & 1)
+            return results
+
+        # Single-byte fallback, one read per distinct flag byte.
+        byte_values: Dict[int, Optional[int]] = {}
+        for flag in flags:
+            byte_index = flag // 8
+            if byte_index not in byte_values:
+                byte_val = self.retroarch.read_memory(hex(base + int(flags_offset) + byte_index))
+                byte_values[byte_index] = int(byte_val) if isinstance(byte_val, int) else None
+            byte_val = byte_values[byte_index]
+            results[flag] = None if byte_val is None else bool((byte_val >> (flag & 7)) & 1)
+        return results
 
     def _log_pointer_unreadable_throttled(self, game_name: str, pointer: str, layout: Optional[str] = None):
         """Throttle noisy pointer-unreadable logs during transient UDP instability."""
@@ -13303,12 +15886,79 @@ class PokemonMemoryReader:
         threshold = int(gender_rate) * 2
         return "Female" if atk_dv < threshold else "Male"
 
-    def _decode_gen3_party_slot_details(self, slot_bytes: List[int], max_species_id: int, allow_checksum_mismatch: bool = False, species_hint_ids: Optional[Set[int]] = None) -> Optional[Dict[str, object]]:
-        """Decode species + metadata from encrypted Gen 3 party slot data."""
-        if not isinstance(slot_bytes, list) or len(slot_bytes) < 100:
-            return None
+    SLOT_DETAILS_MEMO_MAX = 64
 
+    def _gen3_decode_limits(self) -> Tuple[int, int]:
+        """Return (max national species, max known move id), recomputed only when the move table changes."""
+        move_names = self._gen3_move_names
+        cached = self._gen3_decode_limits_cache
+        if cached is not None and cached[0] is move_names and cached[1] == len(move_names):
+            return cached[2]
         max_national_species = max(self.POKEMON_NAMES.keys())
+        try:
+            max_known_move_id = max(int(mid) for mid in move_names.keys())
+        except Exception:
+            max_known_move_id = 0
+        if int(max_known_move_id) <= 0:
+            max_known_move_id = 354
+        limits = (int(max_national_species), int(max_known_move_id))
+        self._gen3_decode_limits_cache = (move_names, len(move_names), limits)
+        return limits
+
+    def _decode_gen3_party_slots(self, block: object, slot_stride: int, slot_count: int, max_species_id: int, allow_checksum_mismatch: bool = False) -> List[Optional[Dict[str, object]]]:
+        """Decode every slot of a contiguous Gen 3 party block in one call (None where a slot does not decode)."""
+        if isinstance(block, list):
+            try:
+                block = bytes(block)
+            except (TypeError, ValueError):
+                return [None] * max(0, int(slot_count))
+        if not isinstance(block, (bytes, bytearray, memoryview)):
+            return [None] * max(0, int(slot_count))
+        view = memoryview(block)
+        results: List[Optional[Dict[str, object]]] = []
+        for slot_idx in range(max(0, int(slot_count))):
+            offset = int(slot_idx) * int(slot_stride)
+            if offset + 100 > len(view):
+                results.append(None)
+                continue
+            results.append(self._decode_gen3_party_slot_details(
+                view[offset:offset + 100],
+                max_species_id=max_species_id,
+                allow_checksum_mismatch=allow_checksum_mismatch,
+            ))
+        return results
+
+    def _decode_gen3_party_slot_details(self, slot_bytes: object, max_species_id: int, allow_checksum_mismatch: bool = False, species_hint_ids: Optional[Set[int]] = None) -> Optional[Dict[str, object]]:
+        """Decode species + metadata from encrypted Gen 3 party slot data, memoized on the raw bytes."""
+        if isinstance(slot_bytes, memoryview):
+            slot_bytes = slot_bytes.tobytes()
+        if not isinstance(slot_bytes, (list, bytes, bytearray)) or len(slot_bytes) < 100:
+            return None
+        try:
+            raw_key = bytes(slot_bytes[:100])
+            hint_key = frozenset(int(v) for v in species_hint_ids) if isinstance(species_hint_ids, (set, list, tuple)) else frozenset()
+        except (TypeError, ValueError):
+            # Wide (>0xFF) values from byte-fallback variants cannot be keyed; decode directly.
+            return self._decode_gen3_party_slot_details_uncached(slot_bytes, max_species_id, allow_checksum_mismatch, species_hint_ids)
+        memo_key = (raw_key, int(max_species_id), bool(allow_checksum_mismatch), hint_key)
+        if memo_key in self._slot_details_memo:
+            self._decode_memo_stats["slot_hits"] += 1
+            cached = self._slot_details_memo[memo_key]
+            return copy.deepcopy(cached) if cached is not None else None
+        self._decode_memo_stats["slot_misses"] += 1
+        details = self._decode_gen3_party_slot_details_uncached(raw_key, max_species_id, allow_checksum_mismatch, species_hint_ids)
+        if len(self._slot_details_memo) >= int(self.SLOT_DETAILS_MEMO_MAX):
+            self._slot_details_memo.clear()
+        self._slot_details_memo[memo_key] = copy.deepcopy(details) if details is not None else None
+        return details
+
+    def _decode_gen3_party_slot_details_uncached(self, slot_bytes: object, max_species_id: int, allow_checksum_mismatch: bool = False, species_hint_ids: Optional[Set[int]] = None) -> Optional[Dict[str, object]]:
+        if isinstance(slot_bytes, memoryview):
+            slot_bytes = slot_bytes.tobytes()
+        if not isinstance(slot_bytes, (list, bytes, bytearray)) or len(slot_bytes) < 100:
+            return None
+
+        max_national_species, max_known_move_id = self._gen3_decode_limits()
         hint_species_ids: Set[int] = set()
         if isinstance(species_hint_ids, (set, list, tuple)):
             for raw_id in species_hint_ids:
@@ -13318,38 +15968,20 @@ class PokemonMemoryReader:
                     continue
                 if normalized_hint > 0:
                     hint_species_ids.add(normalized_hint)
-        try:
-            max_known_move_id = max(int(mid) for mid in self._gen3_move_names.keys())
-        except Exception:
-            max_known_move_id = 0
-        if int(max_known_move_id) <= 0:
-            max_known_move_id = 354
 
-        def _decode_once(candidate_bytes: List[int], allow_checksum_mismatch_local: bool = False) -> Optional[Dict[str, object]]:
+        def _decode_once(candidate_bytes: bytes, allow_checksum_mismatch_local: bool = False) -> Optional[Dict[str, object]]:
             if len(candidate_bytes) < 100:
                 return None
 
-            def read_u16(buffer: List[int], offset: int) -> int:
-                return int(buffer[offset]) | (int(buffer[offset + 1]) << 8)
-
-            def read_u32(buffer: List[int], offset: int) -> int:
-                return (
-                    int(buffer[offset])
-                    | (int(buffer[offset + 1]) << 8)
-                    | (int(buffer[offset + 2]) << 16)
-                    | (int(buffer[offset + 3]) << 24)
-                )
-
-            personality = read_u32(candidate_bytes, 0)
-            ot_id = read_u32(candidate_bytes, 4)
+            personality, ot_id = self.GEN3_SLOT_HEADER.unpack_from(candidate_bytes, 0)
             if personality == 0 and ot_id == 0:
                 return None
 
             # Header bytes are not encrypted; they help disambiguate byte-order variants
             # that can still decrypt into plausible secure substructures.
-            language_id = int(candidate_bytes[18]) & 0xFF if len(candidate_bytes) > 18 else -1
-            markings = int(candidate_bytes[27]) & 0xFF if len(candidate_bytes) > 27 else 0
-            misc_flags = int(candidate_bytes[19]) & 0xFF if len(candidate_bytes) > 19 else 0
+            language_id = candidate_bytes[18]
+            markings = candidate_bytes[27]
+            misc_flags = candidate_bytes[19]
             header_plausibility = 0
             if 1 <= language_id <= 7:
                 header_plausibility += 6
@@ -13367,42 +15999,19 @@ class PokemonMemoryReader:
                 header_plausibility -= 1
 
             key = personality ^ ot_id
-            encrypted = candidate_bytes[32:80]
-            if len(encrypted) < 48:
-                return None
+            secure_words = self.GEN3_SECURE_WORDS
+            decrypted = secure_words.pack(*[word ^ key for word in secure_words.unpack_from(candidate_bytes, 32)])
 
-            decrypted = [0] * 48
-            for offset in range(0, 48, 4):
-                word = read_u32(encrypted, offset) ^ key
-                decrypted[offset] = word & 0xFF
-                decrypted[offset + 1] = (word >> 8) & 0xFF
-                decrypted[offset + 2] = (word >> 16) & 0xFF
-                decrypted[offset + 3] = (word >> 24) & 0xFF
-
-            stored_checksum = int(candidate_bytes[28]) | (int(candidate_bytes[29]) << 8)
-            calc_checksum = 0
-            for off in range(0, 48, 2):
-                calc_checksum = (calc_checksum + read_u16(decrypted, off)) & 0xFFFF
-            checksum_matches = int(calc_checksum) == int(stored_checksum)
+            stored_checksum = self.GEN3_U16.unpack_from(candidate_bytes, 28)[0]
+            calc_checksum = sum(self.GEN3_SECURE_HALFWORDS.unpack(decrypted)) & 0xFFFF
+            checksum_matches = calc_checksum == stored_checksum
             if (not checksum_matches) and (not allow_checksum_mismatch_local):
                 return None
 
-            order_candidates: List[Tuple[int, int, int, int]] = []
-            primary_order = tuple(self.GEN3_PARTY_SUBSTRUCT_ORDERS[personality % 24])
-            order_candidates.append(primary_order)
-            try:
-                alt_order = tuple(self.GEN3_PARTY_SUBSTRUCT_ORDERS_ALT[personality % 24])
-                if alt_order not in order_candidates:
-                    order_candidates.append(alt_order)
-            except Exception:
-                pass
-
-            def _decode_with_order(order_tuple: Tuple[int, int, int, int]) -> Optional[Dict[str, object]]:
-                growth_offset = order_tuple.index(0) * 12
-                attacks_offset = order_tuple.index(1) * 12
-                misc_offset = order_tuple.index(3) * 12
+            def _decode_with_order(offsets: Tuple[int, int, int]) -> Optional[Dict[str, object]]:
+                growth_offset, attacks_offset, misc_offset = offsets
 
-                species_internal = read_u16(decrypted, growth_offset)
+                species_internal, held_item_id, experience = self.GEN3_GROWTH_HEAD.unpack_from(decrypted, growth_offset)
                 if species_internal <= 0 or species_internal > int(max_species_id):
                     return None
 
@@ -13413,7 +16022,7 @@ class PokemonMemoryReader:
                 species_name = self.get_pokemon_name(int(normalized_species))
                 nickname = self._resolve_gen3_nickname(candidate_bytes[8:18], species_name)
 
-                level = int(candidate_bytes[84]) if len(candidate_bytes) > 84 else 0
+                level = candidate_bytes[84]
                 level_value: Optional[int] = None
                 if 0 < level <= 100:
                     level_value = int(level)
@@ -13421,33 +16030,17 @@ class PokemonMemoryReader:
                     return None
 
                 # Party stat sanity helps reject wrong byte-order variants that can still pass checksum/species.
-                current_hp = read_u16(candidate_bytes, 86)
-                max_hp = read_u16(candidate_bytes, 88)
+                current_hp, max_hp, *derived_stats = self.GEN3_PARTY_STATS.unpack_from(candidate_bytes, 86)
                 if max_hp <= 0 or max_hp > 999:
                     return None
                 if current_hp < 0 or current_hp > max_hp:
                     return None
-
-                derived_stats = [
-                    read_u16(candidate_bytes, 90),
-                    read_u16(candidate_bytes, 92),
-                    read_u16(candidate_bytes, 94),
-                    read_u16(candidate_bytes, 96),
-                    read_u16(candidate_bytes, 98),
-                ]
                 if any(stat <= 0 or stat > 999 for stat in derived_stats):
                     return None
 
-                move_ids = [
-                    read_u16(decrypted, attacks_offset + 0),
-                    read_u16(decrypted, attacks_offset + 2),
-                    read_u16(decrypted, attacks_offset + 4),
-                    read_u16(decrypted, attacks_offset + 6),
-                ]
-                move_pp = [
-                    int(decrypted[attacks_offset + 8 + i]) & 0xFF
-                    for i in range(4)
-                ]
+                attacks = self.GEN3_ATTACKS.unpack_from(decrypted, attacks_offset)
+                move_ids = attacks[:4]
+                move_pp = attacks[4:]
 
                 move_names: List[str] = []
                 plausible_move_count = 0
@@ -13466,7 +16059,7 @@ class PokemonMemoryReader:
                         continue
                     plausible_move_count += 1
 
-                iv_ability_word = read_u32(decrypted, misc_offset + 4)
+                iv_ability_word = self.GEN3_U32.unpack_from(decrypted, misc_offset + 4)[0]
                 ability_slot = (iv_ability_word >> 31) & 0x1
                 is_egg = ((iv_ability_word >> 30) & 0x1) == 1
                 ability_name = self._resolve_gen3_ability_name(int(normalized_species), int(ability_slot))
@@ -13476,9 +16069,6 @@ class PokemonMemoryReader:
                 shiny_xor = ((int(ot_id) >> 16) ^ (int(ot_id) & 0xFFFF) ^ (int(personality) >> 16) ^ (int(personality) & 0xFFFF)) & 0xFFFF
                 is_shiny = int(shiny_xor) < 8
 
-                held_item_id = read_u16(decrypted, growth_offset + 2)
-                experience = read_u32(decrypted, growth_offset + 4)
-
                 plausibility = 0
                 if checksum_matches:
                     plausibility += 50
@@ -13525,8 +16115,8 @@ class PokemonMemoryReader:
                 }
             best_details: Optional[Dict[str, object]] = None
             best_score_key: Optional[Tuple[int, int]] = None
-            for order_idx, order_tuple in enumerate(order_candidates):
-                details = _decode_with_order(order_tuple)
+            for order_idx, offsets in enumerate(self.GEN3_SUBSTRUCT_OFFSETS[personality % 24]):
+                details = _decode_with_order(offsets)
                 if details is None:
                     continue
                 score_key = (int(details.get("_score", 0)), -int(order_idx))
@@ -13536,31 +16126,27 @@ class PokemonMemoryReader:
 
             return best_details
 
-        base_bytes = [int(v) & 0xFF for v in slot_bytes]
-        transform_candidates: List[List[int]] = [base_bytes]
-
-        if len(base_bytes) >= 100:
-            swapped16 = base_bytes[:]
-            for idx in range(0, len(swapped16) - 1, 2):
-                swapped16[idx], swapped16[idx + 1] = swapped16[idx + 1], swapped16[idx]
-            transform_candidates.append(swapped16)
-
-            swapped32 = base_bytes[:]
-            for idx in range(0, len(swapped32) - 3, 4):
-                a = swapped32[idx:idx + 4]
-                swapped32[idx:idx + 4] = [a[3], a[2], a[1], a[0]]
-            transform_candidates.append(swapped32)
-
-        seen_variants = set()
-        unique_candidates: List[List[int]] = []
-        for variant in transform_candidates:
-            key = bytes(variant[:100])
-            if key in seen_variants:
-                continue
-            seen_variants.add(key)
-            unique_candidates.append(variant)
-
-        def _choose_best(candidates: List[List[int]], allow_mismatch: bool) -> Optional[Dict[str, object]]:
+        if isinstance(slot_bytes, (bytes, bytearray)):
+            base_bytes = bytes(slot_bytes[:100])
+        else:
+            base_bytes = bytes(int(v) & 0xFF for v in slot_bytes[:100])
+
+        def _byte_order_variants() -> List[bytes]:
+            # Decoding only touches the first 100 bytes (a multiple of 4), so the
+            # swaps can be done with extended-slice assignment instead of loops.
+            swapped16 = bytearray(100)
+            swapped16[0::2] = base_bytes[1::2]
+            swapped16[1::2] = base_bytes[0::2]
+            swapped32 = bytearray(100)
+            for lane in range(4):
+                swapped32[lane::4] = base_bytes[3 - lane::4]
+            variants: List[bytes] = []
+            for variant in (bytes(swapped16), bytes(swapped32)):
+                if variant != base_bytes and variant not in variants:
+                    variants.append(variant)
+            return variants
+
+        def _choose_best(candidates: List[bytes], allow_mismatch: bool) -> Optional[Dict[str, object]]:
             best_details: Optional[Dict[str, object]] = None
             best_score_key: Optional[Tuple[int, int]] = None
 
@@ -13578,23 +16164,23 @@ class PokemonMemoryReader:
 
         # Prefer native byte order first. Only try transformed byte orders if
         # base decode fails, to avoid species drift on otherwise valid slots.
-        base_candidates: List[List[int]] = [base_bytes]
-
-        strict_details = _choose_best(base_candidates, allow_mismatch=False)
+        # The base variant already failed each pass it is skipped from below.
+        strict_details = _choose_best([base_bytes], allow_mismatch=False)
         if strict_details is not None:
             return strict_details
 
-        strict_details = _choose_best(unique_candidates, allow_mismatch=False)
+        variant_candidates = _byte_order_variants()
+        strict_details = _choose_best(variant_candidates, allow_mismatch=False)
         if strict_details is not None:
             return strict_details
 
         if allow_checksum_mismatch:
-            relaxed_base = _choose_best(base_candidates, allow_mismatch=True)
+            relaxed_base = _choose_best([base_bytes], allow_mismatch=True)
             if relaxed_base is not None:
                 return relaxed_base
-            return _choose_best(unique_candidates, allow_mismatch=True)
+            return _choose_best(variant_candidates, allow_mismatch=True)
 
-    def _decode_gen3_party_species(self, slot_bytes: List[int], max_species_id: int, allow_checksum_mismatch: bool = False, species_hint_ids: Optional[Set[int]] = None) -> Optional[int]:
+    def _decode_gen3_party_species(self, slot_bytes: object, max_species_id: int, allow_checksum_mismatch: bool = False, species_hint_ids: Optional[Set[int]] = None) -> Optional[int]:
         """Decode species from encrypted Gen 3 party data slot."""
         details = self._decode_gen3_party_slot_details(
             slot_bytes,
@@ -13610,15 +16196,17 @@ class PokemonMemoryReader:
             return None
         return species_value if species_value > 0 else None
 
-    def _read_gen3_slot_bytes_for_details(self, slot_addr: int, size: int) -> Optional[List[int]]:
+    def _read_gen3_slot_bytes_for_details(self, slot_addr: int, size: int) -> Optional[object]:
         """Read slot bytes required for details decode without heavy per-byte overhead."""
+        block_slice = self._party_block_bytes(int(slot_addr), int(size))
+        if block_slice is not None:
+            return block_slice
         try:
-            bulk = self.retroarch.read_memory(hex(int(slot_addr)), int(size))
+            bulk = self._read_memory_buffer(hex(int(slot_addr)), int(size))
         except Exception:
             bulk = None
-        if isinstance(bulk, list) and len(bulk) >= size:
-            if all(isinstance(v, int) and 0 <= int(v) <= 0xFF for v in bulk[:size]):
-                return [int(v) & 0xFF for v in bulk[:size]]
+        if bulk is not None:
+            return bulk
 
         required = sorted(set(
             list(range(0, 8))
@@ -13734,38 +16322,23 @@ class PokemonMemoryReader:
         num_bytes = (max_pokemon + 7) // 8
 
         # Fast path: read whole bitfield in one command to avoid dozens of round-trips.
-        bulk_values = self.retroarch.read_memory(start_addr, num_bytes)
-        if isinstance(bulk_values, list) and len(bulk_values) >= num_bytes:
-            if all(isinstance(v, int) and 0 <= int(v) <= 0xFF for v in bulk_values[:num_bytes]):
-                for byte_idx, raw_val in enumerate(bulk_values[:num_bytes]):
-                    byte_val = int(raw_val) & 0xFF
-                    for bit_idx in range(8):
-                        pokemon_id = byte_idx * 8 + bit_idx + 1
-                        if pokemon_id > max_pokemon:
-                            break
-                        if (byte_val >> bit_idx) & 1:
-                            found.append(pokemon_id)
-                return found
+        bulk_buffer = self._read_memory_buffer(start_addr, num_bytes)
+        if bulk_buffer is not None:
+            return self._decode_flag_buffer(bulk_buffer, int(max_pokemon))
 
         if not allow_byte_fallback:
             return found
 
         # Compatibility fallback: byte-by-byte reads for cores that do not support bulk memory responses.
+        # Unreadable bytes decode as no flags set, then the buffer goes through the same bitset decode.
+        fallback_buffer = bytearray(num_bytes)
         for byte_idx in range(num_bytes):
             addr = hex(int(start_addr, 16) + byte_idx)
             byte_val = self.retroarch.read_memory(addr)
-            if not isinstance(byte_val, int):
-                continue
-
-            value = int(byte_val) & 0xFF
-            for bit_idx in range(8):
-                pokemon_id = byte_idx * 8 + bit_idx + 1
-                if pokemon_id > max_pokemon:
-                    break
-                if (value >> bit_idx) & 1:
-                    found.append(pokemon_id)
+            if isinstance(byte_val, int):
+                fallback_buffer[byte_idx] = int(byte_val) & 0xFF
 
-        return found
+        return self._decode_flag_buffer(fallback_buffer, int(max_pokemon))
 
     def read_pokedex(self, game_name: str, count_hint: Optional[int] = None) -> List[int]:
         """Read Pokedex caught flags with optional count-based sanity selection."""
@@ -13886,8 +16459,143 @@ class PokemonMemoryReader:
 
         return best_list
     
+    PARTY_DECODE_MEMO_MAX_AGE_S = 30.0
+
+    def _party_region_digest(self, layout_key: Tuple[object, ...], count_addr: str, base_addr: int, stride: int) -> Optional[str]:
+        """Digest of the raw party count byte and six-slot block a decoded party came from."""
+        count_buffer = self._party_block_bytes(count_addr, 1)
+        if count_buffer is None:
+            count_buffer = self._read_memory_buffer(str(count_addr), 1)
+        block = self._party_block_bytes(int(base_addr), int(stride) * 6)
+        if block is None:
+            block = self._read_memory_buffer(hex(int(base_addr)), int(stride) * 6)
+        if count_buffer is None or block is None:
+            return None
+        digest = sha256(repr(layout_key).encode("utf-8"))
+        digest.update(count_buffer)
+        digest.update(block)
+        return digest.hexdigest()
+
+    def _party_memo_lookup(self, game_name: str, layout_key: Tuple[object, ...]) -> Optional[List[Dict]]:
+        """Return the previous Gen 3 party decode when its raw bytes are unchanged since the last poll."""
+        memo = self._party_decode_memo.get(str(game_name))
+        if not memo or memo.get("layout_key") != layout_key:
+            return None
+        # The digest is taken just after decoding, so a write landing in between could pin a stale
+        # decode; a periodic full decode bounds how long that can last.
+        if (time.monotonic() - float(memo.get("stored_at", 0.0))) >= float(self.PARTY_DECODE_MEMO_MAX_AGE_S):
+            self._party_decode_memo.pop(str(game_name), None)
+            return None
+        digest = self._party_region_digest(layout_key, str(memo["count_addr"]), int(memo["base"]), int(memo["stride"]))
+        if digest is None or digest != memo.get("digest"):
+            self._decode_memo_stats["party_misses"] += 1
+            return None
+        self._decode_memo_stats["party_hits"] += 1
+        self._last_party_read_meta = copy.deepcopy(memo["meta"])
+        return copy.deepcopy(memo["party"])
+
+    def _party_memo_store(self, game_name: str, layout_key: Tuple[object, ...], count_addr: str, base_addr: int, stride: int, party: List[Dict]):
+        digest = self._party_region_digest(layout_key, count_addr, base_addr, stride)
+        if digest is None:
+            self._party_decode_memo.pop(str(game_name), None)
+            return
+        self._party_decode_memo[str(game_name)] = {
+            "layout_key": layout_key,
+            "count_addr": str(count_addr),
+            "base": int(base_addr),
+            "stride": int(stride),
+            "digest": digest,
+            "party": copy.deepcopy(party),
+            "meta": copy.deepcopy(self._last_party_read_meta),
+            "stored_at": time.monotonic(),
+        }
+
+    def get_decode_memo_stats(self) -> Dict[str, int]:
+        return dict(self._decode_memo_stats)
+
+    # Emulator reads one read_party call may issue before it is logged as over budget
+    # (bulk block + retry + a couple of candidate probes); byte-by-byte fallbacks blow well past it.
+    PARTY_READ_BUDGET = 6
+    PARTY_BLOCK_MAX_BYTES = 2048
+
+    def _read_party_block(self, count_addr: object, start_addr: object, slot_stride: int) -> Optional[Tuple[int, bytes]]:
+        """Fetch the count byte and all six slots in one read, retrying once if the count is implausible."""
+        try:
+            count_int = int(count_addr) if isinstance(count_addr, int) else int(str(count_addr), 16)
+            start_int = int(start_addr) if isinstance(start_addr, int) else int(str(start_addr), 16)
+            stride = int(slot_stride)
+        except (TypeError, ValueError):
+            return None
+        if stride <= 0:
+            return None
+        span_start = min(count_int, start_int)
+        span_len = max(count_int + 1, start_int + stride * 6) - span_start
+        if span_len > int(self.PARTY_BLOCK_MAX_BYTES):
+            return None
+
+        for attempt in range(2):
+            if attempt:
+                self._party_read_stats["block_retries"] += 1
+            self._count_party_read()
+            data = self._read_memory_buffer(hex(span_start), span_len)
+            if data is not None and int(data[count_int - span_start]) <= 6:
+                return span_start, data
+        self._party_read_stats["block_failures"] += 1
+        return None
+
+    def _count_party_read(self) -> None:
+        local = self._party_call_local
+        local.read_calls = int(getattr(local, "read_calls", 0)) + 1
+
+    def _party_block_bytes(self, address: object, num_bytes: int) -> Optional[bytes]:
+        block = getattr(self._party_call_local, "block", None)
+        if block is None:
+            return None
+        try:
+            addr_int = int(address) if isinstance(address, int) else int(str(address), 16)
+        except (TypeError, ValueError):
+            return None
+        offset = addr_int - block[0]
+        if offset < 0 or offset + int(num_bytes) > len(block[1]):
+            return None
+        return block[1][offset:offset + int(num_bytes)]
+
+    def _party_read(self, address: object, num_bytes: int = 1) -> object:
+        """read_memory for party decoding, served from this call's party block when it covers the range."""
+        data = self._party_block_bytes(address, num_bytes)
+        if data is not None:
+            self._party_read_stats["block_hits"] += 1
+            return int(data[0]) if int(num_bytes) == 1 else list(data)
+        self._count_party_read()
+        if int(num_bytes) == 1:
+            return self.retroarch.read_memory(address)
+        return self.retroarch.read_memory(address, num_bytes)
+
+    def get_party_read_stats(self) -> Dict[str, int]:
+        return dict(self._party_read_stats)
+
     def read_party(self, game_name: str, caught_ids_hint: Optional[Set[int]] = None) -> List[Dict]:
         """Read current party Pokemon"""
+        local = self._party_call_local
+        local.block = None
+        local.read_calls = 0
+        try:
+            return self._read_party_members(game_name, caught_ids_hint)
+        finally:
+            local.block = None
+            reads = int(local.read_calls)
+            self._party_read_stats["calls"] += 1
+            self._party_read_stats["reads"] += reads
+            if isinstance(self._last_party_read_meta, dict):
+                self._last_party_read_meta["read_calls"] = reads
+            if reads > int(self.PARTY_READ_BUDGET):
+                self._party_read_stats["over_budget"] += 1
+                now = time.monotonic()
+                if now - float(self._party_read_budget_last_log) >= 30.0:
+                    self._party_read_budget_last_log = now
+                    log_event(logging.WARNING, "party_read_budget_exceeded", game=game_name, reads=reads, budget=int(self.PARTY_READ_BUDGET))
+
+    def _read_party_members(self, game_name: str, caught_ids_hint: Optional[Set[int]] = None) -> List[Dict]:
         config = self.get_game_config(game_name)
         if not config:
             self._last_party_read_meta = {
@@ -13951,10 +16659,12 @@ class PokemonMemoryReader:
                     pointer=str(config.get("saveblock1_ptr")),
                     layout=config.get("layout_id"),
                 )
+        # One bulk read covers the count byte and all six slots; party reads below are served from it.
+        self._party_call_local.block = self._read_party_block(party_count_addr, party_start_addr, slot_size)
         # Read party count from selected layout.
-        count = self.retroarch.read_memory(party_count_addr)
+        count = self._party_read(party_count_addr)
         if used_pointer_layout:
-            fallback_count = self.retroarch.read_memory(static_party_count_addr)
+            fallback_count = self._party_read(static_party_count_addr)
             pointer_count_valid = isinstance(count, int) and 0 <= int(count) <= 6
             static_count_valid = isinstance(fallback_count, int) and 0 <= int(fallback_count) <= 6
             fallback_reason: Optional[str] = None
@@ -14000,6 +16710,10 @@ class PokemonMemoryReader:
             })
 
         if gen == 3:
+            memo_layout_key = (str(party_count_addr), str(party_start_addr), tuple(sorted(caught_ids_set)))
+            memo_hit = self._party_memo_lookup(game_name, memo_layout_key)
+            if memo_hit is not None:
+                return memo_hit
             force_gen3_party_byte_reads = bool(config.get("party_force_byte_reads", 0))
             allow_party_byte_fallback = bool(config.get("party_allow_byte_fallback", 1))
             try:
@@ -14129,7 +16843,7 @@ class PokemonMemoryReader:
                 if candidate_addr == primary_count_addr and count_valid:
                     value = int(count)
                 else:
-                    value = self.retroarch.read_memory(candidate_addr)
+                    value = self._party_read(candidate_addr)
                 count_cache[candidate_addr] = value
                 return value
 
@@ -14362,9 +17076,16 @@ class PokemonMemoryReader:
                 if not force_gen3_party_byte_reads and slot_count > 0 and slot_stride > 0:
                     total_len = int(slot_count) * int(slot_stride)
                     if total_len > 0 and total_len <= 2048:
-                        block_values = self.retroarch.read_memory(hex(base_addr), total_len)
+                        block_values = self._party_read(hex(base_addr), total_len)
                         if isinstance(block_values, list) and len(block_values) >= total_len:
                             if all(isinstance(v, int) and 0 <= int(v) <= 0xFF for v in block_values[:total_len]):
+                                block_details = self._decode_gen3_party_slots(
+                                    block_values[:total_len],
+                                    slot_stride,
+                                    slot_count,
+                                    max_species_id=max_decode_species_id,
+                                    allow_checksum_mismatch=allow_relaxed_species,
+                                )
                                 for slot_idx in range(slot_count):
                                     if _decode_budget_exceeded():
                                         return decoded_party, decode_failures
@@ -14373,7 +17094,12 @@ class PokemonMemoryReader:
                                         decode_failures += 1
                                         continue
                                     slot_data = [int(v) & 0xFF for v in block_values[offset:offset + int(slot_size)]]
-                                    selected_slot_data, selected_species, selected_details = _select_best_slot_variant([slot_data])
+                                    slot_details = block_details[slot_idx]
+                                    block_species = int(slot_details.get("normalized_species", 0) or 0) if isinstance(slot_details, dict) else 0
+                                    if int(slot_size) >= 100 and 0 < block_species <= max_species_id:
+                                        selected_slot_data, selected_species, selected_details = slot_data, block_species, slot_details
+                                    else:
+                                        selected_slot_data, selected_species, selected_details = _select_best_slot_variant([slot_data])
                                     if selected_slot_data is None or selected_species is None:
                                         decode_failures += 1
                                         continue
@@ -14430,7 +17156,7 @@ class PokemonMemoryReader:
                     slot_data_variants: List[List[int]] = []
 
                     if not force_gen3_party_byte_reads:
-                        bulk_slot_data = self.retroarch.read_memory(slot_addr, slot_size)
+                        bulk_slot_data = self._party_read(slot_addr, slot_size)
                         if isinstance(bulk_slot_data, list) and len(bulk_slot_data) >= slot_size:
                             if all(isinstance(v, int) and 0 <= int(v) <= 0xFF for v in bulk_slot_data[:slot_size]):
                                 slot_data_variants.append([int(v) & 0xFF for v in bulk_slot_data[:slot_size]])
@@ -14460,7 +17186,7 @@ class PokemonMemoryReader:
                             abs_addr = base_addr + (slot_idx * slot_stride) + int(byte_idx)
                             byte_val: Optional[int] = None
                             for _ in range(int(party_byte_read_retries)):
-                                probe = self.retroarch.read_memory(hex(abs_addr))
+                                probe = self._party_read(hex(abs_addr))
                                 if isinstance(probe, int):
                                     byte_val = int(probe)
                                     break
@@ -15083,6 +17809,8 @@ class PokemonMemoryReader:
                     start_addr=str(best_start_addr),
                     stride=int(best_stride),
                 )
+            if best_party and not budget_exceeded and not self._last_party_read_meta.get("incomplete"):
+                self._party_memo_store(game_name, memo_layout_key, str(best_count_addr), int(best_base), int(best_stride), best_party)
             return best_party
 
         if not count_valid:
@@ -15103,8 +17831,8 @@ class PokemonMemoryReader:
             slot_addr_int = int(party_start_addr, 16) + (i * slot_size)
             slot_addr = hex(slot_addr_int)
 
-            species_id = self.retroarch.read_memory(slot_addr)
-            slot_data = self.retroarch.read_memory(slot_addr, slot_size)
+            species_id = self._party_read(slot_addr)
+            slot_data = self._party_read(slot_addr, slot_size)
             species_normalized = False
 
             level = None
@@ -15166,7 +17894,7 @@ class PokemonMemoryReader:
             if level is None:
                 level_offset = 0x1F if int(gen) == 2 else 3
                 level_addr = hex(slot_addr_int + level_offset)
-                level_value = self.retroarch.read_memory(level_addr)
+                level_value = self._party_read(level_addr)
                 if isinstance(level_value, int) and int(level_value) > 0:
                     level = int(level_value)
 
@@ -15214,6 +17942,11 @@ class PokemonMemoryReader:
         return party
 
     def read_wild_encounter(self, game_name: str) -> Optional[Dict[str, object]]:
+        """Read the active wild battle opponent; hunt reads jump the transport queue."""
+        with _retroarch_io_priority(self.retroarch, RetroArchClient.IO_PRIORITY_HUNT):
+            return self._read_wild_encounter(game_name)
+
+    def _read_wild_encounter(self, game_name: str) -> Optional[Dict[str, object]]:
         """Read current enemy lead encounter when battle party memory is available."""
 
         def _set_meta(reason: str, **extra):
@@ -15440,7 +18173,7 @@ class PokemonMemoryReader:
         decode_attempts = 0
         for enemy_start_addr_int in enemy_start_candidates:
             slot_bytes = self._read_gen3_slot_bytes_for_details(enemy_start_addr_int, int(slot_size))
-            if not isinstance(slot_bytes, list) or len(slot_bytes) < int(slot_size):
+            if not isinstance(slot_bytes, (list, bytes, bytearray)) or len(slot_bytes) < int(slot_size):
                 continue
 
             decode_attempts += 1
@@ -15542,9 +18275,15 @@ class AchievementTracker:
         "Pokemon Sapphire": 10,
     }
     
+    # Refresh periods (seconds) for the regions the poll loop subscribes to; badges and
+    # Hall-of-Fame bytes rarely change, dex flags matter for catch reporting.
+    ACHIEVEMENT_REGION_PERIOD_S = 2.0
+    COLLECTION_REGION_PERIOD_S = 1.0
+
     def __init__(self, retroarch: RetroArchClient, api: Optional[PokeAchieveAPI] = None):
         self.retroarch = retroarch
         self.api = api
+        self._poll_subscription_owners: Set[str] = set()
         self.pokemon_reader = PokemonMemoryReader(retroarch)
         self.achievements: List[Achievement] = []
         self.game_name: Optional[str] = None
@@ -15573,6 +18312,13 @@ class AchievementTracker:
         self._baseline_snapshot_pending = False
         self._baseline_snapshot_wait_polls = 0
         self._cached_pokedex_for_poll: Optional[List[int]] = None
+        self._achievement_read_cache: Dict[int, int] = {}
+        self._evaluation_plan: Optional[AchievementEvaluationPlan] = None
+        # Per-poll results of derived sub-checks shared by several achievements (None outside a poll).
+        self._derived_poll_memo: Optional[Dict[str, object]] = None
+        # achievement id -> (input fingerprint, result) from its last evaluation.
+        self._achievement_input_state: Dict[str, Tuple[Tuple[object, ...], bool]] = {}
+        self._incremental_eval_stats: Dict[str, int] = {"evaluated": 0, "skipped": 0}
         self._warmup_logged = False
         self._startup_baseline_captured = False
         self._startup_lockout_ids: set[str] = set()
@@ -15792,8 +18538,9 @@ class AchievementTracker:
         progression_flags = config.get("gym_progression_flags")
         if isinstance(progression_flags, list) and progression_flags:
             states: List[bool] = []
+            flag_states = self.pokemon_reader.read_gen3_event_flags(self.game_name, [int(flag_id) for flag_id in progression_flags])
             for flag_id in progression_flags:
-                state = self.pokemon_reader.read_gen3_event_flag(self.game_name, int(flag_id))
+                state = flag_states.get(int(flag_id))
                 if state is None:
                     states = []
                     break
@@ -15847,7 +18594,7 @@ class AchievementTracker:
         if not badge_addr:
             return None
 
-        badge_byte = self.retroarch.read_memory(badge_addr)
+        badge_byte = self._read_achievement_byte(badge_addr)
         if badge_byte is None:
             return False
 
@@ -15895,11 +18642,198 @@ class AchievementTracker:
             return False
 
         # Fall back to raw memory flag once badge precondition is met.
-        value = self.retroarch.read_memory(achievement.memory_address)
+        value = self._read_achievement_byte(achievement.memory_address)
         if value is None:
             return False
         return self.evaluate_condition(value, achievement.memory_condition)
 
+    def _evaluation_plan_signature(self) -> Tuple[object, ...]:
+        return (self.game_name, self._current_generation(), tuple(id(achievement) for achievement in self.achievements))
+
+    def _compile_evaluation_plan(self) -> AchievementEvaluationPlan:
+        """Resolve each achievement's check path, read address and condition predicate once per game."""
+        generation = self._current_generation()
+        layout = self.pokemon_reader.get_game_layout(self.game_name) if self.game_name and self.pokemon_reader else None
+        badge_addr_int = layout.badge_address if layout is not None and generation == 3 else None
+
+        checks: List[CompiledAchievementCheck] = []
+        for achievement in self.achievements:
+            if self._should_use_derived_check(achievement):
+                checks.append(CompiledAchievementCheck(achievement=achievement, kind="derived", inputs=self._derived_check_inputs(achievement)))
+                continue
+            try:
+                address: Optional[int] = int(str(achievement.memory_address), 16)
+            except (TypeError, ValueError):
+                address = None
+            predicate = compile_memory_condition(achievement.memory_condition)
+            if badge_addr_int is not None and achievement.category in {"gym", "elite_four", "champion"}:
+                # Keeps the badge-plausibility guardrails (and their anomaly logging) on the story path.
+                inputs = (("byte", badge_addr_int), ("byte", address)) if badge_addr_int is not None and address is not None else None
+                checks.append(CompiledAchievementCheck(achievement=achievement, kind="gen3_story", address=address, predicate=predicate, inputs=inputs))
+            else:
+                inputs = (("byte", address),) if address is not None else None
+                checks.append(CompiledAchievementCheck(achievement=achievement, kind="direct", address=address, predicate=predicate, inputs=inputs))
+        return AchievementEvaluationPlan(
+            signature=self._evaluation_plan_signature(),
+            checks=checks,
+            shared_addresses=(badge_addr_int,) if badge_addr_int is not None else (),
+        )
+
+    def _get_evaluation_plan(self) -> AchievementEvaluationPlan:
+        """Return the compiled plan, recompiling when the achievement list or game changed since load_game."""
+        plan = self._evaluation_plan
+        if plan is None or plan.signature != self._evaluation_plan_signature():
+            plan = self._compile_evaluation_plan()
+            self._evaluation_plan = plan
+            self._achievement_input_state = {}
+        return plan
+
+    @staticmethod
+    def _derived_check_inputs(achievement: Achievement) -> Optional[Tuple[Tuple[str, int], ...]]:
+        """Inputs of derived checks that only look at the caught Pokedex; other derived checks always re-run."""
+        ach_id = achievement.id.lower()
+        if "elite_four" in ach_id or "_gym_" in ach_id or ach_id.endswith("_master"):
+            return None
+        if "pokedex" in ach_id or (achievement.category == "legendary" and "legendary" in ach_id):
+            return (("dex", 0),)
+        return None
+
+    def _achievement_input_fingerprint(self, check: CompiledAchievementCheck, read_cache: Dict[int, int]) -> Optional[Tuple[object, ...]]:
+        """Current values of a check's memory inputs, or None when they are unknown or unreadable this poll."""
+        if check.inputs is None:
+            return None
+        values: List[object] = []
+        for kind, address in check.inputs:
+            if kind == "dex":
+                values.append(self._derived_memo("dex_inputs", lambda: tuple(self._read_current_pokedex_caught())))
+                continue
+            if address not in read_cache:
+                value = self._read_achievement_byte(hex(address))
+                if value is None:
+                    return None
+                # Later reads of the same byte in this poll (including the check itself) hit the cache.
+                read_cache[address] = int(value) & 0xFF
+            values.append(read_cache[address])
+        return tuple(values)
+
+    def get_incremental_eval_stats(self) -> Dict[str, int]:
+        return dict(self._incremental_eval_stats)
+
+    def _derived_memo(self, key: str, compute: Callable[[], object]) -> object:
+        """Evaluate a derived sub-check once per poll even when several achievements share it."""
+        memo = self._derived_poll_memo
+        if memo is None:
+            return compute()
+        if key not in memo:
+            memo[key] = compute()
+        return memo[key]
+
+    def _prefetch_achievement_reads(self, plan: Optional[AchievementEvaluationPlan] = None) -> None:
+        """Batch direct-memory achievement bytes for this poll into one read_many sweep."""
+        self._achievement_read_cache = {}
+        read_many = getattr(self.retroarch, "read_many", None)
+        if not callable(read_many):
+            return
+
+        addresses = (plan or self._get_evaluation_plan()).read_addresses()
+        if not addresses:
+            return
+        results = read_many([(addr, 1) for addr in addresses])
+        for addr_int, values in (results or {}).items():
+            if isinstance(values, (bytes, bytearray, list)) and values and isinstance(values[0], int):
+                self._achievement_read_cache[int(addr_int)] = int(values[0]) & 0xFF
+
+    def _poll_region_subscriptions(self) -> List[Tuple[str, List[Tuple[object, int]], float, int]]:
+        """Per-reader region subscriptions for the poll scheduler (achievements, dex flags, party, location)."""
+        if not self.game_name or not self.pokemon_reader:
+            return []
+        layout = self.pokemon_reader.get_game_layout(self.game_name)
+        if layout is None:
+            return []
+
+        collection: List[Tuple[object, int]] = []
+        for address in (layout.pokedex_caught, layout.pokedex_seen):
+            if address is not None:
+                collection.append((address, layout.pokedex_bytes))
+        if layout.pokedex_count is not None:
+            collection.append((layout.pokedex_count, 1))
+        achievements: List[Tuple[object, int]] = []
+        for address in (layout.badge_address, layout.champion_address, layout.hall_of_fame_address):
+            if address is not None:
+                achievements.append((address, 1))
+        for achievement in self.achievements:
+            if not achievement.unlocked and achievement.memory_address:
+                achievements.append((str(achievement.memory_address), 1))
+
+        subscriptions: List[Tuple[str, List[Tuple[object, int]], float, int]] = []
+        if collection:
+            subscriptions.append(("collection", collection, float(self.COLLECTION_REGION_PERIOD_S), RetroArchClient.IO_PRIORITY_COLLECTION))
+        if achievements:
+            subscriptions.append(("achievements", achievements, float(self.ACHIEVEMENT_REGION_PERIOD_S), RetroArchClient.IO_PRIORITY_ACHIEVEMENTS))
+        subscriptions.extend(self.pokemon_reader.poll_region_subscriptions(self.game_name))
+        return subscriptions
+
+    def _snapshot_hot_regions(self) -> List[Tuple[object, int]]:
+        """Regions read by several readers each poll (dex flags, badges, party block, saveblock pointers)."""
+        return [region for _owner, regions, _period, _priority in self._poll_region_subscriptions() for region in regions]
+
+    def _begin_poll_snapshot(self) -> None:
+        if self.pokemon_reader:
+            self.pokemon_reader.begin_poll()
+        subscribe = getattr(self.retroarch, "subscribe_regions", None)
+        begin_scheduled = getattr(self.retroarch, "begin_scheduled_snapshot", None)
+        begin_snapshot = getattr(self.retroarch, "begin_snapshot", None)
+        try:
+            if callable(subscribe) and callable(begin_scheduled):
+                subscriptions = self._poll_region_subscriptions()
+                declared = {owner for owner, _regions, _period, _priority in subscriptions}
+                for owner, regions, period_s, priority in subscriptions:
+                    subscribe(owner, regions, period_s=period_s, priority=priority)
+                # Owners that no longer apply (game change, all achievements unlocked) drop out.
+                for owner in self._poll_subscription_owners - declared:
+                    self.retroarch.unsubscribe_regions(owner)
+                self._poll_subscription_owners = declared
+                begin_scheduled()
+            elif callable(begin_snapshot):
+                begin_snapshot(self._snapshot_hot_regions())
+        except Exception as exc:
+            self._log_warning_throttled(
+                "poll_snapshot_failed",
+                cooldown_s=30.0,
+                game=self.game_name,
+                error_type=type(exc).__name__,
+                error=str(exc),
+            )
+
+    def _end_poll_snapshot(self, trace: bool = False) -> None:
+        if self.pokemon_reader:
+            self.pokemon_reader.end_poll()
+        end_snapshot = getattr(self.retroarch, "end_snapshot", None)
+        if not callable(end_snapshot):
+            return
+        stats = end_snapshot()
+        if trace and isinstance(stats, dict):
+            log_event(
+                logging.INFO,
+                "poll_snapshot_stats",
+                game=self.game_name,
+                poll=self._poll_heartbeat_count,
+                hits=stats.get("hits"),
+                misses=stats.get("misses"),
+                regions=stats.get("regions"),
+                bytes=stats.get("bytes"),
+            )
+
+    def _read_achievement_byte(self, address: str) -> Optional[int]:
+        """Read one achievement byte, preferring the per-poll read_many prefetch."""
+        try:
+            addr_int = int(str(address), 16)
+        except (TypeError, ValueError):
+            addr_int = None
+        if addr_int is not None and addr_int in self._achievement_read_cache:
+            return self._achievement_read_cache[addr_int]
+        return self.retroarch.read_memory(address)
+
     def _should_use_derived_check(self, achievement: Achievement) -> bool:
         """Select derived checks for categories/IDs that are safer than raw address checks."""
         ach_id = achievement.id.lower()
@@ -16355,6 +19289,7 @@ class AchievementTracker:
             self._collection_baseline_candidate = []
             self._collection_baseline_candidate_streak = 0
             self._unlock_streaks = {}
+            self._achievement_input_state = {}
             self._bad_read_streak = 0
             self._achievement_poll_count = 0
             self._collection_wait_streak = 0
@@ -16366,6 +19301,7 @@ class AchievementTracker:
             self._baseline_snapshot_pending = False
             self._baseline_snapshot_wait_polls = 0
             self._cached_pokedex_for_poll = None
+            self._achievement_read_cache = {}
             self._warmup_logged = False
             self._startup_baseline_captured = False
             self._startup_lockout_ids = set()
@@ -16392,6 +19328,8 @@ class AchievementTracker:
             else:
                 log_event(logging.INFO, "memory_profile_validation", game=game_name, ok=validation.get("ok"), failures=validation.get("failures", []), warnings=validation.get("warnings", []))
 
+            self._evaluation_plan = self._compile_evaluation_plan()
+
             # Initialize derived achievement checker
             if GAME_CONFIGS_AVAILABLE and self.game_name:
                 try:
@@ -16519,70 +19457,107 @@ class AchievementTracker:
         major_candidates_this_poll = 0
         legendary_candidates_this_poll = 0
 
-        for achievement in self.achievements:
-            if achievement.unlocked:
-                continue
+        # One batched sweep instead of one UDP round trip per direct-memory achievement.
+        plan = self._get_evaluation_plan()
+        try:
+            self._prefetch_achievement_reads(plan)
+            self._derived_poll_memo = {}
+            read_cache = self._achievement_read_cache
+            begin_checker_poll = getattr(self._derived_checker, "begin_poll", None)
+            if callable(begin_checker_poll):
+                begin_checker_poll()
+
+            for check in plan.checks:
+                achievement = check.achievement
+                if achievement.unlocked:
+                    continue
             
-            unlocked = False
+                # Locked achievements whose inputs did not move since a negative result stay negative;
+                # a running confirmation streak always re-evaluates so it can complete or reset.
+                fingerprint = self._achievement_input_fingerprint(check, read_cache)
+                previous = self._achievement_input_state.get(achievement.id)
+                if (
+                    fingerprint is not None
+                    and previous is not None
+                    and previous[0] == fingerprint
+                    and not previous[1]
+                    and not self._unlock_streaks.get(achievement.id, 0)
+                ):
+                    self._incremental_eval_stats["skipped"] += 1
+                    continue
+                self._incremental_eval_stats["evaluated"] += 1
+
+                unlocked = False
             
-            if self._should_use_derived_check(achievement):
-                unlocked = self._check_derived_achievement(achievement)
-            else:
-                # Direct memory check (achievements with memory_address)
-                safe_result = self._safe_gen3_story_check(achievement)
-                if safe_result is not None:
-                    unlocked = safe_result
+                if check.kind == "derived":
+                    unlocked = self._check_derived_achievement(achievement)
                 else:
-                    value = self.retroarch.read_memory(achievement.memory_address)
-                    if value is not None and self.evaluate_condition(value, achievement.memory_condition):
-                        unlocked = True
+                    safe_result = self._safe_gen3_story_check(achievement) if check.kind == "gen3_story" else None
+                    if safe_result is not None:
+                        unlocked = bool(safe_result)
+                    else:
+                        # Direct memory check (achievements with memory_address)
+                        if check.address is not None and check.address in read_cache:
+                            value = read_cache[check.address]
+                        else:
+                            value = self._read_achievement_byte(achievement.memory_address)
+                        if value is not None and check.predicate(value):
+                            unlocked = True
+                if fingerprint is not None:
+                    self._achievement_input_state[achievement.id] = (fingerprint, unlocked)
             
-            if baseline_mode:
-                if unlocked:
-                    self._startup_lockout_ids.add(achievement.id)
-                continue
-
-            if achievement.id in self._startup_lockout_ids:
-                if not unlocked:
-                    self._startup_lockout_ids.discard(achievement.id)
-                continue
+                if baseline_mode:
+                    if unlocked:
+                        self._startup_lockout_ids.add(achievement.id)
+                    continue
 
-            if unlocked:
-                candidates_this_poll += 1
-                if candidates_this_poll > max_unlocks_per_poll:
-                    self._record_anomaly("unlock_spike_ignored", game=self.game_name, candidates=candidates_this_poll, threshold=max_unlocks_per_poll)
-                    self._log_warning_throttled("unlock_spike_ignored", cooldown_s=30.0, throttle_key=f"unlock_spike_ignored:{self.game_name}", game=self.game_name, candidates=candidates_this_poll, threshold=max_unlocks_per_poll)
-                    self._unlock_streaks[achievement.id] = 0
+                if achievement.id in self._startup_lockout_ids:
+                    if not unlocked:
+                        self._startup_lockout_ids.discard(achievement.id)
                     continue
 
-                if achievement.category in {"gym", "elite_four", "champion", "legendary"}:
-                    major_candidates_this_poll += 1
-                    if major_candidates_this_poll > max_major_unlocks_per_poll:
-                        self._record_anomaly("major_unlock_spike_ignored", game=self.game_name, category=achievement.category, count=major_candidates_this_poll, threshold=max_major_unlocks_per_poll)
-                        self._log_warning_throttled("major_unlock_spike_ignored", cooldown_s=30.0, throttle_key=f"major_unlock_spike_ignored:{self.game_name}:{achievement.category}", game=self.game_name, category=achievement.category, count=major_candidates_this_poll, threshold=max_major_unlocks_per_poll)
+                if unlocked:
+                    candidates_this_poll += 1
+                    if candidates_this_poll > max_unlocks_per_poll:
+                        self._record_anomaly("unlock_spike_ignored", game=self.game_name, candidates=candidates_this_poll, threshold=max_unlocks_per_poll)
+                        self._log_warning_throttled("unlock_spike_ignored", cooldown_s=30.0, throttle_key=f"unlock_spike_ignored:{self.game_name}", game=self.game_name, candidates=candidates_this_poll, threshold=max_unlocks_per_poll)
                         self._unlock_streaks[achievement.id] = 0
                         continue
 
-                if achievement.category == "legendary":
-                    legendary_candidates_this_poll += 1
-                    max_legendary = profile.get("max_legendary_unlocks_per_poll", 1)
-                    if legendary_candidates_this_poll > max_legendary:
-                        self._record_anomaly("legendary_unlock_spike_ignored", game=self.game_name, count=legendary_candidates_this_poll, threshold=max_legendary)
-                        self._log_warning_throttled("legendary_unlock_spike_ignored", cooldown_s=30.0, throttle_key=f"legendary_unlock_spike_ignored:{self.game_name}", game=self.game_name, count=legendary_candidates_this_poll, threshold=max_legendary)
-                        self._unlock_streaks[achievement.id] = 0
-                        continue
+                    if achievement.category in {"gym", "elite_four", "champion", "legendary"}:
+                        major_candidates_this_poll += 1
+                        if major_candidates_this_poll > max_major_unlocks_per_poll:
+                            self._record_anomaly("major_unlock_spike_ignored", game=self.game_name, category=achievement.category, count=major_candidates_this_poll, threshold=max_major_unlocks_per_poll)
+                            self._log_warning_throttled("major_unlock_spike_ignored", cooldown_s=30.0, throttle_key=f"major_unlock_spike_ignored:{self.game_name}:{achievement.category}", game=self.game_name, category=achievement.category, count=major_candidates_this_poll, threshold=max_major_unlocks_per_poll)
+                            self._unlock_streaks[achievement.id] = 0
+                            continue
 
-                self._unlock_streaks[achievement.id] = self._unlock_streaks.get(achievement.id, 0) + 1
-                required_confirmations = self._required_unlock_confirmations(achievement, profile, startup_window=in_startup_window)
-                # Require configurable consecutive positive polls to avoid transient memory-read false positives.
-                if self._unlock_streaks[achievement.id] >= required_confirmations:
-                    achievement.unlocked = True
-                    achievement.unlocked_at = datetime.now().isoformat()
-                    newly_unlocked.append(achievement)
-                    self._unlock_queue.put(achievement)
-                    self.post_unlock_to_platform(achievement)
-            else:
-                self._unlock_streaks[achievement.id] = 0
+                    if achievement.category == "legendary":
+                        legendary_candidates_this_poll += 1
+                        max_legendary = profile.get("max_legendary_unlocks_per_poll", 1)
+                        if legendary_candidates_this_poll > max_legendary:
+                            self._record_anomaly("legendary_unlock_spike_ignored", game=self.game_name, count=legendary_candidates_this_poll, threshold=max_legendary)
+                            self._log_warning_throttled("legendary_unlock_spike_ignored", cooldown_s=30.0, throttle_key=f"legendary_unlock_spike_ignored:{self.game_name}", game=self.game_name, count=legendary_candidates_this_poll, threshold=max_legendary)
+                            self._unlock_streaks[achievement.id] = 0
+                            continue
+
+                    self._unlock_streaks[achievement.id] = self._unlock_streaks.get(achievement.id, 0) + 1
+                    required_confirmations = self._required_unlock_confirmations(achievement, profile, startup_window=in_startup_window)
+                    # Require configurable consecutive positive polls to avoid transient memory-read false positives.
+                    if self._unlock_streaks[achievement.id] >= required_confirmations:
+                        achievement.unlocked = True
+                        achievement.unlocked_at = datetime.now().isoformat()
+                        newly_unlocked.append(achievement)
+                        self._unlock_queue.put(achievement)
+                        self.post_unlock_to_platform(achievement)
+                else:
+                    self._unlock_streaks[achievement.id] = 0
+        finally:
+            self._achievement_read_cache = {}
+            self._derived_poll_memo = None
+            end_checker_poll = getattr(self._derived_checker, "end_poll", None)
+            if callable(end_checker_poll):
+                end_checker_poll()
         
         if baseline_mode:
             self._startup_baseline_captured = True
@@ -16632,7 +19607,7 @@ class AchievementTracker:
                 return caught_count >= max_pokemon
         # Gen 3 gym achievements rely on save flags for stable progression checks.
         if achievement.category == "gym" and self._current_generation() == 3:
-            badge_count = self._read_gen3_gym_progress_count()
+            badge_count = self._derived_memo("gen3_gym_progress", self._read_gen3_gym_progress_count)
             if badge_count is not None:
                 if ach_id.endswith("_gym_all"):
                     return badge_count >= 8
@@ -16645,7 +19620,7 @@ class AchievementTracker:
 
         # All gyms
         if ach_id.endswith("_gym_all"):
-            return self._derived_checker.check_all_badges()
+            return self._derived_memo("all_badges", self._derived_checker.check_all_badges)
         
         # Elite Four members
         if "elite_four" in ach_id and not ach_id.endswith("_all"):
@@ -16653,12 +19628,12 @@ class AchievementTracker:
             for member in ["lorelei", "bruno", "agatha", "lance", "will", "koga", "karen", 
                           "sidney", "phoebe", "glacia", "drake"]:
                 if member in ach_id:
-                    return self._derived_checker.check_elite_four_member(member)
+                    return self._derived_memo(f"elite_four:{member}", lambda: self._derived_checker.check_elite_four_member(member))
             return False
         
         # All Elite Four
         if ach_id.endswith("_elite_four_all"):
-            return self._derived_checker.check_all_elite_four()
+            return self._derived_memo("all_elite_four", self._derived_checker.check_all_elite_four)
         
         # Legendary achievements derived from current Pokedex set.
         if "legendary" in ach_id:
@@ -16751,13 +19726,13 @@ class AchievementTracker:
             }
             for hm_key, hm_name in hm_map.items():
                 if f"_story_hm_{hm_key}" in ach_id:
-                    return self._derived_checker.check_has_hm(hm_name)
+                    return self._derived_memo(f"hm:{hm_name}", lambda: self._derived_checker.check_has_hm(hm_name))
         
         # Pokemon Master
         if ach_id.endswith("_pokemon_master"):
-            if not self._derived_checker.check_all_badges():
+            if not self._derived_memo("all_badges", self._derived_checker.check_all_badges):
                 return False
-            if not self._derived_checker.check_champion_defeated():
+            if not self._derived_memo("champion_defeated", self._derived_checker.check_champion_defeated):
                 return False
             caught_count = len(self._read_current_pokedex_caught())
             return caught_count >= self._get_pokedex_completion_target()
@@ -17278,8 +20253,7 @@ class AchievementTracker:
             self._collection_baseline_candidate_streak = 0
 
         # Find new catches.
-        new_catches = [p for p in effective_pokedex if p not in self._last_pokedex]
-        lost_catches = [p for p in self._last_pokedex if p not in effective_pokedex]
+        new_catches, lost_catches = diff_flag_ids(self._last_pokedex, effective_pokedex)
 
         # Guard against bad memory reads causing impossible bulk catch spikes.
         if len(new_catches) > profile["max_new_catches_per_poll"]:
@@ -17573,46 +20547,7 @@ class AchievementTracker:
     
     def evaluate_condition(self, value: int, condition: str) -> bool:
         """Evaluate a memory condition"""
-        condition = condition.strip()
-        
-        if condition.startswith(">="):
-            try:
-                return value >= int(condition[2:].strip())
-            except ValueError:
-                pass
-        elif condition.startswith("<="):
-            try:
-                return value <= int(condition[2:].strip())
-            except ValueError:
-                pass
-        elif condition.startswith(">"):
-            try:
-                return value > int(condition[1:].strip())
-            except ValueError:
-                pass
-        elif condition.startswith("<"):
-            try:
-                return value < int(condition[1:].strip())
-            except ValueError:
-                pass
-        elif condition.startswith("=="):
-            try:
-                return value == int(condition[2:].strip())
-            except ValueError:
-                pass
-        elif condition.startswith("!="):
-            try:
-                return value != int(condition[2:].strip())
-            except ValueError:
-                pass
-        elif condition.startswith("&"):
-            try:
-                target = int(condition[1:].strip(), 16) if "x" in condition else int(condition[1:].strip())
-                return (value & target) == target
-            except ValueError:
-                pass
-        
-        return False
+        return bool(compile_memory_condition(condition)(value))
     
     def get_progress(self) -> Dict:
         """Get current progress stats"""
@@ -17698,6 +20633,19 @@ class AchievementTracker:
                         last_pokedex=len(self._last_pokedex),
                         last_party=len(self._last_party),
                     )
+                    get_io_stats = getattr(self.retroarch, "get_io_stats", None)
+                    if callable(get_io_stats):
+                        log_event(logging.INFO, "retroarch_io_stats", game=self.game_name, poll=self._poll_heartbeat_count, stats=get_io_stats())
+                    get_subscription_stats = getattr(self.retroarch, "get_subscription_stats", None)
+                    if callable(get_subscription_stats):
+                        log_event(logging.INFO, "retroarch_subscription_stats", game=self.game_name, poll=self._poll_heartbeat_count, stats=get_subscription_stats())
+                    get_chunk_stats = getattr(self.retroarch, "get_chunk_stats", None)
+                    if callable(get_chunk_stats):
+                        log_event(logging.INFO, "retroarch_chunk_stats", game=self.game_name, poll=self._poll_heartbeat_count, stats=get_chunk_stats())
+                    log_event(logging.INFO, "achievement_eval_stats", game=self.game_name, poll=self._poll_heartbeat_count, stats=self.get_incremental_eval_stats())
+                    if self._current_generation() == 3:
+                        log_event(logging.INFO, "gen3_saveblock_pointer_stats", game=self.game_name, poll=self._poll_heartbeat_count, stats=self.pokemon_reader.get_saveblock_pointer_stats())
+                    log_event(logging.INFO, "party_read_stats", game=self.game_name, poll=self._poll_heartbeat_count, stats=self.pokemon_reader.get_party_read_stats())
                     log_event(
                         logging.INFO,
                         "poll_stage_start",
@@ -17707,10 +20655,13 @@ class AchievementTracker:
                     )
 
                 self._poll_memory_validation_if_deferred()
+                # Serve this cycle's duplicate reads from one coherent RAM snapshot.
+                self._begin_poll_snapshot()
 
                 ach_started = time.perf_counter()
                 try:
-                    self.check_achievements()
+                    with _retroarch_io_priority(self.retroarch, RetroArchClient.IO_PRIORITY_ACHIEVEMENTS):
+                        self.check_achievements()
                 except Exception as exc:
                     self._record_anomaly(
                         "poll_loop_exception",
@@ -17755,7 +20706,8 @@ class AchievementTracker:
 
                 collection_started = time.perf_counter()
                 try:
-                    self.check_collection()
+                    with _retroarch_io_priority(self.retroarch, RetroArchClient.IO_PRIORITY_COLLECTION):
+                        self.check_collection()
                 except Exception as exc:
                     self._record_anomaly(
                         "poll_loop_exception",
@@ -17788,6 +20740,7 @@ class AchievementTracker:
                                 stage="collection",
                                 duration_ms=collection_ms,
                             )
+                    self._end_poll_snapshot(trace=should_trace_poll)
             else:
                 self._poll_disconnected_streak += 1
                 if self._poll_disconnected_streak == 1:
@@ -17868,6 +20821,13 @@ class PokeAchieveGUI:
             host=self.config.get("retroarch_host", "127.0.0.1"),
             port=int(self.config.get("retroarch_port", 55355))
         )
+        trace_path = str(self.config.get("retroarch_trace_path") or "").strip()
+        if trace_path:
+            # Opt-in RAM trace for offline replay (scripts/replay_ram_trace.py).
+            try:
+                self.retroarch.start_recording(trace_path)
+            except OSError as exc:
+                log_event(logging.WARNING, "retroarch_trace_recording_failed", path=trace_path, error=str(exc))
         self.api = None
         if self.config.get("api_key"):
             self.api = PokeAchieveAPI(
@@ -17879,6 +20839,7 @@ class PokeAchieveGUI:
             config=self.config,
             species_lookup=dict(PokemonMemoryReader.POKEMON_NAMES),
         )
+        self._video_encounter_worker: Optional[VideoEncounterWorker] = None
         self._video_reader_last_reason = ""
         self._video_reader_last_log_at = 0.0
         self._video_waiting_reason_last_log_at: Dict[str, float] = {}
@@ -17954,9 +20915,12 @@ class PokeAchieveGUI:
         ]
         self._hunt_rod_options: List[str] = ["Any Rod", "Old Rod", "Good Rod", "Super Rod"]
         self._hunt_game_options = self._build_hunt_game_options()
-        self._hunt_encounter_catalog: Dict[str, Dict[str, Dict[str, Any]]] = self._build_hunt_encounter_catalog()
-        self._hunt_route_options: Dict[str, List[str]] = self._build_default_hunt_route_options()
-        self._hunt_fishing_options: Dict[str, List[str]] = self._build_default_hunt_fishing_options()
+        # Per-game hunt pools are normalized on first use (_hunt_catalog_for_game).
+        self._hunt_encounter_catalog: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._hunt_soft_reset_metadata: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None
+        # Sorted route/fishing dropdown values per game, filled by _get_hunt_route_values.
+        self._hunt_route_options: Dict[str, List[str]] = {}
+        self._hunt_fishing_options: Dict[str, List[str]] = {}
         _saved_hunt_game = str(self.config.get("hunt_last_game", "") or "").strip()
         _initial_hunt_game = (
             _saved_hunt_game
@@ -18273,6 +21237,9 @@ class PokeAchieveGUI:
             "video_duplicate_suppressed_log_cooldown_sec": 90.0,
             "video_duplicate_suppressed_hold_sec": 0.25,
             "video_fast_poll_ms": 20,
+            "video_numpy_pixel_engine": True,
+            "video_sprite_feature_cache_enabled": True,
+            "video_worker_enabled": True,
             "video_gen3_avatar_flags_unresolved_log_cooldown_sec": 60.0,
             "video_hunt_counter_target_only": True,
             "video_species_lock_strict_blocking": False,
@@ -19315,6 +22282,8 @@ class PokeAchieveGUI:
 
     def _start_guided_training(self, auto: bool = False):
         self._guided_training_enabled = True
+        # Guided training reads frames and crops from the reader on the Tk thread; let an in-flight worker read finish.
+        self._stop_video_encounter_worker()
         self.config["video_guided_training_enabled"] = True
         self._save_config()
         self._refresh_guided_training_controls()
@@ -21818,146 +24787,162 @@ class PokeAchieveGUI:
 
         return options
 
-    def _build_hunt_encounter_catalog(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        """Load generated per-game wild/fishing pools and merge soft-reset metadata."""
-        catalog: Dict[str, Dict[str, Dict[str, Any]]] = {}
-
+    def _hunt_catalog_for_game(self, game_name: str) -> Dict[str, Dict[str, Any]]:
+        """Per-game wild/fishing/soft-reset pools, built on first use for that game."""
+        game_data = self._hunt_encounter_catalog.get(game_name)
+        if game_data is None:
+            if game_name not in self._hunt_game_options:
+                return {}
+            game_data = self._build_hunt_encounter_catalog_entry(game_name)
+            self._hunt_encounter_catalog[game_name] = game_data
+        return game_data
+
+    def _load_hunt_catalog_block(self, game_name: str) -> Dict[str, Any]:
+        """Raw generated block for one game: its bundle section when current, else the full JSON file."""
+        bundle = _get_reference_bundle()
+        games = bundle.section("hunt") if bundle is not None else None
+        if isinstance(games, list):
+            block = bundle.section(f"hunt/{game_name}", cache=False) if game_name in games else {}
+            if isinstance(block, dict):
+                return block
+
+        # Only this game's block is kept; the rest of the parsed file is dropped.
         catalog_path = self.script_dir / "hunt_encounter_catalog.json"
-        if catalog_path.exists():
-            try:
-                with open(catalog_path, "r", encoding="utf-8") as handle:
-                    loaded = json.load(handle)
-                if isinstance(loaded, dict):
-                    catalog = loaded
-            except (OSError, json.JSONDecodeError, ValueError):
-                catalog = {}
-
-        soft_reset_metadata = self._build_hunt_soft_reset_metadata()
+        if not catalog_path.exists():
+            return {}
+        try:
+            with open(catalog_path, "r", encoding="utf-8") as handle:
+                loaded = json.load(handle)
+        except (OSError, json.JSONDecodeError, ValueError):
+            return {}
+        block = loaded.get(game_name) if isinstance(loaded, dict) else None
+        return block if isinstance(block, dict) else {}
+
+    def _build_hunt_encounter_catalog_entry(self, game_name: str) -> Dict[str, Dict[str, Any]]:
+        """Normalize one game's generated wild/fishing pools and merge soft-reset metadata."""
+        if self._hunt_soft_reset_metadata is None:
+            self._hunt_soft_reset_metadata = self._build_hunt_soft_reset_metadata()
+        soft_reset_metadata = self._hunt_soft_reset_metadata
         default_soft_reset = self._default_hunt_soft_reset_categories()
 
-        for game_name in self._hunt_game_options:
-            game_block = catalog.get(game_name)
-            if not isinstance(game_block, dict):
-                game_block = {}
-
-            random_entries = game_block.get("random") if isinstance(game_block.get("random"), dict) else {}
-            fishing_entries = game_block.get("fishing") if isinstance(game_block.get("fishing"), dict) else {}
-            fishing_rod_entries = game_block.get("fishing_rods") if isinstance(game_block.get("fishing_rods"), dict) else {}
-
-            normalized_random: Dict[str, List[int]] = {}
-            for key, value in random_entries.items():
-                if not isinstance(key, str):
-                    continue
-                ids = value if isinstance(value, list) else []
-                normalized_random[key] = self._normalize_hunt_species_ids_for_game(game_name, ids)
+        game_block = self._load_hunt_catalog_block(game_name)
 
-            normalized_fishing: Dict[str, List[int]] = {}
-            normalized_fishing_rods: Dict[str, Dict[str, List[int]]] = {}
+        random_entries = game_block.get("random") if isinstance(game_block.get("random"), dict) else {}
+        fishing_entries = game_block.get("fishing") if isinstance(game_block.get("fishing"), dict) else {}
+        fishing_rod_entries = game_block.get("fishing_rods") if isinstance(game_block.get("fishing_rods"), dict) else {}
 
-            for key, value in fishing_entries.items():
-                if not isinstance(key, str):
-                    continue
-                if isinstance(value, dict):
-                    per_rod: Dict[str, List[int]] = {}
-                    merged_ids: Set[int] = set()
-                    for raw_rod, raw_ids in value.items():
-                        rod_key = str(raw_rod or "").strip().title()
-                        if not rod_key:
-                            continue
-                        if rod_key == "Any":
-                            rod_key = self._hunt_rod_options[0]
-                        ids = raw_ids if isinstance(raw_ids, list) else []
-                        normalized_ids = self._normalize_hunt_species_ids_for_game(game_name, ids)
-                        if not normalized_ids:
-                            continue
-                        per_rod[rod_key] = normalized_ids
-                        merged_ids.update(normalized_ids)
-                    merged_list = sorted(merged_ids)
-                    normalized_fishing[key] = merged_list
-                    if per_rod:
-                        any_ids = per_rod.get(self._hunt_rod_options[0], merged_list)
-                        normalized_fishing_rods[key] = {
-                            rod_name: list(per_rod.get(rod_name, any_ids)) for rod_name in self._hunt_rod_options
-                        }
-                    continue
+        normalized_random: Dict[str, List[int]] = {}
+        for key, value in random_entries.items():
+            if not isinstance(key, str):
+                continue
+            ids = value if isinstance(value, list) else []
+            normalized_random[key] = self._normalize_hunt_species_ids_for_game(game_name, ids)
 
-                ids = value if isinstance(value, list) else []
-                normalized_ids = self._normalize_hunt_species_ids_for_game(game_name, ids)
-                normalized_fishing[key] = normalized_ids
-                if normalized_ids:
-                    normalized_fishing_rods[key] = {
-                        rod_name: list(normalized_ids) for rod_name in self._hunt_rod_options
-                    }
+        normalized_fishing: Dict[str, List[int]] = {}
+        normalized_fishing_rods: Dict[str, Dict[str, List[int]]] = {}
 
-            for key, value in fishing_rod_entries.items():
-                if not isinstance(key, str) or not isinstance(value, dict):
-                    continue
+        for key, value in fishing_entries.items():
+            if not isinstance(key, str):
+                continue
+            if isinstance(value, dict):
                 per_rod: Dict[str, List[int]] = {}
                 merged_ids: Set[int] = set()
                 for raw_rod, raw_ids in value.items():
                     rod_key = str(raw_rod or "").strip().title()
-                    if rod_key == "Any":
-                        rod_key = self._hunt_rod_options[0]
                     if not rod_key:
                         continue
+                    if rod_key == "Any":
+                        rod_key = self._hunt_rod_options[0]
                     ids = raw_ids if isinstance(raw_ids, list) else []
                     normalized_ids = self._normalize_hunt_species_ids_for_game(game_name, ids)
                     if not normalized_ids:
                         continue
                     per_rod[rod_key] = normalized_ids
                     merged_ids.update(normalized_ids)
-                if not merged_ids:
-                    continue
                 merged_list = sorted(merged_ids)
                 normalized_fishing[key] = merged_list
-                any_ids = per_rod.get(self._hunt_rod_options[0], merged_list)
+                if per_rod:
+                    any_ids = per_rod.get(self._hunt_rod_options[0], merged_list)
+                    normalized_fishing_rods[key] = {
+                        rod_name: list(per_rod.get(rod_name, any_ids)) for rod_name in self._hunt_rod_options
+                    }
+                continue
+
+            ids = value if isinstance(value, list) else []
+            normalized_ids = self._normalize_hunt_species_ids_for_game(game_name, ids)
+            normalized_fishing[key] = normalized_ids
+            if normalized_ids:
                 normalized_fishing_rods[key] = {
-                    rod_name: list(per_rod.get(rod_name, any_ids)) for rod_name in self._hunt_rod_options
+                    rod_name: list(normalized_ids) for rod_name in self._hunt_rod_options
                 }
 
-            all_random_ids: Set[int] = set()
-            for key, ids in normalized_random.items():
-                if key != "Any Route / Area":
-                    all_random_ids.update(ids)
-            if "Any Route / Area" in normalized_random and normalized_random["Any Route / Area"]:
-                all_random_ids.update(normalized_random["Any Route / Area"])
-            normalized_random["Any Route / Area"] = sorted(all_random_ids)
-
-            all_fishing_ids: Set[int] = set()
-            for key, ids in normalized_fishing.items():
-                if key != "Any Fishing Spot":
-                    all_fishing_ids.update(ids)
-            if "Any Fishing Spot" in normalized_fishing and normalized_fishing["Any Fishing Spot"]:
-                all_fishing_ids.update(normalized_fishing["Any Fishing Spot"])
-            normalized_fishing["Any Fishing Spot"] = sorted(all_fishing_ids)
-
-            all_rod_map: Dict[str, Set[int]] = {rod: set() for rod in self._hunt_rod_options}
-            for location_name, rod_map in normalized_fishing_rods.items():
-                if location_name == "Any Fishing Spot" or not isinstance(rod_map, dict):
+        for key, value in fishing_rod_entries.items():
+            if not isinstance(key, str) or not isinstance(value, dict):
+                continue
+            per_rod: Dict[str, List[int]] = {}
+            merged_ids: Set[int] = set()
+            for raw_rod, raw_ids in value.items():
+                rod_key = str(raw_rod or "").strip().title()
+                if rod_key == "Any":
+                    rod_key = self._hunt_rod_options[0]
+                if not rod_key:
                     continue
-                for rod in self._hunt_rod_options:
-                    all_rod_map[rod].update(rod_map.get(rod, []))
-            if not any(all_rod_map.values()):
-                fallback_ids = normalized_fishing.get("Any Fishing Spot", [])
-                normalized_fishing_rods["Any Fishing Spot"] = {
-                    rod: list(fallback_ids) for rod in self._hunt_rod_options
-                }
-            else:
-                normalized_fishing_rods["Any Fishing Spot"] = {
-                    rod: sorted(ids) for rod, ids in all_rod_map.items()
-                }
+                ids = raw_ids if isinstance(raw_ids, list) else []
+                normalized_ids = self._normalize_hunt_species_ids_for_game(game_name, ids)
+                if not normalized_ids:
+                    continue
+                per_rod[rod_key] = normalized_ids
+                merged_ids.update(normalized_ids)
+            if not merged_ids:
+                continue
+            merged_list = sorted(merged_ids)
+            normalized_fishing[key] = merged_list
+            any_ids = per_rod.get(self._hunt_rod_options[0], merged_list)
+            normalized_fishing_rods[key] = {
+                rod_name: list(per_rod.get(rod_name, any_ids)) for rod_name in self._hunt_rod_options
+            }
 
-            soft_reset_for_game = soft_reset_metadata.get(game_name)
-            if not isinstance(soft_reset_for_game, dict):
-                soft_reset_for_game = dict(default_soft_reset)
+        all_random_ids: Set[int] = set()
+        for key, ids in normalized_random.items():
+            if key != "Any Route / Area":
+                all_random_ids.update(ids)
+        if "Any Route / Area" in normalized_random and normalized_random["Any Route / Area"]:
+            all_random_ids.update(normalized_random["Any Route / Area"])
+        normalized_random["Any Route / Area"] = sorted(all_random_ids)
+
+        all_fishing_ids: Set[int] = set()
+        for key, ids in normalized_fishing.items():
+            if key != "Any Fishing Spot":
+                all_fishing_ids.update(ids)
+        if "Any Fishing Spot" in normalized_fishing and normalized_fishing["Any Fishing Spot"]:
+            all_fishing_ids.update(normalized_fishing["Any Fishing Spot"])
+        normalized_fishing["Any Fishing Spot"] = sorted(all_fishing_ids)
+
+        all_rod_map: Dict[str, Set[int]] = {rod: set() for rod in self._hunt_rod_options}
+        for location_name, rod_map in normalized_fishing_rods.items():
+            if location_name == "Any Fishing Spot" or not isinstance(rod_map, dict):
+                continue
+            for rod in self._hunt_rod_options:
+                all_rod_map[rod].update(rod_map.get(rod, []))
+        if not any(all_rod_map.values()):
+            fallback_ids = normalized_fishing.get("Any Fishing Spot", [])
+            normalized_fishing_rods["Any Fishing Spot"] = {
+                rod: list(fallback_ids) for rod in self._hunt_rod_options
+            }
+        else:
+            normalized_fishing_rods["Any Fishing Spot"] = {
+                rod: sorted(ids) for rod, ids in all_rod_map.items()
+            }
 
-            game_block["random"] = normalized_random
-            game_block["fishing"] = normalized_fishing
-            game_block["fishing_rods"] = normalized_fishing_rods
-            game_block["soft_reset"] = soft_reset_for_game
-            catalog[game_name] = game_block
+        soft_reset_for_game = soft_reset_metadata.get(game_name)
+        if not isinstance(soft_reset_for_game, dict):
+            soft_reset_for_game = dict(default_soft_reset)
 
-        return catalog
+        game_block["random"] = normalized_random
+        game_block["fishing"] = normalized_fishing
+        game_block["fishing_rods"] = normalized_fishing_rods
+        game_block["soft_reset"] = soft_reset_for_game
+        return game_block
 
     def _default_hunt_soft_reset_categories(self) -> Dict[str, List[Dict[str, Any]]]:
         return {
@@ -22256,7 +25241,7 @@ class PokeAchieveGUI:
 
     def _get_hunt_soft_reset_entries_for_selection(self, game_name: str, category_name: Optional[str] = None) -> List[Dict[str, Any]]:
         category = (category_name or self.hunt_route_var.get()).strip()
-        game_data = self._hunt_encounter_catalog.get(game_name, {})
+        game_data = self._hunt_catalog_for_game(game_name)
         soft_reset = game_data.get("soft_reset") if isinstance(game_data.get("soft_reset"), dict) else {}
 
         raw_entries: List[Any] = []
@@ -22314,35 +25299,29 @@ class PokeAchieveGUI:
             return (0, int(route_match.group(1)), variant != "surf", variant)
         return (1, 10_000, False, text.lower())
 
-    def _build_default_hunt_route_options(self) -> Dict[str, List[str]]:
-        route_options: Dict[str, List[str]] = {}
-        for game_name in self._hunt_game_options:
-            entries = self._hunt_encounter_catalog.get(game_name, {}).get("random", {})
+    def _hunt_location_options(self, game_name: str, kind: str, any_label: str, cache: Dict[str, List[str]]) -> List[str]:
+        """Sorted location keys of one game's ``kind`` pool, "Any ..." first; built on first use per game."""
+        values = cache.get(game_name)
+        if values is None:
+            entries = self._hunt_catalog_for_game(game_name).get(kind, {})
             values = sorted(list(entries.keys()), key=self._hunt_location_sort_key)
-            if "Any Route / Area" in values:
-                values = ["Any Route / Area"] + [v for v in values if v != "Any Route / Area"]
-            route_options[game_name] = values or ["Any Route / Area"]
-        return route_options
+            if any_label in values:
+                values = [any_label] + [v for v in values if v != any_label]
+            values = values or [any_label]
+            if game_name in self._hunt_game_options:
+                cache[game_name] = values
+        return list(values)
 
-    def _build_default_hunt_fishing_options(self) -> Dict[str, List[str]]:
-        fishing_options: Dict[str, List[str]] = {}
-        for game_name in self._hunt_game_options:
-            entries = self._hunt_encounter_catalog.get(game_name, {}).get("fishing", {})
-            values = sorted(list(entries.keys()), key=self._hunt_location_sort_key)
-            if "Any Fishing Spot" in values:
-                values = ["Any Fishing Spot"] + [v for v in values if v != "Any Fishing Spot"]
-            fishing_options[game_name] = values or ["Any Fishing Spot"]
-        return fishing_options
     def _get_hunt_route_values(self, game_name: str, mode: str) -> List[str]:
         if mode == "Soft Reset Hunt":
-            entries = self._hunt_encounter_catalog.get(game_name, {}).get("soft_reset", {})
+            entries = self._hunt_catalog_for_game(game_name).get("soft_reset", {})
             values = list(entries.keys())
             if "Any Soft Reset" in values:
                 values = ["Any Soft Reset"] + [v for v in values if v != "Any Soft Reset"]
         elif mode == "Fishing Encounter Hunt":
-            values = list(self._hunt_fishing_options.get(game_name, ["Any Fishing Spot"]))
+            values = self._hunt_location_options(game_name, "fishing", "Any Fishing Spot", self._hunt_fishing_options)
         elif mode == "Wild Encounter Hunt":
-            values = list(self._hunt_route_options.get(game_name, ["Any Route / Area"]))
+            values = self._hunt_location_options(game_name, "random", "Any Route / Area", self._hunt_route_options)
         else:
             values = []
 
@@ -22364,7 +25343,7 @@ class PokeAchieveGUI:
             return [self._hunt_rod_options[0]]
 
         rod_values: Set[str] = set(self._hunt_rod_options)
-        game_data = self._hunt_encounter_catalog.get(game_name, {}) if isinstance(self._hunt_encounter_catalog, dict) else {}
+        game_data = self._hunt_catalog_for_game(game_name)
         fishing_rods = game_data.get("fishing_rods") if isinstance(game_data.get("fishing_rods"), dict) else {}
         route_name = str(self.hunt_route_var.get() or "").strip()
 
@@ -22417,7 +25396,7 @@ class PokeAchieveGUI:
         mode_value = (mode or self.hunt_mode_var.get()).strip()
         route_value = (route_name or self.hunt_route_var.get()).strip()
         rod_value = (rod_name or self.hunt_rod_var.get()).strip() or self._hunt_rod_options[0]
-        game_data = self._hunt_encounter_catalog.get(game_name, {})
+        game_data = self._hunt_catalog_for_game(game_name)
 
         if mode_value == "Soft Reset Hunt":
             entries = self._get_hunt_soft_reset_entries_for_selection(game_name, route_value)
@@ -23096,7 +26075,7 @@ class PokeAchieveGUI:
         if pid <= 0:
             return []
 
-        game_data = self._hunt_encounter_catalog.get(game_name, {}) if isinstance(self._hunt_encounter_catalog, dict) else {}
+        game_data = self._hunt_catalog_for_game(game_name)
         route_values = set(self._get_hunt_route_values(game_name, mode))
         candidates: List[str] = []
 
@@ -25561,7 +28540,59 @@ class PokeAchieveGUI:
 
     def _should_use_video_encounter_reader(self, game_name: str, mode: str) -> bool:
         return self._video_encounter_gate_reason(game_name, mode) == "ok"
+
+    def _video_worker_enabled(self) -> bool:
+        if self._guided_training_enabled:
+            # Guided training reads frames and sprite crops from the reader on the Tk thread.
+            return False
+        return bool(_coerce_bool(self.config.get("video_worker_enabled", True), True))
+
+    def _ensure_video_encounter_worker(self) -> VideoEncounterWorker:
+        worker = self._video_encounter_worker
+        if worker is None:
+            worker = VideoEncounterWorker(self._run_video_hunt_request)
+            self._video_encounter_worker = worker
+        worker.start()
+        return worker
+
+    def _stop_video_encounter_worker(self) -> None:
+        worker = self._video_encounter_worker
+        if worker is None:
+            return
+        self._video_encounter_worker = None
+        worker.stop()
+        log_event(logging.INFO, "video_worker_stopped", **worker.get_stats())
+
+    def _poll_video_hunt_encounter(
+        self, game_name: str, mode: str
+    ) -> Tuple[bool, Optional[Dict[str, object]], Optional[Dict[str, object]]]:
+        """Hand the latest frame request to the video worker and apply at most one finished read.
+
+        Returns ``(ready, encounter, meta)``. ``ready`` is False while the worker has
+        nothing new, in which case the caller leaves hunt state untouched this tick.
+        """
+        worker = self._ensure_video_encounter_worker()
+        request = self._prepare_video_hunt_request(game_name, mode)
+        if request is not None:
+            worker.submit(request)
+        result = worker.get_result()
+        if result is None or result.get("error"):
+            return False, None, None
+        if str(result.get("game_name") or "") != str(game_name or "") or str(result.get("mode") or "") != str(mode or ""):
+            # Read was started before the hunt selection changed.
+            return False, None, None
+        encounter = self._finish_video_hunt_encounter(result)
+        meta = result.get("meta")
+        return True, encounter, meta if isinstance(meta, dict) else {}
+
     def _read_video_hunt_encounter(self, game_name: str, mode: str) -> Optional[Dict[str, object]]:
+        request = self._prepare_video_hunt_request(game_name, mode)
+        if request is None:
+            return None
+        return self._finish_video_hunt_encounter(self._run_video_hunt_request(request))
+
+    def _prepare_video_hunt_request(self, game_name: str, mode: str) -> Optional[Dict[str, object]]:
+        """Snapshot config, candidate pool and sprite dirs for one read (Tk thread only)."""
         if not self._should_use_video_encounter_reader(game_name, mode):
             return None
 
@@ -25668,11 +28699,37 @@ class PokeAchieveGUI:
             video_config["video_sprite_library_dir"] = str(self.data_dir / "sprites")
             video_config.pop("video_sprite_library_game_dir", None)
 
-        self.video_encounter_reader.update_config(video_config)
-        if deduped_candidates:
-            self.video_encounter_reader.warm_sprite_reference_cache(game_name, deduped_candidates)
-        encounter = self.video_encounter_reader.read_wild_encounter(game_name)
-        meta = self.video_encounter_reader.get_last_meta() if self.video_encounter_reader else {}
+        return {
+            "game_name": game_name,
+            "mode": mode,
+            "video_config": video_config,
+            "candidates": deduped_candidates,
+        }
+
+    def _run_video_hunt_request(self, request: Dict[str, object]) -> Dict[str, object]:
+        """Capture and analyse one frame; safe to call from the video worker thread."""
+        reader = self.video_encounter_reader
+        game_name = str(request.get("game_name") or "")
+        candidates = request.get("candidates") or []
+        with reader.pipeline_lock:
+            reader.update_config(request.get("video_config"))
+            if candidates:
+                reader.warm_sprite_reference_cache(game_name, candidates)
+            encounter = reader.read_wild_encounter(game_name)
+            meta = reader.get_last_meta()
+        result = dict(request)
+        result["encounter"] = encounter
+        result["meta"] = meta
+        return result
+
+    def _finish_video_hunt_encounter(self, result: Dict[str, object]) -> Optional[Dict[str, object]]:
+        """Apply one read result to hunt/guided-training state (Tk thread only)."""
+        game_name = str(result.get("game_name") or "")
+        mode = str(result.get("mode") or "")
+        video_config = result.get("video_config") if isinstance(result.get("video_config"), dict) else {}
+        deduped_candidates = list(result.get("candidates") or [])
+        encounter = result.get("encounter")
+        meta = result.get("meta")
         if not isinstance(meta, dict):
             meta = {}
         reason = str(meta.get("reason") or "")
@@ -27489,9 +30546,14 @@ class PokeAchieveGUI:
                 else:
                     hunt_unstable = bool(getattr(self.retroarch, "is_unstable_io", lambda: False)())
                     encounter = None
+                    video_meta: Optional[Dict[str, object]] = None
+                    video_result_ready = True
                     gate_reason = self._video_encounter_gate_reason(game_for_hunt, mode)
                     use_video_reader = gate_reason == "ok"
-                    if use_video_reader:
+                    if use_video_reader and self._video_worker_enabled():
+                        video_result_ready, encounter, video_meta = self._poll_video_hunt_encounter(game_for_hunt, mode)
+                    elif use_video_reader:
+                        self._stop_video_encounter_worker()
                         encounter = self._read_video_hunt_encounter(game_for_hunt, mode)
                     else:
                         if mode in {"Wild Encounter Hunt", "Fishing Encounter Hunt"}:
@@ -27525,7 +30587,10 @@ class PokeAchieveGUI:
                                 )
                         if not (hunt_unstable and mode in {"Wild Encounter Hunt", "Fishing Encounter Hunt"}):
                             encounter = self.tracker.pokemon_reader.read_wild_encounter(game_for_hunt) if self.tracker and self.tracker.pokemon_reader else None
-                    if mode == "Soft Reset Hunt":
+                    if not video_result_ready:
+                        # The video worker is still analysing the latest frame; nothing new to apply.
+                        pass
+                    elif mode == "Soft Reset Hunt":
                         self._handle_hunt_soft_reset_progress(encounter, game_for_hunt)
                     elif mode in {"Wild Encounter Hunt", "Fishing Encounter Hunt"}:
                         if isinstance(encounter, dict):
@@ -27536,7 +30601,7 @@ class PokeAchieveGUI:
                             keep_enemy_state = False
                             if use_video_reader and self.video_encounter_reader:
                                 try:
-                                    _video_meta = self.video_encounter_reader.get_last_meta()
+                                    _video_meta = dict(video_meta) if isinstance(video_meta, dict) else self.video_encounter_reader.get_last_meta()
                                 except Exception:
                                     _video_meta = {}
                                 _video_reason = str(_video_meta.get("reason") or "")
@@ -28175,12 +31240,14 @@ class PokeAchieveGUI:
         """Stop tracking"""
         self.is_running = False
         self._stop_api_worker()
+        self._stop_video_encounter_worker()
         self.tracker.stop_polling()
         if isinstance(getattr(self, "start_btn", None), ttk.Button):
             self.start_btn.configure(state='normal')
         if isinstance(getattr(self, "stop_btn", None), ttk.Button):
             self.stop_btn.configure(state='disabled')
         self._log("Tracking stopped")
+        self.retroarch.flush_recording()
         self.tracker.save_progress(self.progress_file)
         # Clear game name so it can be re-detected and restarted
         self.tracker.game_name = None
@@ -29681,6 +32748,7 @@ class PokeAchieveGUI:
                 self.tracker._baseline_snapshot_pending = False
                 self.tracker._baseline_snapshot_wait_polls = 0
                 self.tracker._unlock_streaks = {}
+                self.tracker._achievement_input_state = {}
                 self.tracker._achievement_poll_count = 0
                 self.tracker._warmup_logged = False
                 self.tracker._startup_baseline_captured = False
@@ -31117,10 +34185,11 @@ Troubleshooting
                 for idx in range(int(sample_count)):
                     progress_var.set(f"{idx + 1} / {sample_count}")
                     progress.update_idletasks()
-                    payload = self.video_encounter_reader.capture_preview_frame(config_override=test_config)
-                    frame = payload.get("image") if isinstance(payload, dict) else None
-                    if frame is not None and PIL_AVAILABLE:
-                        analysis = self.video_encounter_reader.analyze_frame(frame, analysis_game)
+                    with self.video_encounter_reader.pipeline_lock:
+                        payload = self.video_encounter_reader.capture_preview_frame(config_override=test_config)
+                        frame = payload.get("image") if isinstance(payload, dict) else None
+                        analysis = self.video_encounter_reader.analyze_frame(frame, analysis_game) if frame is not None and PIL_AVAILABLE else None
+                    if isinstance(analysis, dict):
                         sample_scores.append(int(analysis.get("sprite_score") or 0))
                         sample_details.append(float(analysis.get("sprite_detail_ratio") or 0.0))
                         if bool(analysis.get("sprite_present")):
@@ -31292,8 +34361,9 @@ Troubleshooting
             test_config = dict(self.config)
             test_config.update(_collect_video_settings())
 
-            preview_payload = self.video_encounter_reader.capture_preview_frame(config_override=test_config)
-            meta = self.video_encounter_reader.get_last_meta()
+            with self.video_encounter_reader.pipeline_lock:
+                preview_payload = self.video_encounter_reader.capture_preview_frame(config_override=test_config)
+                meta = self.video_encounter_reader.get_last_meta()
             if not isinstance(preview_payload, dict):
                 reason = str(meta.get("reason") or "unknown")
                 detail = str(meta.get("detail") or meta.get("error") or "").strip()
@@ -31354,7 +34424,8 @@ Troubleshooting
                 "sprite_score": 0,
             }
             if frame is not None and PIL_AVAILABLE:
-                analysis = self.video_encounter_reader.analyze_frame(frame, analysis_game)
+                with self.video_encounter_reader.pipeline_lock:
+                    analysis = self.video_encounter_reader.analyze_frame(frame, analysis_game)
 
             species_text = "OCR unavailable"
             if frame is not None and PIL_AVAILABLE:
@@ -31514,7 +34585,8 @@ Troubleshooting
             self.retroarch.port = int(self.config["retroarch_port"])
 
             self.config.update(_collect_video_settings())
-            self.video_encounter_reader.update_config(self.config)
+            with self.video_encounter_reader.pipeline_lock:
+                self.video_encounter_reader.update_config(self.config)
 
             if self.config["api_key"]:
                 self.api = PokeAchieveAPI(self.config["api_url"], self.config["api_key"])
@@ -31528,8 +34600,10 @@ Troubleshooting
 
             self._save_config()
             if bool(self.config.get("video_encounter_enabled", False)):
-                if not self.video_encounter_reader.is_ready():
+                with self.video_encounter_reader.pipeline_lock:
+                    video_ready = self.video_encounter_reader.is_ready()
                     video_meta = self.video_encounter_reader.get_last_meta()
+                if not video_ready:
                     self._log(
                         f"Video encounter mode not ready: {video_meta.get('reason')}",
                         "warning",
@@ -31564,7 +34638,11 @@ Troubleshooting
     
     def run(self):
         """Start the application"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._stop_video_encounter_worker()
+            self.retroarch.stop_recording()
 
 
 def main():